@@ -1 +1 @@
-# App package
+# App package
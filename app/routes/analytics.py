@@ -3,12 +3,17 @@ from datetime import datetime, timedelta
 from typing import Dict, Any
 from collections import Counter
 
-from app.models.schemas import AnalyticsResponse
+from app.models.schemas import AnalyticsResponse, DocumentListItem
 from app.routes.auth import get_current_user
+from app.utils.pagination import sort_spec
+from app.utils.projection import SUMMARY_PROJECTION
 from config.db import get_database
 
 router = APIRouter()
 
+STATS_PROJECTION = {"file_type": 1, "tags": 1, "processing_time": 1, "algorithm_used": 1, "language": 1}
+CHART_PROJECTION = {"created_at": 1, "file_type": 1, "processing_time": 1, "language": 1}
+
 @router.get("/", response_model=AnalyticsResponse)
 async def get_analytics(current_user: dict = Depends(get_current_user)):
     """Get user analytics and statistics"""
@@ -23,8 +28,8 @@ async def get_analytics(current_user: dict = Depends(get_current_user)):
         "summary": {"$exists": True, "$ne": ""}
     })
     
-    # Get all user documents for analysis
-    documents_cursor = db.documents.find({"user_id": user_id})
+    # Get the fields the statistics need from all user documents
+    documents_cursor = db.documents.find({"user_id": user_id}, STATS_PROJECTION)
     documents = []
     async for doc in documents_cursor:
         documents.append(doc)
@@ -42,17 +47,11 @@ async def get_analytics(current_user: dict = Depends(get_current_user)):
         documents_by_type[file_type] = documents_by_type.get(file_type, 0) + 1
     
     # Recent activity (last 10 documents)
-    recent_documents = sorted(
-        documents, 
-        key=lambda x: x.get("created_at", datetime.min), 
-        reverse=True
-    )[:10]
-    
-    # Convert to DocumentPublic format
+    recent_cursor = db.documents.find({"user_id": user_id}, SUMMARY_PROJECTION).sort(sort_spec("created_at", -1)).limit(10)
     recent_activity = []
-    for doc in recent_documents:
+    async for doc in recent_cursor:
         doc["id"] = str(doc["_id"])
-        recent_activity.append(doc)
+        recent_activity.append(DocumentListItem(**doc))
     
     # Top tags
     all_tags = []
@@ -107,7 +106,7 @@ async def get_chart_data(current_user: dict = Depends(get_current_user)):
     documents_cursor = db.documents.find({
         "user_id": user_id,
         "created_at": {"$gte": thirty_days_ago}
-    })
+    }, CHART_PROJECTION)
     
     documents = []
     async for doc in documents_cursor:
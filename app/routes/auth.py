@@ -1,248 +1,248 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from bson import ObjectId
-
-from app.models.schemas import UserCreate, UserPublic, TokenResponse, UserUpdate
-from config.settings import settings
-from config.db import get_database
-
-router = APIRouter()
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-# OAuth2 scheme
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
-
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Create a JWT access token"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-    return encoded_jwt
-
-async def get_user_by_email(email: str):
-    """Get user by email from database"""
-    db = await get_database()
-    user = await db.users.find_one({"email": email})
-    if user:
-        user["id"] = str(user["_id"])
-        return user
-    return None
-
-async def get_user_by_id(user_id: str):
-    """Get user by ID from database"""
-    db = await get_database()
-    try:
-        user = await db.users.find_one({"_id": ObjectId(user_id)})
-        if user:
-            user["id"] = str(user["_id"])
-            return user
-    except:
-        pass
-    return None
-
-async def authenticate_user(email: str, password: str):
-    """Authenticate a user with email and password"""
-    user = await get_user_by_email(email)
-    if not user:
-        return False
-    if not verify_password(password, user["hashed_password"]):
-        return False
-    return user
-
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    """Get current user from JWT token"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = await get_user_by_id(user_id)
-    if user is None:
-        raise credentials_exception
-    return user
-
-@router.post("/register", response_model=TokenResponse)
-async def register(user_data: UserCreate):
-    """Register a new user"""
-    # Check if user already exists
-    existing_user = await get_user_by_email(user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    user_doc = {
-        "email": user_data.email,
-        "full_name": user_data.full_name,
-        "hashed_password": hashed_password,
-        "role": "user",
-        "is_active": True,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    db = await get_database()
-    result = await db.users.insert_one(user_doc)
-    
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": str(result.inserted_id)}, expires_delta=access_token_expires
-    )
-    
-    # Return user data and token
-    user_public = UserPublic(
-        id=str(result.inserted_id),
-        email=user_doc["email"],
-        full_name=user_doc["full_name"],
-        role=user_doc["role"],
-        created_at=user_doc["created_at"],
-        is_active=user_doc["is_active"]
-    )
-    
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
-        user=user_public
-    )
-
-@router.post("/login", response_model=TokenResponse)
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    """Login user with email and password"""
-    user = await authenticate_user(form_data.username, form_data.password)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if not user.get("is_active", True):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": user["id"]}, expires_delta=access_token_expires
-    )
-    
-    # Return user data and token
-    user_public = UserPublic(
-        id=user["id"],
-        email=user["email"],
-        full_name=user.get("full_name"),
-        role=user.get("role", "user"),
-        created_at=user["created_at"],
-        is_active=user.get("is_active", True)
-    )
-    
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
-        user=user_public
-    )
-
-@router.get("/me", response_model=UserPublic)
-async def get_current_user_info(current_user: dict = Depends(get_current_user)):
-    """Get current user information"""
-    return UserPublic(
-        id=current_user["id"],
-        email=current_user["email"],
-        full_name=current_user.get("full_name"),
-        role=current_user.get("role", "user"),
-        created_at=current_user["created_at"],
-        is_active=current_user.get("is_active", True)
-    )
-
-@router.put("/profile", response_model=UserPublic)
-async def update_profile(
-    user_update: UserUpdate,
-    current_user: dict = Depends(get_current_user)
-):
-    """Update user profile"""
-    update_data = user_update.dict(exclude_unset=True)
-    if not update_data:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No data to update"
-        )
-    
-    update_data["updated_at"] = datetime.utcnow()
-    
-    db = await get_database()
-    await db.users.update_one(
-        {"_id": ObjectId(current_user["id"])},
-        {"$set": update_data}
-    )
-    
-    # Get updated user
-    updated_user = await get_user_by_id(current_user["id"])
-    
-    return UserPublic(
-        id=updated_user["id"],
-        email=updated_user["email"],
-        full_name=updated_user.get("full_name"),
-        role=updated_user.get("role", "user"),
-        created_at=updated_user["created_at"],
-        is_active=updated_user.get("is_active", True)
-    )
-
-@router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(current_user: dict = Depends(get_current_user)):
-    """Refresh access token"""
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": current_user["id"]}, expires_delta=access_token_expires
-    )
-    
-    user_public = UserPublic(
-        id=current_user["id"],
-        email=current_user["email"],
-        full_name=current_user.get("full_name"),
-        role=current_user.get("role", "user"),
-        created_at=current_user["created_at"],
-        is_active=current_user.get("is_active", True)
-    )
-    
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
-        user=user_public
+from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from datetime import datetime, timedelta
+from typing import Optional
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+from bson import ObjectId
+
+from app.models.schemas import UserCreate, UserPublic, TokenResponse, UserUpdate
+from config.settings import settings
+from config.db import get_database
+
+router = APIRouter()
+
+# Password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# OAuth2 scheme
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password: str) -> str:
+    """Hash a password"""
+    return pwd_context.hash(password)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    """Create a JWT access token"""
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+    
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    return encoded_jwt
+
+async def get_user_by_email(email: str):
+    """Get user by email from database"""
+    db = await get_database()
+    user = await db.users.find_one({"email": email})
+    if user:
+        user["id"] = str(user["_id"])
+        return user
+    return None
+
+async def get_user_by_id(user_id: str):
+    """Get user by ID from database"""
+    db = await get_database()
+    try:
+        user = await db.users.find_one({"_id": ObjectId(user_id)})
+        if user:
+            user["id"] = str(user["_id"])
+            return user
+    except:
+        pass
+    return None
+
+async def authenticate_user(email: str, password: str):
+    """Authenticate a user with email and password"""
+    user = await get_user_by_email(email)
+    if not user:
+        return False
+    if not verify_password(password, user["hashed_password"]):
+        return False
+    return user
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
+    """Get current user from JWT token"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise credentials_exception
+    except JWTError:
+        raise credentials_exception
+    
+    user = await get_user_by_id(user_id)
+    if user is None:
+        raise credentials_exception
+    return user
+
+@router.post("/register", response_model=TokenResponse)
+async def register(user_data: UserCreate):
+    """Register a new user"""
+    # Check if user already exists
+    existing_user = await get_user_by_email(user_data.email)
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
+    # Create new user
+    hashed_password = get_password_hash(user_data.password)
+    user_doc = {
+        "email": user_data.email,
+        "full_name": user_data.full_name,
+        "hashed_password": hashed_password,
+        "role": "user",
+        "is_active": True,
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    }
+    
+    db = await get_database()
+    result = await db.users.insert_one(user_doc)
+    
+    # Create access token
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": str(result.inserted_id)}, expires_delta=access_token_expires
+    )
+    
+    # Return user data and token
+    user_public = UserPublic(
+        id=str(result.inserted_id),
+        email=user_doc["email"],
+        full_name=user_doc["full_name"],
+        role=user_doc["role"],
+        created_at=user_doc["created_at"],
+        is_active=user_doc["is_active"]
+    )
+    
+    return TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=settings.access_token_expire_minutes * 60,
+        user=user_public
+    )
+
+@router.post("/login", response_model=TokenResponse)
+async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+    """Login user with email and password"""
+    user = await authenticate_user(form_data.username, form_data.password)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if not user.get("is_active", True):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    
+    # Create access token
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": user["id"]}, expires_delta=access_token_expires
+    )
+    
+    # Return user data and token
+    user_public = UserPublic(
+        id=user["id"],
+        email=user["email"],
+        full_name=user.get("full_name"),
+        role=user.get("role", "user"),
+        created_at=user["created_at"],
+        is_active=user.get("is_active", True)
+    )
+    
+    return TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=settings.access_token_expire_minutes * 60,
+        user=user_public
+    )
+
+@router.get("/me", response_model=UserPublic)
+async def get_current_user_info(current_user: dict = Depends(get_current_user)):
+    """Get current user information"""
+    return UserPublic(
+        id=current_user["id"],
+        email=current_user["email"],
+        full_name=current_user.get("full_name"),
+        role=current_user.get("role", "user"),
+        created_at=current_user["created_at"],
+        is_active=current_user.get("is_active", True)
+    )
+
+@router.put("/profile", response_model=UserPublic)
+async def update_profile(
+    user_update: UserUpdate,
+    current_user: dict = Depends(get_current_user)
+):
+    """Update user profile"""
+    update_data = user_update.dict(exclude_unset=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No data to update"
+        )
+    
+    update_data["updated_at"] = datetime.utcnow()
+    
+    db = await get_database()
+    await db.users.update_one(
+        {"_id": ObjectId(current_user["id"])},
+        {"$set": update_data}
+    )
+    
+    # Get updated user
+    updated_user = await get_user_by_id(current_user["id"])
+    
+    return UserPublic(
+        id=updated_user["id"],
+        email=updated_user["email"],
+        full_name=updated_user.get("full_name"),
+        role=updated_user.get("role", "user"),
+        created_at=updated_user["created_at"],
+        is_active=updated_user.get("is_active", True)
+    )
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(current_user: dict = Depends(get_current_user)):
+    """Refresh access token"""
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": current_user["id"]}, expires_delta=access_token_expires
+    )
+    
+    user_public = UserPublic(
+        id=current_user["id"],
+        email=current_user["email"],
+        full_name=current_user.get("full_name"),
+        role=current_user.get("role", "user"),
+        created_at=current_user["created_at"],
+        is_active=current_user.get("is_active", True)
+    )
+    
+    return TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=settings.access_token_expire_minutes * 60,
+        user=user_public
     )
\ No newline at end of file
@@ -1,31 +1,62 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
+from pydantic import ValidationError
+import logging
 import os
-import aiofiles
-import magic
+import time
+import zipfile
 from pathlib import Path
 
 from app.models.schemas import (
     DocumentCreate, DocumentPublic, DocumentUpdate, 
-    FileUploadResponse, ProcessingStatus, FileType
+    FileUploadResponse, JobAccepted, ProcessingStatus, FileType,
+    BatchAccepted, BatchItemResult, BatchRequest
 )
 from app.services.summarizer import SummarizerService
-from app.services.nlp import NLPService
+from app.services.nlp import nlp_service
+from app.services.batch import BatchItem, BatchProcessor, list_archive
+from app.services.compute import compute_manager, BULK
 from app.services.tts import TTSService
+from app.services.dedup import DuplicateDetector, signature_from_binary, signature_to_binary
+from app.services.sentiment import decode_sentiment_timeline, encode_sentiment_timeline
+from app.services.content_store import content_store
+from app.services.embeddings import decode_embedding, encode_embedding
+from app.services.exports import (
+    content_disposition, export_filename, iter_ndjson, iter_text_export, iter_with_content, iter_zip
+)
+from app.services.extraction import count_blocks, stream_blocks
+from app.services.jobs import job_queue, job_runner
+from app.services.library_search import TRUNCATED_HEADER, library_search_filter
+from app.services.pipeline import Pipeline, Stage
+from app.services.streaming import extraction_progress, summarize_blocks
+from app.services.uploads import UploadStore, UploadTooLarge, mime_matches, stream_upload
+from app.services.vector_index import document_index
 from config.db import get_database, get_elasticsearch
+from config.settings import settings
 from app.routes.auth import get_current_user
+from app.utils.pagination import CURSOR_HEADER, apply_cursor, next_cursor, sort_spec
+from app.utils.projection import FULL_PROJECTION, document_projection, needs_content, parse_fields, serialize_document
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 summarizer = SummarizerService()
-nlp_service = NLPService()
+# Background jobs share the models but run on the bulk pool, leaving the interactive one to requests
+job_summarizer = summarizer.with_pool(BULK)
+job_nlp = nlp_service.with_pool(BULK)
 tts_service = TTSService()
+duplicate_detector = DuplicateDetector()
 
 # Ensure upload directory exists
-UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR = Path(settings.upload_directory)
 UPLOAD_DIR.mkdir(exist_ok=True)
+upload_store = UploadStore(UPLOAD_DIR)
+
+PROCESS_JOB = "process_document"
+BATCH_JOB = "process_batch"
 
 def get_file_type(filename: str) -> FileType:
     """Determine file type from filename"""
@@ -41,202 +72,608 @@ def get_file_type(filename: str) -> FileType:
     else:
         return FileType.TXT
 
-async def extract_text_from_file(file_path: str, file_type: FileType) -> str:
-    """Extract text content from uploaded file"""
-    try:
-        if file_type == FileType.PDF:
-            import PyPDF2
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
-        
-        elif file_type == FileType.DOCX:
-            from docx import Document
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        
-        elif file_type == FileType.PPTX:
-            from pptx import Presentation
-            prs = Presentation(file_path)
-            text = ""
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text += shape.text + "\n"
-            return text
-        
-        elif file_type == FileType.TXT:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
-                return await file.read()
-        
-        else:
-            return ""
-    
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error extracting text: {str(e)}")
-
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_file(
     file: UploadFile = File(...),
+    algorithm: str = Form("textrank"),
+    max_length: int = Form(150),
     current_user: dict = Depends(get_current_user)
 ):
-    """Upload a file for processing"""
+    """Upload a file and summarize it while its text is extracted page by page.
+    
+    This is the only summarization of an upload: /process with the same
+    file_id, algorithm and max_length stores this summary instead of
+    summarizing the text again.
+    """
     
     # Validate file type
     file_type = get_file_type(file.filename)
     if file_type not in [FileType.PDF, FileType.DOCX, FileType.PPTX, FileType.TXT]:
         raise HTTPException(status_code=400, detail="Unsupported file type")
     
-    # Validate file size
-    content = await file.read()
-    if len(content) > 25 * 1024 * 1024:  # 25MB limit
+    # Stream to disk, enforcing the size limit and hashing as bytes arrive
+    file_id = str(ObjectId())
+    incoming = UPLOAD_DIR / f"{file_id}.upload"
+    
+    try:
+        stored = await stream_upload(file, incoming, settings.max_file_size)
+    except UploadTooLarge:
         raise HTTPException(status_code=400, detail="File too large")
     
-    # Save file
-    file_id = str(ObjectId())
-    file_path = UPLOAD_DIR / f"{file_id}_{file.filename}"
+    if not mime_matches(file_type, stored.mime_type):
+        os.remove(incoming)
+        raise HTTPException(status_code=400, detail=f"File content ({stored.mime_type}) does not match a {file_type.value} file")
     
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    # Keep one copy per content hash; identical bytes extracted before are not parsed again
+    file_path = upload_store.adopt(stored, Path(file.filename).suffix)
+    db = await get_database()
+    previous = await upload_store.find_extracted(db, stored.sha256)
     
-    # Extract text content
-    try:
-        content_text = await extract_text_from_file(str(file_path), file_type)
-    except Exception as e:
-        # Clean up file on error
-        os.remove(file_path)
-        raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+    progress = extraction_progress.start(file_id, current_user["id"])
+    if previous and previous.get("algorithm") == algorithm and previous.get("max_length") == max_length:
+        progress.blocks = progress.total_blocks = previous["block_count"]
+        progress.sentences = previous["sentence_count"]
+        progress.finish()
+        summary = previous["summary"]
+        summary_time = previous.get("summary_time", 0.0)
+    else:
+        # Extract, segment and summarize one block at a time; progress is pollable meanwhile
+        started = time.time()
+        try:
+            await summarizer.initialize()
+            
+            async def summarize(text: str, length: int) -> str:
+                return (await summarizer.generate_summary(text, max_length=length, algorithm=algorithm))["summary"]
+            
+            if previous:
+                # Same bytes, different summary settings: summarize from the stored text
+                sidecar_path = str(upload_store.sidecar_path(stored.sha256))
+                summary = await summarize_blocks(stream_blocks(sidecar_path, FileType.TXT), summarize, max_length, progress)
+                progress.blocks = previous["block_count"]
+            else:
+                progress.total_blocks = await compute_manager.run(BULK, count_blocks, str(file_path), file_type.value)
+                async with upload_store.write_sidecar(stored.sha256) as sidecar:
+                    # Long PDFs are extracted in parallel page ranges on the process pool
+                    blocks = sidecar.tee(stream_blocks(str(file_path), file_type, page_count=progress.total_blocks))
+                    summary = await summarize_blocks(blocks, summarize, max_length, progress)
+        except Exception as e:
+            # Clean up file on error unless an earlier upload still uses it
+            if progress.finished_at is None:
+                progress.finish(error=str(e))
+            if previous is None:
+                os.remove(file_path)
+            raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+        summary_time = time.time() - started
+    
+    await upload_store.record(
+        db, file_id, current_user["id"], file.filename, file_type, stored,
+        summary=summary,
+        block_count=progress.blocks,
+        sentence_count=progress.sentences,
+        algorithm=algorithm,
+        max_length=max_length,
+        summary_time=summary_time
+    )
     
     return FileUploadResponse(
         file_id=file_id,
         filename=file.filename,
         file_type=file_type.value,
-        file_size=len(content),
-        processing_status=ProcessingStatus.PENDING
+        file_size=stored.size,
+        processing_status=ProcessingStatus.PENDING,
+        summary=summary,
+        block_count=progress.blocks,
+        sentence_count=progress.sentences,
+        duplicate=previous is not None
     )
 
-@router.post("/process")
+@router.get("/upload/{file_id}/progress")
+async def get_upload_progress(
+    file_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """Extraction progress of an upload started by this worker"""
+    progress = extraction_progress.get(file_id)
+    if progress is None or progress.user_id != current_user["id"]:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return progress.as_dict()
+
+@router.post("/process", response_model=JobAccepted, status_code=202)
 async def process_document(
     title: str = Form(...),
-    content: str = Form(...),
-    file_type: str = Form(...),
+    content: Optional[str] = Form(None),
+    file_id: Optional[str] = Form(None),
+    file_type: Optional[str] = Form(None),
     language: str = Form("en"),
     algorithm: str = Form("textrank"),
     max_length: int = Form(150),
+    skip: Optional[str] = Form(None, description="Comma-separated stages to skip, e.g. sentiment,topics"),
     current_user: dict = Depends(get_current_user)
 ):
-    """Process a document with AI summarization and tagging"""
+    """Queue a document for AI summarization and tagging.
+    
+    The text is either sent as `content` or taken from an earlier upload by `file_id`;
+    the upload's summary is kept when it was made with the same algorithm and max_length.
+    The document is stored right away as pending; poll GET /api/jobs/{job_id} or the
+    document's processing_status for the result.
+    """
     
+    skipped = [stage.strip() for stage in (skip or "").split(",") if stage.strip()]
     try:
-        # Initialize services
-        await summarizer.initialize()
-        await nlp_service.initialize()
-        
-        # Generate summary
-        summary_result = await summarizer.generate_summary(
-            content, 
-            max_length=max_length, 
-            algorithm=algorithm
-        )
-        
-        # Extract tags and entities
-        keywords = await nlp_service.extract_keywords(content, max_keywords=10)
-        entities = await nlp_service.extract_entities(content)
-        sentiment = await nlp_service.analyze_sentiment(content)
-        language_detected = await nlp_service.detect_language(content)
-        
-        # Prepare document data
-        document_data = {
-            "title": title,
-            "content": content,
-            "summary": summary_result["summary"],
-            "file_type": file_type,
-            "language": language_detected,
-            "sentiment": sentiment["compound"],
-            "tags": [kw["word"] for kw in keywords[:5]],
-            "entities": [ent["text"] for ent in entities[:10]],
-            "processing_status": ProcessingStatus.COMPLETED,
-            "algorithm_used": summary_result["algorithm_used"],
-            "processing_time": summary_result["processing_time"],
-            "compression_ratio": summary_result["compression_ratio"],
-            "user_id": current_user["id"],
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+        PROCESS_PIPELINE.validate_skip(skipped)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    db = await get_database()
+    upload_summary = None
+    if file_id:
+        upload = await upload_store.get(db, file_id, current_user["id"])
+        if upload is None:
+            raise HTTPException(status_code=404, detail="Upload not found")
+        try:
+            content = await upload_store.read_text(upload)
+        except FileNotFoundError:
+            raise HTTPException(status_code=410, detail="Extracted text of this upload is no longer available")
+        file_type = file_type or upload["file_type"]
+        if upload.get("algorithm") == algorithm and upload.get("max_length") == max_length:
+            upload_summary = {
+                "summary": upload["summary"],
+                "algorithm_used": algorithm,
+                "processing_time": upload.get("summary_time", 0.0),
+                "compression_ratio": len(upload["summary"]) / len(content) if content else 0.0
+            }
+    elif content is None:
+        raise HTTPException(status_code=400, detail="Either content or file_id is required")
+    file_type = file_type or FileType.TXT.value
+    
+    # Store the text once in the content store; the document only references it
+    content_hash = await content_store.put(db, content)
+    result = await db.documents.insert_one({
+        "title": title,
+        "content_hash": content_hash,
+        "content_size": len(content),
+        "file_type": file_type,
+        "processing_status": ProcessingStatus.PENDING,
+        "user_id": current_user["id"],
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    })
+    document_id = str(result.inserted_id)
+    
+    job_id = await job_queue.enqueue(
+        db, PROCESS_JOB,
+        {
+            "document_id": document_id,
+            "algorithm": algorithm,
+            "max_length": max_length,
+            "skip": skipped,
+            "upload_summary": upload_summary
+        },
+        user_id=current_user["id"]
+    )
+    job_runner.notify()
+    
+    return JobAccepted(job_id=job_id, document_id=document_id, processing_status=ProcessingStatus.PENDING)
+
+# Processing stages. Analyses of a near-duplicate reuse the original's results.
+
+async def find_original(db, user_id: str, document_id: str, signature):
+    """Earlier document of the user this one nearly duplicates, with the similarity"""
+    duplicates = await duplicate_detector.find_duplicates(db, user_id, signature, exclude=document_id)
+    if not duplicates:
+        return None, None
+    original = await db.documents.find_one({"_id": ObjectId(duplicates[0][0]), "user_id": user_id})
+    return (original, duplicates[0][1]) if original else (None, None)
+
+async def summary_stage(content: str, algorithm: str, max_length: int, upload_summary, duplicate) -> dict:
+    if upload_summary:
+        # Summarized from the same text when it was uploaded
+        return upload_summary
+    original, _ = duplicate
+    # Only a summary made with the same settings is reused
+    if original and original.get("algorithm_used") == algorithm and original.get("summary_max_length") == max_length:
+        return {
+            "summary": original.get("summary", ""),
+            "algorithm_used": original.get("algorithm_used", "unknown"),
+            "processing_time": 0.0,
+            "compression_ratio": original.get("compression_ratio", 0.0)
         }
+    await job_summarizer.initialize()
+    return await job_summarizer.generate_summary(content, max_length=max_length, algorithm=algorithm)
+
+async def keywords_stage(content: str, duplicate) -> List[str]:
+    original, _ = duplicate
+    if original:
+        return original.get("tags", [])
+    keywords = await job_nlp.extract_keywords(content, max_keywords=10)
+    return [kw["word"] for kw in keywords[:5]]
+
+async def entities_stage(content: str, duplicate) -> List[str]:
+    original, _ = duplicate
+    if original:
+        return original.get("entities", [])
+    entities = await job_nlp.extract_entities(content)
+    return [ent["text"] for ent in entities[:10]]
+
+async def sentiment_stage(content: str, duplicate):
+    original, _ = duplicate
+    if original:
+        return {"compound": original.get("sentiment")}, original.get("sentiment_timeline")
+    sentiment = await job_nlp.analyze_sentiment(content)
+    return sentiment, encode_sentiment_timeline(sentiment.pop("sentence_scores"))
+
+async def language_stage(content: str, duplicate):
+    original, _ = duplicate
+    if original:
+        return original.get("language"), original.get("language_confidence")
+    result = await job_nlp.identify_language(content)
+    return result["language"], result["confidence"]
+
+async def topics_stage(content: str, user_id: str, duplicate):
+    """Labels and ids of the document's topics; the id stays valid as the user's model keeps learning"""
+    original, _ = duplicate
+    if original:
+        return original.get("topics", []), original.get("topic_ids", [])
+    topics = await job_nlp.extract_topics(content, user_id)
+    return [topic["label"] for topic in topics], [topic["topic_id"] for topic in topics]
+
+async def embedding_stage(title: str, content: str, duplicate):
+    original, _ = duplicate
+    if original and original.get("embedding") is not None:
+        return decode_embedding(original["embedding"])
+    return await job_nlp.compute_embedding(title + "\n" + content)
+
+async def store_stage(db, doc: dict, max_length: int, signature, duplicate, summary_result, tags, entity_texts,
+                      sentiment, language, topics, embedding) -> bool:
+    """Write the analysis onto the pending document; False if it was deleted meanwhile"""
+    original, similarity = duplicate
+    sentiment_scores, sentiment_timeline = sentiment
+    language_detected, language_confidence = language
+    topic_labels, topic_ids = topics
+    document_data = {
+        "summary": summary_result["summary"],
+        "language": language_detected,
+        "language_confidence": language_confidence,
+        "sentiment": sentiment_scores["compound"],
+        "sentiment_timeline": sentiment_timeline,
+        "tags": tags,
+        "entities": entity_texts,
+        "topics": topic_labels,
+        "topic_ids": topic_ids,
+        "minhash": signature_to_binary(signature),
+        "embedding": encode_embedding(embedding, settings.embedding_storage_dtype) if embedding is not None else None,
+        "duplicate_of": (original.get("duplicate_of") or str(original["_id"])) if original else None,
+        "duplicate_similarity": similarity,
+        "processing_status": ProcessingStatus.COMPLETED,
+        "algorithm_used": summary_result["algorithm_used"],
+        "summary_max_length": max_length,
+        "processing_time": summary_result["processing_time"],
+        "compression_ratio": summary_result["compression_ratio"],
+        "updated_at": datetime.utcnow()
+    }
+    result = await db.documents.update_one({"_id": doc["_id"]}, {"$set": document_data})
+    return result.matched_count == 1
+
+async def dedup_index_stage(stored: bool, db, user_id: str, document_id: str, signature) -> None:
+    if stored:
+        await duplicate_detector.add(db, user_id, document_id, signature)
+
+async def vector_index_stage(stored: bool, document_id: str, user_id: str, embedding) -> None:
+    if stored and embedding is not None:
+        await compute_manager.run(BULK, document_index.add, [document_id], embedding, [user_id])
+
+async def search_index_stage(stored: bool, doc: dict, content: str, summary_result, tags, entity_texts,
+                             topics, language, sentiment) -> None:
+    if not stored:
+        return
+    try:
+        es = await get_elasticsearch()
+        await es.index(
+            index="instabrief_documents",
+            id=str(doc["_id"]),
+            body={
+                "title": doc["title"],
+                "content": content,
+                "content_hash": doc["content_hash"],
+                "summary": summary_result["summary"],
+                "tags": tags,
+                "entities": entity_texts,
+                "topics": topics[0],
+                "user_id": doc["user_id"],
+                "created_at": doc["created_at"].isoformat(),
+                "file_type": doc.get("file_type"),
+                "language": language[0],
+                "sentiment": sentiment[0]["compound"]
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Elasticsearch indexing of document {doc['_id']} failed: {e}")
+
+SKIPPED_SUMMARY = {"summary": None, "algorithm_used": None, "processing_time": 0.0, "compression_ratio": 0.0}
+
+PROCESS_PIPELINE = Pipeline([
+    Stage("signature", duplicate_detector.hasher.signature, ("content",), pool=BULK, skippable=False),
+    Stage("duplicate", find_original, ("db", "user_id", "document_id", "signature"), default=(None, None)),
+    Stage("summary", summary_stage, ("content", "algorithm", "max_length", "upload_summary", "duplicate"),
+          default=SKIPPED_SUMMARY),
+    Stage("keywords", keywords_stage, ("content", "duplicate"), default=[]),
+    Stage("entities", entities_stage, ("content", "duplicate"), default=[]),
+    Stage("sentiment", sentiment_stage, ("content", "duplicate"), default=({"compound": None}, None)),
+    Stage("language", language_stage, ("content", "duplicate"), default=(None, None)),
+    Stage("topics", topics_stage, ("content", "user_id", "duplicate"), default=([], [])),
+    Stage("embedding", embedding_stage, ("title", "content", "duplicate")),
+    Stage("store", store_stage, (
+        "db", "doc", "max_length", "signature", "duplicate", "summary", "keywords", "entities",
+        "sentiment", "language", "topics", "embedding"
+    ), skippable=False),
+    Stage("dedup_index", dedup_index_stage, ("store", "db", "user_id", "document_id", "signature")),
+    Stage("vector_index", vector_index_stage, ("store", "document_id", "user_id", "embedding")),
+    Stage("search_index", search_index_stage, (
+        "store", "doc", "content", "summary", "keywords", "entities", "topics", "language", "sentiment"
+    )),
+])
+
+async def run_process_job(job: dict) -> dict:
+    """Analyse a pending document; runs on the job workers and may be retried"""
+    payload = job["payload"]
+    document_id = payload["document_id"]
+    
+    db = await get_database()
+    doc = await db.documents.find_one({"_id": ObjectId(document_id)}, FULL_PROJECTION)
+    if doc is None:
+        # Deleted before a worker got to it
+        return {"id": document_id, "deleted": True}
+    await db.documents.update_one(
+        {"_id": doc["_id"]},
+        {"$set": {"processing_status": ProcessingStatus.PROCESSING, "updated_at": datetime.utcnow()}}
+    )
+    await job_nlp.initialize()
+    
+    run = await PROCESS_PIPELINE.run({
+        "db": db,
+        "doc": doc,
+        "document_id": document_id,
+        "user_id": doc["user_id"],
+        "title": doc["title"],
+        "content": await content_store.load_content(db, doc),
+        "algorithm": payload["algorithm"],
+        "max_length": payload["max_length"],
+        "upload_summary": payload.get("upload_summary"),
+    }, skip=payload.get("skip", []))
+    if not run.results["store"]:
+        return {"id": document_id, "deleted": True}
+    
+    timings = {name: round(seconds, 4) for name, seconds in run.timings.items()}
+    await db.documents.update_one(
+        {"_id": doc["_id"]},
+        {"$set": {"stage_timings": timings, "skipped_stages": run.skipped, "pipeline_time": run.elapsed}}
+    )
+    
+    summary_result = run.results["summary"]
+    original, _ = run.results["duplicate"]
+    return {
+        "id": document_id,
+        "summary": summary_result["summary"],
+        "tags": run.results["keywords"],
+        "entities": run.results["entities"],
+        "topics": run.results["topics"][0],
+        "duplicate_of": (original.get("duplicate_of") or str(original["_id"])) if original else None,
+        "sentiment": run.results["sentiment"][0],
+        "processing_time": summary_result["processing_time"],
+        "compression_ratio": summary_result["compression_ratio"],
+        "stage_timings": timings,
+        "pipeline_time": run.elapsed
+    }
+
+async def fail_process_job(job: dict) -> None:
+    """Mark the document failed once its job has used up its retries"""
+    db = await get_database()
+    await db.documents.update_one(
+        {"_id": ObjectId(job["payload"]["document_id"])},
+        {"$set": {"processing_status": ProcessingStatus.FAILED, "updated_at": datetime.utcnow()}}
+    )
+
+job_runner.register(PROCESS_JOB, run_process_job, on_failure=fail_process_job)
+
+batch_processor = BatchProcessor(job_summarizer, job_nlp, duplicate_detector, document_index)
+
+@router.post("/batch", response_model=BatchAccepted, status_code=202)
+async def process_batch(request: Request, current_user: dict = Depends(get_current_user)):
+    """Queue many documents for processing in one request.
+    
+    Send either a JSON BatchRequest, or a multipart form with a zip `archive`
+    of PDF/DOCX/PPTX/TXT files plus optional `algorithm`, `max_length` and
+    `skip` fields. Every item is reported on its own: items that cannot be
+    read fail without failing the batch. The accepted documents are analysed
+    together by one background job, which also extracts the text of archive
+    members; poll GET /api/jobs/{job_id}.
+    """
+    
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        archive = form.get("archive")
+        if archive is None or isinstance(archive, str):
+            raise HTTPException(status_code=400, detail="A zip file is required in the archive field")
+        try:
+            options = BatchRequest(
+                documents=[],
+                algorithm=form.get("algorithm", "textrank"),
+                max_length=form.get("max_length", 150),
+                skip=[stage.strip() for stage in form.get("skip", "").split(",") if stage.strip()]
+            )
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors())
         
-        # Save to database
-        db = await get_database()
-        result = await db.documents.insert_one(document_data)
-        document_id = str(result.inserted_id)
-        
-        # Index in Elasticsearch
+        # Only the member list is read here; the job extracts the members and keeps the archive until it ends
+        archive_path = UPLOAD_DIR / f"{ObjectId()}.zip"
         try:
-            es = await get_elasticsearch()
-            await es.index(
-                index="instabrief_documents",
-                id=document_id,
-                body={
-                    "title": title,
-                    "content": content,
-                    "summary": summary_result["summary"],
-                    "tags": document_data["tags"],
-                    "entities": document_data["entities"],
-                    "user_id": current_user["id"],
-                    "created_at": datetime.utcnow().isoformat(),
-                    "file_type": file_type,
-                    "language": language_detected,
-                    "sentiment": sentiment["compound"]
-                }
+            await stream_upload(archive, archive_path, settings.batch_max_archive_size)
+            if not zipfile.is_zipfile(archive_path):
+                raise HTTPException(status_code=400, detail="Archive is not a zip file")
+            items = await compute_manager.run(
+                BULK, list_archive, archive_path, settings.batch_max_items, settings.max_file_size
             )
-        except Exception as e:
-            print(f"Elasticsearch indexing failed: {e}")
+        except BaseException as e:
+            if archive_path.exists():
+                os.remove(archive_path)
+            if isinstance(e, UploadTooLarge):
+                raise HTTPException(status_code=400, detail="Archive too large")
+            if isinstance(e, (ValueError, zipfile.BadZipFile)):
+                raise HTTPException(status_code=400, detail=str(e))
+            raise
         
-        return {
-            "id": document_id,
-            "summary": summary_result["summary"],
-            "tags": document_data["tags"],
-            "entities": document_data["entities"],
-            "sentiment": sentiment,
-            "processing_time": summary_result["processing_time"],
-            "compression_ratio": summary_result["compression_ratio"]
-        }
+        members = [item for item in items if item.status != ProcessingStatus.FAILED]
+        for item in members:
+            item.document_id = str(ObjectId())
+    else:
+        try:
+            options = BatchRequest(**await request.json())
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=e.errors() if isinstance(e, ValidationError) else str(e))
+        if len(options.documents) > settings.batch_max_items:
+            raise HTTPException(status_code=400, detail=f"At most {settings.batch_max_items} documents per batch")
+        items = [
+            BatchItem(index=i, title=document.title, content=document.content, file_type=document.file_type.value)
+            for i, document in enumerate(options.documents)
+        ]
+        members, archive_path = None, None
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+    return await enqueue_batch(current_user["id"], items, members, options, archive=archive_path)
+
+async def enqueue_batch(user_id: str, items: List[BatchItem], members: Optional[List[BatchItem]],
+                        options: BatchRequest, archive: Optional[Path] = None) -> BatchAccepted:
+    """Insert the documents sent inline, or hand the archive `members` to the job, and queue the batch job"""
+    try:
+        skipped = sorted(PROCESS_PIPELINE.validate_skip(options.skip))
+        if not items:
+            raise ValueError("The batch is empty")
+    except ValueError as e:
+        if archive is not None:
+            os.remove(archive)
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    db = await get_database()
+    payload = {"algorithm": options.algorithm, "max_length": options.max_length, "skip": skipped}
+    if archive is None:
+        accepted = await batch_processor.insert(db, user_id, items)
+        payload["document_ids"] = [item.document_id for item in accepted]
+    else:
+        accepted = members
+        payload.update(
+            archive=str(archive),
+            members=[
+                {"index": item.index, "title": item.title, "source": item.source,
+                 "file_type": item.file_type, "document_id": item.document_id}
+                for item in members
+            ],
+            document_ids=[item.document_id for item in members]
+        )
+    
+    job_id = None
+    if accepted:
+        job_id = await job_queue.enqueue(db, BATCH_JOB, payload, user_id=user_id)
+        job_runner.notify()
+    elif archive is not None:
+        os.remove(archive)
+    
+    return BatchAccepted(
+        job_id=job_id,
+        accepted=len(accepted),
+        failed=len(items) - len(accepted),
+        items=[BatchItemResult(**item.as_dict()) for item in items]
+    )
 
-@router.get("/", response_model=List[DocumentPublic])
+def remove_batch_archive(payload: dict) -> None:
+    if payload.get("archive") and os.path.exists(payload["archive"]):
+        os.remove(payload["archive"])
+
+async def run_batch_job(job: dict) -> dict:
+    """Extract archive members, then analyse the pending documents of a batch with batched NLP calls"""
+    payload = job["payload"]
+    db = await get_database()
+    document_ids = payload["document_ids"]
+    failed = []
+    if payload.get("archive"):
+        members = [BatchItem(**member) for member in payload["members"]]
+        inserted = await batch_processor.insert_archive(
+            db, job["user_id"], Path(payload["archive"]), members, UPLOAD_DIR, settings.max_file_size
+        )
+        document_ids = [item.document_id for item in inserted]
+        failed = [item.as_dict() for item in members if item.status == ProcessingStatus.FAILED]
+    
+    result = await batch_processor.process(
+        db, document_ids, payload["algorithm"], payload["max_length"], payload.get("skip", [])
+    )
+    result["items"].extend(failed)
+    remove_batch_archive(payload)
+    return result
+
+async def fail_batch_job(job: dict) -> None:
+    """Mark the batch's unfinished documents failed once the job has used up its retries"""
+    remove_batch_archive(job["payload"])
+    db = await get_database()
+    await db.documents.update_many(
+        {
+            "_id": {"$in": [ObjectId(i) for i in job["payload"]["document_ids"]]},
+            "processing_status": {"$ne": ProcessingStatus.COMPLETED}
+        },
+        {"$set": {"processing_status": ProcessingStatus.FAILED, "updated_at": datetime.utcnow()}}
+    )
+
+job_runner.register(BATCH_JOB, run_batch_job, on_failure=fail_batch_job)
+
+async def library_query(user_id: str, q: Optional[str], type: Optional[str]) -> tuple:
+    """Mongo filter for the user's documents matching the listing's search and type filters.
+    
+    Also returns whether the search matched more documents than the filter holds.
+    """
+    query = {"user_id": user_id}
+    file_type = type if type and type != "all" else None
+    truncated = False
+    
+    if file_type:
+        query["file_type"] = file_type
+    
+    if q:
+        # Indexed search (Elasticsearch, else the text index) instead of scanning every document
+        search, truncated = await library_search_filter(user_id, q, file_type)
+        if search:
+            query.update(search)
+    return query, truncated
+
+@router.get("/", response_model=None)
 async def get_documents(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Deprecated, use cursor"),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Value of the X-Next-Cursor header of the previous page"),
     q: Optional[str] = Query(None),
     type: Optional[str] = Query(None),
     sort: str = Query("newest"),
+    view: str = Query("summary", pattern="^(summary|full)$", description="summary omits content"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, overrides view"),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get user's documents with optional search and filtering"""
-    
-    db = await get_database()
+    """Get user's documents with optional search and filtering.
     
-    # Build query
-    query = {"user_id": current_user["id"]}
+    Pages are keyset-paginated: pass the X-Next-Cursor header of one page as
+    `cursor` to fetch the next; the header is absent on the last page.
+    A search `q` lists at most library_search_max_hits matches, and sets
+    X-Search-Truncated when more documents matched.
+    Items are DocumentListItem by default, DocumentPublic with view=full, or
+    only the requested `fields`.
+    """
     
-    if type and type != "all":
-        query["file_type"] = type
+    try:
+        requested_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    if q:
-        # Text search in title, content, and summary
-        query["$or"] = [
-            {"title": {"$regex": q, "$options": "i"}},
-            {"content": {"$regex": q, "$options": "i"}},
-            {"summary": {"$regex": q, "$options": "i"}},
-            {"tags": {"$in": [{"$regex": q, "$options": "i"}]}}
-        ]
+    db = await get_database()
+    query, truncated = await library_query(current_user["id"], q, type)
+    if truncated:
+        response.headers[TRUNCATED_HEADER] = "true"
     
     # Build sort
     sort_field = "created_at"
@@ -251,14 +688,80 @@ async def get_documents(
         sort_direction = -1
     
     # Execute query
-    cursor = db.documents.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-    documents = []
+    try:
+        query = apply_cursor(query, sort_field, sort_direction, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    async for doc in cursor:
-        doc["id"] = str(doc["_id"])
-        documents.append(DocumentPublic(**doc))
+    projection = document_projection(view, requested_fields, extra=[sort_field])
+    results = db.documents.find(query, projection).sort(sort_spec(sort_field, sort_direction))
+    if not cursor and skip:
+        results = results.skip(skip)
+    docs = await results.limit(limit).to_list(length=limit)
+    if needs_content(view, requested_fields):
+        await content_store.attach(db, docs)
+    
+    token = next_cursor(docs, sort_field, limit)
+    if token:
+        response.headers[CURSOR_HEADER] = token
     
-    return documents
+    return [serialize_document(doc, view, requested_fields) for doc in docs]
+
+@router.get("/topics")
+async def get_topics(current_user: dict = Depends(get_current_user)):
+    """Get the topics learned from the user's document library"""
+    
+    topics = await nlp_service.list_topics(current_user["id"])
+    return {"topics": topics}
+
+@router.get("/export")
+async def export_documents(
+    format: str = Query("ndjson", pattern="^(ndjson|zip)$"),
+    q: Optional[str] = Query(None),
+    type: Optional[str] = Query(None),
+    ids: Optional[str] = Query(None, description="Comma-separated document ids to export"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields of each NDJSON record"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Export the library, or the documents matching the listing filters.
+    
+    NDJSON has one DocumentPublic per line (or only the requested `fields`);
+    zip has the text export of every document. Both are streamed from a
+    cursor as they are produced, so memory does not grow with the library.
+    """
+    
+    try:
+        requested_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    query, truncated = await library_query(current_user["id"], q, type)
+    if ids:
+        wanted = [i.strip() for i in ids.split(",") if i.strip()]
+        if not all(ObjectId.is_valid(i) for i in wanted):
+            raise HTTPException(status_code=400, detail="Invalid document id")
+        query["_id"] = {"$in": [ObjectId(i) for i in wanted]}
+    
+    db = await get_database()
+    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    if format == "zip":
+        cursor = db.documents.find(query, FULL_PROJECTION).sort("_id", 1)
+        body = iter_zip(iter_with_content(db, cursor))
+        media_type, filename = "application/zip", f"documents-{stamp}.zip"
+    else:
+        projection = document_projection("full", requested_fields)
+        cursor = db.documents.find(query, projection).sort("_id", 1)
+        if needs_content("full", requested_fields):
+            docs = iter_with_content(db, cursor)
+        else:
+            docs = cursor
+        body = iter_ndjson(serialize_document(doc, "full", requested_fields) async for doc in docs)
+        media_type, filename = "application/x-ndjson", f"documents-{stamp}.ndjson"
+    
+    headers = {"Content-Disposition": content_disposition(filename)}
+    if truncated:
+        headers[TRUNCATED_HEADER] = "true"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 @router.get("/{document_id}", response_model=DocumentPublic)
 async def get_document(
@@ -272,11 +775,12 @@ async def get_document(
         doc = await db.documents.find_one({
             "_id": ObjectId(document_id),
             "user_id": current_user["id"]
-        })
+        }, FULL_PROJECTION)
         
         if not doc:
             raise HTTPException(status_code=404, detail="Document not found")
         
+        doc["content"] = await content_store.load_content(db, doc)
         doc["id"] = str(doc["_id"])
         return DocumentPublic(**doc)
     
@@ -289,7 +793,7 @@ async def update_document(
     document_update: DocumentUpdate,
     current_user: dict = Depends(get_current_user)
 ):
-    """Update a document"""
+    """Update a document; changed content is analysed again by a background job"""
     
     try:
         db = await get_database()
@@ -306,14 +810,27 @@ async def update_document(
         # Update document
         update_data = document_update.dict(exclude_unset=True)
         update_data["updated_at"] = datetime.utcnow()
+        update_ops = {"$set": update_data}
+        
+        new_content = update_data.pop("content", None)
+        if new_content is not None:
+            update_data["content_hash"] = await content_store.put(db, new_content)
+            update_data["content_size"] = len(new_content)
+            update_data["processing_status"] = ProcessingStatus.PENDING
+            update_ops["$unset"] = {"content": ""}
         
         await db.documents.update_one(
             {"_id": ObjectId(document_id)},
-            {"$set": update_data}
+            update_ops
         )
+        if new_content is not None:
+            if doc.get("content_hash"):
+                await content_store.release(db, doc["content_hash"])
+            await reprocess_document(db, doc)
         
         # Get updated document
-        updated_doc = await db.documents.find_one({"_id": ObjectId(document_id)})
+        updated_doc = await db.documents.find_one({"_id": ObjectId(document_id)}, FULL_PROJECTION)
+        updated_doc["content"] = new_content if new_content is not None else await content_store.load_content(db, updated_doc)
         updated_doc["id"] = str(updated_doc["_id"])
         
         return DocumentPublic(**updated_doc)
@@ -321,6 +838,29 @@ async def update_document(
     except Exception:
         raise HTTPException(status_code=404, detail="Document not found")
 
+async def reprocess_document(db, doc: dict) -> str:
+    """Queue a document whose content changed to be analysed again with its earlier settings.
+    
+    Its signature and vector leave the in-memory indexes until the job stores the new ones;
+    the job also overwrites the analysis, the embedding and the Elasticsearch document.
+    """
+    document_id = str(doc["_id"])
+    duplicate_detector.remove(doc["user_id"], document_id)
+    document_index.remove(document_id)
+    job_id = await job_queue.enqueue(
+        db, PROCESS_JOB,
+        {
+            "document_id": document_id,
+            "algorithm": doc.get("algorithm_used") or "textrank",
+            "max_length": doc.get("summary_max_length") or 150,
+            "skip": doc.get("skipped_stages", []),
+            "upload_summary": None
+        },
+        user_id=doc["user_id"]
+    )
+    job_runner.notify()
+    return job_id
+
 @router.delete("/{document_id}")
 async def delete_document(
     document_id: str,
@@ -342,6 +882,10 @@ async def delete_document(
         
         # Delete from database
         await db.documents.delete_one({"_id": ObjectId(document_id)})
+        if doc.get("content_hash"):
+            await content_store.release(db, doc["content_hash"])
+        duplicate_detector.remove(current_user["id"], document_id)
+        document_index.remove(document_id)
         
         # Delete from Elasticsearch
         try:
@@ -355,49 +899,102 @@ async def delete_document(
     except Exception:
         raise HTTPException(status_code=404, detail="Document not found")
 
-@router.get("/{document_id}/export")
-async def export_document(
+@router.get("/{document_id}/duplicates")
+async def get_document_duplicates(
     document_id: str,
+    threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
     current_user: dict = Depends(get_current_user)
 ):
-    """Export document summary as text file"""
+    """Get the user's documents that are near-duplicates of a document"""
     
     try:
         db = await get_database()
-        doc = await db.documents.find_one({
-            "_id": ObjectId(document_id),
-            "user_id": current_user["id"]
-        })
-        
-        if not doc:
-            raise HTTPException(status_code=404, detail="Document not found")
-        
-        # Create export content
-        content = f"Document: {doc['title']}\n"
-        content += f"Created: {doc['created_at'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-        content += f"File Type: {doc.get('file_type', 'Unknown')}\n"
-        content += f"Language: {doc.get('language', 'Unknown')}\n"
-        content += f"Algorithm: {doc.get('algorithm_used', 'Unknown')}\n\n"
-        content += f"SUMMARY:\n{doc.get('summary', 'No summary available')}\n\n"
-        
-        if doc.get('tags'):
-            content += f"TAGS: {', '.join(doc['tags'])}\n\n"
-        
-        if doc.get('entities'):
-            content += f"ENTITIES: {', '.join(doc['entities'])}\n\n"
-        
-        content += f"ORIGINAL CONTENT:\n{doc.get('content', '')}"
-        
-        # Save to temporary file
-        temp_file = f"temp_export_{document_id}.txt"
-        async with aiofiles.open(temp_file, 'w', encoding='utf-8') as f:
-            await f.write(content)
-        
-        return FileResponse(
-            temp_file,
-            media_type='text/plain',
-            filename=f"{doc['title']}_summary.txt"
+        doc = await db.documents.find_one(
+            {"_id": ObjectId(document_id), "user_id": current_user["id"]},
+            {"minhash": 1, "content": 1, "content_hash": 1}
         )
+    except Exception:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    if doc.get("minhash"):
+        signature = signature_from_binary(doc["minhash"])
+    else:
+        signature = await duplicate_detector.signature(await content_store.load_content(db, doc))
+    
+    matches = await duplicate_detector.find_duplicates(
+        db, current_user["id"], signature, threshold=threshold, exclude=document_id
+    )
+    similarity_by_id = dict(matches)
+    
+    duplicates = []
+    if matches:
+        cursor = db.documents.find(
+            {"_id": {"$in": [ObjectId(key) for key, _ in matches]}, "user_id": current_user["id"]},
+            {"title": 1, "created_at": 1}
+        )
+        async for match in cursor:
+            duplicates.append({
+                "id": str(match["_id"]),
+                "title": match.get("title"),
+                "created_at": match.get("created_at"),
+                "similarity": similarity_by_id[str(match["_id"])]
+            })
+        duplicates.sort(key=lambda item: item["similarity"], reverse=True)
+    
+    return {"document_id": document_id, "duplicates": duplicates}
+
+@router.get("/{document_id}/sentiment")
+async def get_document_sentiment(
+    document_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the stored per-sentence sentiment timeline of a document"""
     
+    try:
+        db = await get_database()
+        doc = await db.documents.find_one(
+            {"_id": ObjectId(document_id), "user_id": current_user["id"]},
+            {"sentiment": 1, "sentiment_timeline": 1}
+        )
     except Exception:
         raise HTTPException(status_code=404, detail="Document not found")
+    
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    timeline = doc.get("sentiment_timeline")
+    return {
+        "document_id": document_id,
+        "compound": doc.get("sentiment"),
+        "timeline": decode_sentiment_timeline(timeline) if timeline else []
+    }
+
+@router.get("/{document_id}/export")
+async def export_document(
+    document_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """Export document summary as text file"""
+    
+    if not ObjectId.is_valid(document_id):
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    db = await get_database()
+    doc = await db.documents.find_one({
+        "_id": ObjectId(document_id),
+        "user_id": current_user["id"]
+    }, FULL_PROJECTION)
+    
+    if not doc:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    # Streamed in chunks straight to the client; nothing is written to disk
+    content = await content_store.load_content(db, doc)
+    return StreamingResponse(
+        iter_text_export(doc, content),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": content_disposition(export_filename(doc["title"], "_summary.txt"))}
+    )
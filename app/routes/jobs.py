@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Depends
+
+from app.models.schemas import JobResponse
+from app.routes.auth import get_current_user
+from app.services.jobs import job_queue
+from config.db import get_database
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """Status of a background job, with its result once completed"""
+    db = await get_database()
+    job = await job_queue.get(db, job_id, current_user["id"])
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return JobResponse(
+        id=str(job["_id"]),
+        kind=job["kind"],
+        status=job["status"],
+        attempts=job["attempts"],
+        max_attempts=job["max_attempts"],
+        document_id=job["payload"].get("document_id"),
+        result=job.get("result"),
+        error=job.get("error"),
+        created_at=job["created_at"],
+        updated_at=job["updated_at"],
+        finished_at=job.get("finished_at")
+    )
@@ -1,27 +1,102 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+from bson import ObjectId
 
 from app.models.schemas import SearchRequest, SearchResponse, DocumentPublic
 from app.routes.auth import get_current_user
-from config.db import get_elasticsearch
+from app.services.compute import compute_manager, INTERACTIVE
+from app.services.content_store import content_store
+from app.services.nlp import nlp_service
+from app.services.vector_index import document_index
+from app.utils.projection import FULL_PROJECTION
+from config.db import get_database, get_elasticsearch
 
 router = APIRouter()
 
+# Candidates fetched per requested result, so Mongo-side filters still fill a page
+SEMANTIC_OVERFETCH = 4
+
+
+def _date_range_start(date_range: Optional[str]) -> Optional[datetime]:
+    if not date_range or date_range == "all":
+        return None
+    now = datetime.utcnow()
+    if date_range == "today":
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif date_range == "week":
+        return now - timedelta(days=7)
+    elif date_range == "month":
+        return now - timedelta(days=30)
+    elif date_range == "year":
+        return now - timedelta(days=365)
+    return None
+
+
+async def _semantic_search(q: str, type: Optional[str], topic: Optional[str], date_range: Optional[str],
+                           page: int, limit: int, user_id: str) -> SearchResponse:
+    """Rank the user's documents by embedding similarity using the in-process vector index"""
+    start_time = datetime.utcnow()
+    await nlp_service.initialize()
+    query_embedding = await nlp_service.compute_embedding(q)
+
+    wanted = (page + 1) * limit
+    hits = await compute_manager.run(
+        INTERACTIVE, document_index.search, query_embedding, wanted * SEMANTIC_OVERFETCH, user_id
+    )
+    scores = dict(hits)
+
+    mongo_filter = {
+        "_id": {"$in": [ObjectId(doc_id) for doc_id, _ in hits]},
+        "user_id": user_id
+    }
+    if type and type != "all":
+        mongo_filter["file_type"] = type
+    if topic:
+        mongo_filter["topics"] = topic
+    start_date = _date_range_start(date_range)
+    if start_date:
+        mongo_filter["created_at"] = {"$gte": start_date}
+
+    db = await get_database()
+    cursor = db.documents.find(mongo_filter, FULL_PROJECTION)
+    docs = await cursor.to_list(length=len(hits))
+    docs.sort(key=lambda doc: scores[str(doc["_id"])], reverse=True)
+    page_docs = await content_store.attach(db, docs[page * limit:wanted])
+
+    results = []
+    for doc in page_docs:
+        doc["id"] = str(doc["_id"])
+        results.append(DocumentPublic(**doc))
+
+    return SearchResponse(
+        results=results,
+        total=len(docs),
+        page=page,
+        limit=limit,
+        query=q,
+        processing_time=(datetime.utcnow() - start_time).total_seconds()
+    )
+
+
 @router.get("/", response_model=SearchResponse)
 async def search_documents(
     q: str = Query(..., description="Search query"),
     semantic: bool = Query(False, description="Use semantic search"),
     type: Optional[str] = Query(None, description="Filter by file type"),
+    topic: Optional[str] = Query(None, description="Filter by topic"),
     date_range: Optional[str] = Query(None, description="Filter by date range"),
     sort: str = Query("relevance", description="Sort order"),
     page: int = Query(0, ge=0, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
     current_user: dict = Depends(get_current_user)
 ):
-    """Search documents using Elasticsearch"""
+    """Search documents using Elasticsearch, or the vector index when semantic is set"""
     
     try:
+        if q and semantic:
+            return await _semantic_search(q, type, topic, date_range, page, limit, current_user["id"])
+        
         es = await get_elasticsearch()
         
         # Build query
@@ -43,25 +118,13 @@ async def search_documents(
         
         # Add text search
         if q:
-            if semantic:
-                # Semantic search using vector similarity
-                query_body["query"]["bool"]["must"].append({
-                    "multi_match": {
-                        "query": q,
-                        "fields": ["title^2", "content", "summary^1.5", "tags"],
-                        "type": "best_fields",
-                        "fuzziness": "AUTO"
-                    }
-                })
-            else:
-                # Regular text search
-                query_body["query"]["bool"]["must"].append({
-                    "multi_match": {
-                        "query": q,
-                        "fields": ["title^2", "content", "summary^1.5", "tags"],
-                        "type": "best_fields"
-                    }
-                })
+            query_body["query"]["bool"]["must"].append({
+                "multi_match": {
+                    "query": q,
+                    "fields": ["title^2", "content", "summary^1.5", "tags"],
+                    "type": "best_fields"
+                }
+            })
         
         # Add filters
         if type and type != "all":
@@ -70,28 +133,22 @@ async def search_documents(
                 "term": {"file_type": type}
             })
         
-        if date_range and date_range != "all":
-            now = datetime.utcnow()
-            if date_range == "today":
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif date_range == "week":
-                start_date = now.replace(day=now.day-7)
-            elif date_range == "month":
-                start_date = now.replace(month=now.month-1)
-            elif date_range == "year":
-                start_date = now.replace(year=now.year-1)
-            else:
-                start_date = None
-            
-            if start_date:
-                query_body["query"]["bool"]["filter"] = query_body["query"]["bool"].get("filter", [])
-                query_body["query"]["bool"]["filter"].append({
-                    "range": {
-                        "created_at": {
-                            "gte": start_date.isoformat()
-                        }
+        if topic:
+            query_body["query"]["bool"]["filter"] = query_body["query"]["bool"].get("filter", [])
+            query_body["query"]["bool"]["filter"].append({
+                "term": {"topics": topic}
+            })
+        
+        start_date = _date_range_start(date_range)
+        if start_date:
+            query_body["query"]["bool"]["filter"] = query_body["query"]["bool"].get("filter", [])
+            query_body["query"]["bool"]["filter"].append({
+                "range": {
+                    "created_at": {
+                        "gte": start_date.isoformat()
                     }
-                })
+                }
+            })
         
         # Add sorting
         if sort == "newest":
@@ -113,12 +170,14 @@ async def search_documents(
         )
         processing_time = (datetime.utcnow() - start_time).total_seconds()
         
-        # Process results
-        results = []
+        # Process results; content is not kept in _source, so load it from the content store
+        docs = []
         for hit in response["hits"]["hits"]:
             doc = hit["_source"]
             doc["id"] = hit["_id"]
-            results.append(DocumentPublic(**doc))
+            docs.append(doc)
+        await content_store.attach(await get_database(), docs)
+        results = [DocumentPublic(**doc) for doc in docs]
         
         return SearchResponse(
             results=results,
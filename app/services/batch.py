@@ -0,0 +1,529 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import posixpath
+import time
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from bson import ObjectId
+from elasticsearch.helpers import async_bulk
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.models.schemas import FileType, ProcessingStatus
+from app.services.compute import BULK, compute_manager
+from app.services.content_store import content_store
+from app.services.dedup import DuplicateDetector, signature_to_binary
+from app.services.embeddings import decode_embedding, encode_embedding
+from app.services.extraction import extract_text
+from app.services.nlp import NLPService
+from app.services.sentiment import encode_sentiment_timeline
+from app.services.summarizer import SummarizerService
+from app.services.uploads import CHUNK_SIZE
+from app.services.vector_index import VectorIndex
+from app.utils.projection import FULL_PROJECTION
+from config.db import get_elasticsearch
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+
+_FILE_TYPES = {file_type.value for file_type in FileType}
+
+SKIPPED_SUMMARY = {"summary": None, "algorithm_used": None, "processing_time": 0.0, "compression_ratio": 0.0}
+
+
+@dataclass
+class BatchItem:
+    """One document of a batch request and what became of it"""
+    index: int
+    title: str
+    content: Optional[str] = None
+    file_type: str = FileType.TXT.value
+    source: Optional[str] = None
+    document_id: Optional[str] = None
+    status: ProcessingStatus = ProcessingStatus.PENDING
+    error: Optional[str] = None
+
+    def fail(self, error: Any) -> None:
+        self.status = ProcessingStatus.FAILED
+        self.error = str(error)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "title": self.title,
+            "source": self.source,
+            "document_id": self.document_id,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+def _is_hidden(name: str) -> bool:
+    return any(part.startswith((".", "__MACOSX")) for part in name.split("/"))
+
+
+def _copy_member(archive_path: str, member: str, destination: str, max_bytes: int) -> None:
+    """Copy one archive member to disk in chunks, refusing members that inflate past max_bytes"""
+    size = 0
+    with zipfile.ZipFile(archive_path) as archive, archive.open(member) as src, open(destination, "wb") as dst:
+        while chunk := src.read(CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError("File too large")
+            dst.write(chunk)
+
+
+def list_archive(path: Path, max_items: int, max_member_size: int) -> List[BatchItem]:
+    """One item per file in a zip archive, failing unsupported and oversized members up front"""
+    with zipfile.ZipFile(path) as archive:
+        members = [info for info in archive.infolist() if not info.is_dir() and not _is_hidden(info.filename)]
+    if len(members) > max_items:
+        raise ValueError(f"Archive holds {len(members)} files, the limit is {max_items}")
+
+    items = []
+    for index, info in enumerate(members):
+        stem, ext = posixpath.splitext(posixpath.basename(info.filename))
+        item = BatchItem(index=index, title=stem, source=info.filename)
+        items.append(item)
+        ext = ext.lower().lstrip(".")
+        if ext not in _FILE_TYPES:
+            item.fail("Unsupported file type")
+        elif info.file_size > max_member_size:
+            item.fail("File too large")
+        else:
+            item.file_type = ext
+    return items
+
+
+async def extract_member(path: Path, item: BatchItem, workdir: Path, max_member_size: int) -> None:
+    """Copy an item's archive member to a temporary file and extract its text into item.content"""
+    member_path = workdir / f"{ObjectId()}.{item.file_type}"
+    try:
+        await compute_manager.run(BULK, _copy_member, str(path), item.source, str(member_path), max_member_size)
+        item.content = await extract_text(str(member_path), FileType(item.file_type))
+    except Exception as e:
+        item.fail(f"Error extracting text: {e}")
+    finally:
+        if member_path.exists():
+            os.remove(member_path)
+
+
+class BatchProcessor:
+    """Ingests and analyses many documents with batched NLP and bulk writes.
+
+    insert() stores the pending documents with one insert_many; process()
+    works through them in chunks of `batch_chunk_size`. Each chunk is
+    checked for near-duplicates first, which reuse their original's
+    analyses; every analysis then runs once over the rest of the chunk
+    (spaCy pipe, batched embeddings, batched summaries, one topic-model
+    update), results are written back with one bulk_write and indexed with
+    the Elasticsearch bulk helper. When a batched call fails it is retried
+    item by item, so one bad document only fails itself. A retried job
+    skips the documents an earlier attempt completed.
+    """
+
+    def __init__(self, summarizer: SummarizerService, nlp: NLPService,
+                 duplicate_detector: DuplicateDetector, index: VectorIndex) -> None:
+        self.summarizer = summarizer
+        self.nlp = nlp
+        self.duplicate_detector = duplicate_detector
+        self.index = index
+
+    async def insert(self, db, user_id: str, items: Sequence[BatchItem]) -> List[BatchItem]:
+        """Store the text of every valid item and insert its pending document; returns the accepted items"""
+        accepted = [item for item in items if item.status != ProcessingStatus.FAILED]
+        if not accepted:
+            return []
+        hashes = await asyncio.gather(*(content_store.put(db, item.content) for item in accepted))
+
+        now = datetime.utcnow()
+        documents = []
+        for item, content_hash in zip(accepted, hashes):
+            documents.append({
+                "_id": ObjectId(item.document_id) if item.document_id else ObjectId(),
+                "title": item.title,
+                "content_hash": content_hash,
+                "content_size": len(item.content),
+                "file_type": item.file_type,
+                "processing_status": ProcessingStatus.PENDING,
+                "user_id": user_id,
+                "created_at": now,
+                "updated_at": now
+            })
+
+        failed: Dict[int, Dict[str, Any]] = {}
+        try:
+            await db.documents.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"]: error for error in e.details.get("writeErrors", [])}
+
+        for position, (item, document) in enumerate(zip(accepted, documents)):
+            item.content = None
+            error = failed.get(position)
+            if error is not None:
+                # The text reference taken above is not needed when the insert failed, or when
+                # the document already exists because an earlier attempt of the job inserted it
+                await content_store.release(db, document["content_hash"])
+                if error.get("code") != DUPLICATE_KEY:
+                    item.fail(error.get("errmsg", "Insert failed"))
+                    item.document_id = None
+                    continue
+            item.document_id = str(document["_id"])
+        return [item for item in accepted if item.document_id]
+
+    async def insert_archive(self, db, user_id: str, path: Path, items: Sequence[BatchItem],
+                             workdir: Path, max_member_size: int) -> List[BatchItem]:
+        """Extract and insert the archive members of a batch job, one chunk at a time.
+
+        The items carry the document ids handed out when the batch was
+        accepted, so members an earlier attempt already inserted are not
+        extracted again. Returns the items whose document exists.
+        """
+        ids = [ObjectId(item.document_id) for item in items]
+        existing = {str(doc["_id"]) async for doc in db.documents.find({"_id": {"$in": ids}}, {"_id": 1})}
+        inserted = [item for item in items if item.document_id in existing]
+        pending = [item for item in items if item.document_id not in existing]
+        for start in range(0, len(pending), settings.batch_chunk_size):
+            chunk = pending[start:start + settings.batch_chunk_size]
+            for item in chunk:
+                await extract_member(path, item, workdir, max_member_size)
+                if item.status == ProcessingStatus.FAILED:
+                    item.document_id = None
+            inserted.extend(await self.insert(db, user_id, chunk))
+        return sorted(inserted, key=lambda item: item.index)
+
+    @staticmethod
+    async def _batched(batch_call: Callable[[], Awaitable[List[Any]]],
+                       single_call: Callable[[int], Awaitable[Any]], count: int) -> List[Any]:
+        """Results of one batched call, falling back to per-item calls (exceptions kept per item)"""
+        try:
+            return list(await batch_call())
+        except Exception as e:
+            logger.warning(f"Batched call failed ({e}), retrying {count} items one by one")
+            return list(await asyncio.gather(*(single_call(i) for i in range(count)), return_exceptions=True))
+
+    async def _analyse(self, docs: List[Dict[str, Any]], algorithm: str, max_length: int,
+                       skip: set, timings: Dict[str, float]) -> Dict[str, List[Any]]:
+        texts = [doc["content"] for doc in docs]
+        titled = [doc["title"] + "\n" + doc["content"] for doc in docs]
+        user_ids = [doc["user_id"] for doc in docs]
+        summarizer, nlp = self.summarizer, self.nlp
+
+        async def topics_batch():
+            # Topic models are per user; a batch normally belongs to a single user
+            results: List[Any] = [None] * len(docs)
+            for user_id in set(user_ids):
+                positions = [i for i, owner in enumerate(user_ids) if owner == user_id]
+                assigned = await nlp.extract_topics_batch([texts[i] for i in positions], user_id)
+                for i, topics in zip(positions, assigned):
+                    results[i] = topics
+            return results
+
+        async def languages():
+            return [await nlp.identify_language(text) for text in texts]
+
+        calls = {
+            "summary": (lambda: summarizer.generate_summary_batch(texts, max_length, algorithm),
+                        lambda i: summarizer.generate_summary(texts[i], max_length, algorithm)),
+            "keywords": (lambda: nlp.extract_keywords_batch(texts),
+                         lambda i: nlp.extract_keywords(texts[i])),
+            "entities": (lambda: nlp.extract_entities_batch(texts),
+                         lambda i: nlp.extract_entities(texts[i])),
+            "sentiment": (lambda: nlp.analyze_sentiment_batch(texts),
+                          lambda i: nlp.analyze_sentiment(texts[i])),
+            "language": (languages, lambda i: nlp.identify_language(texts[i])),
+            "topics": (topics_batch, lambda i: nlp.extract_topics(texts[i], user_ids[i])),
+            "embedding": (lambda: nlp.embed_many(titled),
+                          lambda i: nlp.compute_embedding(titled[i])),
+        }
+        stages = [name for name in calls if name not in skip]
+
+        async def timed(name):
+            started = time.perf_counter()
+            batch_call, single_call = calls[name]
+            results = await self._batched(batch_call, single_call, len(docs))
+            timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+            return results
+
+        outputs = await asyncio.gather(*(timed(name) for name in stages))
+        return {name: list(output) for name, output in zip(stages, outputs)}
+
+    async def process(self, db, document_ids: List[str], algorithm: str, max_length: int,
+                      skip: Sequence[str] = ()) -> Dict[str, Any]:
+        """Analyse pending documents of a batch chunk by chunk and store the results; returns per-item outcomes"""
+        skip = set(skip)
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        outcomes: Dict[str, Dict[str, Any]] = {
+            document_id: {"document_id": document_id, "status": ProcessingStatus.COMPLETED, "error": None}
+            for document_id in document_ids
+        }
+        stored = {
+            str(doc["_id"]): doc
+            async for doc in db.documents.find(
+                {"_id": {"$in": [ObjectId(i) for i in document_ids]}},
+                {"processing_status": 1, "summary": 1, "tags": 1, "duplicate_of": 1}
+            )
+        }
+        pending = []
+        for document_id in document_ids:
+            doc = stored.get(document_id)
+            if doc is None:
+                outcomes[document_id].update(status=ProcessingStatus.FAILED, error="Document was deleted")
+            elif doc.get("processing_status") == ProcessingStatus.COMPLETED:
+                # Finished by an earlier attempt of the job; analysing it again would retrain its topics
+                outcomes[document_id].update(
+                    summary=doc.get("summary"), tags=doc.get("tags", []), duplicate_of=doc.get("duplicate_of")
+                )
+            else:
+                pending.append(document_id)
+
+        if pending:
+            await self.summarizer.initialize()
+            await self.nlp.initialize()
+        for start in range(0, len(pending), settings.batch_chunk_size):
+            chunk = pending[start:start + settings.batch_chunk_size]
+            await self._process_chunk(db, chunk, algorithm, max_length, skip, outcomes, timings)
+
+        return {
+            "items": list(outcomes.values()),
+            "stage_timings": {name: round(seconds, 4) for name, seconds in timings.items()},
+            "pipeline_time": time.perf_counter() - started
+        }
+
+    async def _find_duplicates(self, db, docs: List[Dict[str, Any]], signatures: List[Any],
+                               skip: set) -> List[Any]:
+        """(duplicate_of, similarity, original) per document; original is only set once it is completed.
+
+        Duplicates are checked in order and each signature is indexed right
+        away, so later items also match earlier items of the batch.
+        """
+        duplicates: List[Any] = [(None, None, None)] * len(docs)
+        for position, (doc, signature) in enumerate(zip(docs, signatures)):
+            document_id = str(doc["_id"])
+            if "duplicate" not in skip:
+                matches = await self.duplicate_detector.find_duplicates(db, doc["user_id"], signature, exclude=document_id)
+                if matches:
+                    original_id, similarity = matches[0]
+                    original = await db.documents.find_one({"_id": ObjectId(original_id), "user_id": doc["user_id"]})
+                    if original:
+                        reusable = original.get("processing_status") == ProcessingStatus.COMPLETED
+                        duplicates[position] = (
+                            original.get("duplicate_of") or original_id, similarity, original if reusable else None
+                        )
+            if "dedup_index" not in skip:
+                await self.duplicate_detector.add(db, doc["user_id"], document_id, signature)
+        return duplicates
+
+    @staticmethod
+    def _analysed_fields(results: Dict[str, Any]) -> Dict[str, Any]:
+        sentiment = results.get("sentiment")
+        language = results.get("language") or {"language": None, "confidence": None}
+        return {
+            "summary": results.get("summary") or SKIPPED_SUMMARY,
+            "tags": [kw["word"] for kw in (results.get("keywords") or [])[:5]],
+            "entities": [ent["text"] for ent in (results.get("entities") or [])[:10]],
+            "topics": [topic["label"] for topic in (results.get("topics") or [])],
+            "topic_ids": [topic["topic_id"] for topic in (results.get("topics") or [])],
+            "sentiment": sentiment["compound"] if sentiment else None,
+            "sentiment_timeline": encode_sentiment_timeline(sentiment.pop("sentence_scores")) if sentiment else None,
+            "language": language["language"],
+            "language_confidence": language["confidence"],
+            "embedding": results.get("embedding"),
+        }
+
+    @staticmethod
+    def _reused_fields(original: Dict[str, Any], skip: set) -> Dict[str, Any]:
+        """The original's analyses, minus the skipped stages; its summary is handled by the caller"""
+        def kept(stage: str, value: Any, default: Any = None) -> Any:
+            return default if stage in skip else value
+
+        stored_embedding = original.get("embedding")
+        return {
+            "tags": kept("keywords", original.get("tags", []), []),
+            "entities": kept("entities", original.get("entities", []), []),
+            "topics": kept("topics", original.get("topics", []), []),
+            "topic_ids": kept("topics", original.get("topic_ids", []), []),
+            "sentiment": kept("sentiment", original.get("sentiment")),
+            "sentiment_timeline": kept("sentiment", original.get("sentiment_timeline")),
+            "language": kept("language", original.get("language")),
+            "language_confidence": kept("language", original.get("language_confidence")),
+            "embedding": kept("embedding", decode_embedding(stored_embedding) if stored_embedding is not None else None),
+        }
+
+    async def _process_chunk(self, db, document_ids: List[str], algorithm: str, max_length: int, skip: set,
+                             outcomes: Dict[str, Dict[str, Any]], timings: Dict[str, float]) -> None:
+        def record(name: str, stage_started: float) -> None:
+            timings[name] = timings.get(name, 0.0) + time.perf_counter() - stage_started
+
+        by_id = {
+            str(doc["_id"]): doc
+            async for doc in db.documents.find({"_id": {"$in": [ObjectId(i) for i in document_ids]}}, FULL_PROJECTION)
+        }
+        for document_id in document_ids:
+            if document_id not in by_id:
+                outcomes[document_id].update(status=ProcessingStatus.FAILED, error="Document was deleted")
+        docs = [by_id[document_id] for document_id in document_ids if document_id in by_id]
+        if not docs:
+            return
+
+        await content_store.attach(db, docs)
+        await db.documents.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in docs]}},
+            {"$set": {"processing_status": ProcessingStatus.PROCESSING, "updated_at": datetime.utcnow()}}
+        )
+
+        stage_started = time.perf_counter()
+        signatures = await compute_manager.run(
+            BULK, lambda texts: [self.duplicate_detector.hasher.signature(text) for text in texts],
+            [doc["content"] for doc in docs]
+        )
+        record("signature", stage_started)
+
+        # Duplicates come first so that near-duplicates skip the analyses and reuse their original's
+        stage_started = time.perf_counter()
+        duplicates = await self._find_duplicates(db, docs, signatures, skip)
+        record("duplicate", stage_started)
+
+        fresh = [position for position, (_, _, original) in enumerate(duplicates) if original is None]
+        analyses = await self._analyse([docs[i] for i in fresh], algorithm, max_length, skip, timings) if fresh else {}
+        results_at = {position: {name: values[n] for name, values in analyses.items()} for n, position in enumerate(fresh)}
+
+        # A reused original keeps its summary only when it was made with the same settings
+        resummarize = [
+            position for position, (_, _, original) in enumerate(duplicates)
+            if original is not None and "summary" not in skip and not (
+                original.get("algorithm_used") == algorithm and original.get("summary_max_length") == max_length
+            )
+        ]
+        if resummarize:
+            stage_started = time.perf_counter()
+            texts = [docs[i]["content"] for i in resummarize]
+            summaries = await self._batched(
+                lambda: self.summarizer.generate_summary_batch(texts, max_length, algorithm),
+                lambda i: self.summarizer.generate_summary(texts[i], max_length, algorithm),
+                len(texts)
+            )
+            record("summary", stage_started)
+            for position, summary in zip(resummarize, summaries):
+                results_at[position] = {"summary": summary}
+
+        operations, operation_ids, embeddings, search_actions = [], [], [], []
+        now = datetime.utcnow()
+        for position, doc in enumerate(docs):
+            document_id = str(doc["_id"])
+            duplicate_of, similarity, original = duplicates[position]
+            results = results_at.get(position, {})
+            errors = [f"{name}: {value}" for name, value in results.items() if isinstance(value, Exception)]
+            operation_ids.append(document_id)
+            if errors:
+                outcomes[document_id].update(status=ProcessingStatus.FAILED, error="; ".join(errors))
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {
+                    "processing_status": ProcessingStatus.FAILED,
+                    "processing_error": outcomes[document_id]["error"],
+                    "updated_at": now
+                }}))
+                continue
+
+            if original is None:
+                fields = self._analysed_fields(results)
+            else:
+                fields = self._reused_fields(original, skip)
+                fields["summary"] = results.get("summary") or (SKIPPED_SUMMARY if "summary" in skip else {
+                    "summary": original.get("summary"),
+                    "algorithm_used": original.get("algorithm_used"),
+                    "processing_time": 0.0,
+                    "compression_ratio": original.get("compression_ratio", 0.0)
+                })
+            summary, embedding = fields.pop("summary"), fields.pop("embedding")
+            update = {
+                **fields,
+                "summary": summary["summary"],
+                "minhash": signature_to_binary(signatures[position]),
+                "embedding": encode_embedding(embedding, settings.embedding_storage_dtype) if embedding is not None else None,
+                "duplicate_of": duplicate_of,
+                "duplicate_similarity": similarity,
+                "processing_status": ProcessingStatus.COMPLETED,
+                "algorithm_used": summary["algorithm_used"],
+                "summary_max_length": max_length,
+                "processing_time": summary["processing_time"],
+                "compression_ratio": summary["compression_ratio"],
+                "updated_at": now
+            }
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+            if embedding is not None:
+                embeddings.append((document_id, doc["user_id"], embedding))
+            search_actions.append({
+                "_index": settings.elasticsearch_index,
+                "_id": document_id,
+                "_source": {
+                    "title": doc["title"],
+                    "content": doc["content"],
+                    "content_hash": doc["content_hash"],
+                    "summary": update["summary"],
+                    "tags": update["tags"],
+                    "entities": update["entities"],
+                    "topics": update["topics"],
+                    "user_id": doc["user_id"],
+                    "created_at": doc["created_at"].isoformat(),
+                    "file_type": doc.get("file_type"),
+                    "language": update["language"],
+                    "sentiment": update["sentiment"]
+                }
+            })
+            outcomes[document_id].update(summary=update["summary"], tags=update["tags"], duplicate_of=duplicate_of)
+
+        stage_started = time.perf_counter()
+        try:
+            await db.documents.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                outcomes[operation_ids[error["index"]]].update(
+                    status=ProcessingStatus.FAILED, error=error.get("errmsg", "Write failed")
+                )
+        record("store", stage_started)
+
+        written = {
+            document_id for document_id in operation_ids
+            if outcomes[document_id]["status"] == ProcessingStatus.COMPLETED
+        }
+        await self._index(docs, written, embeddings, search_actions, outcomes, skip, timings)
+
+    async def _index(self, docs, written, embeddings, search_actions, outcomes,
+                     skip: set, timings: Dict[str, float]) -> None:
+        """Add the stored documents to the duplicate, vector and search indexes"""
+        # Signatures went into the duplicate index during the duplicate pass; drop those not stored
+        for doc in docs:
+            if str(doc["_id"]) not in written:
+                self.duplicate_detector.remove(doc["user_id"], str(doc["_id"]))
+
+        embeddings = [entry for entry in embeddings if entry[0] in written]
+        if "vector_index" not in skip and embeddings:
+            stage_started = time.perf_counter()
+            ids, owners, vectors = zip(*embeddings)
+            await compute_manager.run(BULK, self.index.add, list(ids), np.stack(vectors), list(owners))
+            timings["vector_index"] = timings.get("vector_index", 0.0) + time.perf_counter() - stage_started
+
+        search_actions = [action for action in search_actions if action["_id"] in written]
+        if "search_index" not in skip and search_actions:
+            stage_started = time.perf_counter()
+            try:
+                es = await get_elasticsearch()
+                _, errors = await async_bulk(es, search_actions, raise_on_error=False)
+                for error in errors:
+                    detail = next(iter(error.values()))
+                    outcomes[detail["_id"]]["search_error"] = str(detail.get("error"))
+            except Exception as e:
+                logger.error(f"Elasticsearch bulk indexing failed: {e}")
+            timings["search_index"] = timings.get("search_index", 0.0) + time.perf_counter() - stage_started
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PROCESS = "process"
+
+_BLAS_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict):
+    """Run fn and report when it started and finished, so queue wait can be measured"""
+    started = time.time()
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        return started, time.time(), None, e
+    return started, time.time(), result, None
+
+
+def _limit_process_threads(threads: int) -> None:
+    """Initializer for worker processes so each one stays inside the thread budget"""
+    for var in _BLAS_ENV_VARS:
+        os.environ[var] = str(threads)
+
+
+class ManagedExecutor(Executor):
+    """Executor wrapper that records queue wait, busy time and utilization"""
+
+    def __init__(self, name: str, executor: Executor, workers: int) -> None:
+        self.name = name
+        self.workers = workers
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._created = time.time()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.busy_seconds = 0.0
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        outer: Future = Future()
+        submitted = time.time()
+        with self._lock:
+            self.submitted += 1
+
+        inner = self._executor.submit(_timed_call, fn, args, kwargs)
+        outer.add_done_callback(lambda f: f.cancelled() and inner.cancel())
+
+        def _done(future: Future) -> None:
+            try:
+                started, finished, result, error = future.result()
+            except BaseException as e:  # cancelled, or the pool itself broke
+                started, finished, result, error = submitted, submitted, None, e
+
+            with self._lock:
+                wait = max(0.0, started - submitted)
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+                self.busy_seconds += finished - started
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+            if not outer.set_running_or_notify_cancel():
+                return
+            if error is None:
+                outer.set_result(result)
+            else:
+                outer.set_exception(error)
+
+        inner.add_done_callback(_done)
+        return outer
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.completed + self.failed
+            uptime = max(time.time() - self._created, 1e-9)
+            return {
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "pending": self.submitted - finished,
+                "avg_queue_wait_seconds": self.total_wait / finished if finished else 0.0,
+                "max_queue_wait_seconds": self.max_wait,
+                "busy_seconds": self.busy_seconds,
+                "utilization": min(1.0, self.busy_seconds / (self.workers * uptime)),
+            }
+
+
+class ComputeManager:
+    """Owns every executor in the process and keeps them within one core budget.
+
+    The budget is split between an interactive pool (request path) and the
+    background share, which the bulk thread pool and the process pool divide
+    between them; torch and BLAS intra-op threads are sized so that all pools
+    together do not oversubscribe the cores. Every pool keeps at least one
+    worker, so only budgets below three cores are exceeded.
+    """
+
+    def __init__(self) -> None:
+        self.core_budget = settings.compute_core_budget or os.cpu_count() or 1
+        # Leave one worker each for the bulk and process pools
+        self.interactive_workers = min(
+            max(1, round(self.core_budget * settings.compute_interactive_share)),
+            max(1, self.core_budget - 2)
+        )
+        background = self.core_budget - self.interactive_workers
+        self.process_workers = min(
+            settings.compute_process_workers or max(1, background // 2),
+            max(1, background - 1)
+        )
+        self.bulk_workers = max(1, background - self.process_workers)
+        self.intra_op_threads = settings.compute_intra_op_threads or max(
+            1, self.core_budget // self.total_workers
+        )
+        self._pools: Dict[str, ManagedExecutor] = {}
+        self._lock = threading.Lock()
+        self._threads_configured = False
+
+    @property
+    def total_workers(self) -> int:
+        return self.interactive_workers + self.bulk_workers + self.process_workers
+
+    def configure_threads(self) -> None:
+        """Pin torch and BLAS thread pools to the intra-op budget"""
+        if self._threads_configured:
+            return
+        threads = self.intra_op_threads
+        for var in _BLAS_ENV_VARS:
+            os.environ[var] = str(threads)
+
+        try:
+            from threadpoolctl import threadpool_limits
+            threadpool_limits(limits=threads)
+        except ImportError:
+            logger.warning("threadpoolctl not available, BLAS thread limits apply to new processes only")
+
+        try:
+            import torch
+            torch.set_num_threads(threads)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                # Can only be set before torch runs any parallel work
+                pass
+        except ImportError:
+            pass
+
+        self._threads_configured = True
+        logger.info(
+            f"Compute budget: {self.core_budget} cores, {self.interactive_workers} interactive + "
+            f"{self.bulk_workers} bulk + {self.process_workers} process workers, {threads} intra-op threads"
+        )
+
+    def executor(self, name: str = INTERACTIVE) -> ManagedExecutor:
+        pool = self._pools.get(name)
+        if pool is not None:
+            return pool
+
+        with self._lock:
+            pool = self._pools.get(name)
+            if pool is None:
+                if name == INTERACTIVE:
+                    inner = ThreadPoolExecutor(max_workers=self.interactive_workers, thread_name_prefix="interactive")
+                    pool = ManagedExecutor(name, inner, self.interactive_workers)
+                elif name == BULK:
+                    inner = ThreadPoolExecutor(max_workers=self.bulk_workers, thread_name_prefix="bulk")
+                    pool = ManagedExecutor(name, inner, self.bulk_workers)
+                elif name == PROCESS:
+                    inner = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        initializer=_limit_process_threads,
+                        initargs=(self.intra_op_threads,)
+                    )
+                    pool = ManagedExecutor(name, inner, self.process_workers)
+                else:
+                    raise ValueError(f"Unknown executor: {name}")
+                self._pools[name] = pool
+        return pool
+
+    async def run(self, name: str, fn: Callable, *args: Any) -> Any:
+        """Run fn(*args) on the named pool from async code"""
+        return await asyncio.get_event_loop().run_in_executor(self.executor(name), fn, *args)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "core_budget": self.core_budget,
+            "intra_op_threads": self.intra_op_threads,
+            "pools": {name: pool.stats() for name, pool in self._pools.items()},
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            for pool in self._pools.values():
+                pool.shutdown(wait=wait)
+            self._pools.clear()
+
+
+compute_manager = ComputeManager()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from bson.binary import Binary
+from pymongo import ReturnDocument
+
+from app.services.compute import INTERACTIVE, compute_manager
+from config.settings import settings
+
+try:
+    import zstandard
+except ImportError:  # zlib is always available
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_text(text: str, codec: str = ZSTD) -> Tuple[str, bytes]:
+    """Compress text with the requested codec, falling back to zlib when zstandard is missing"""
+    raw = text.encode("utf-8")
+    if codec == ZSTD and zstandard is not None:
+        return ZSTD, zstandard.ZstdCompressor(level=settings.content_compression_level).compress(raw)
+    return ZLIB, zlib.compress(raw, min(settings.content_compression_level, 9))
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed content")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+class ContentStore:
+    """Content-addressed store for document text.
+
+    Each distinct text is stored once, compressed, under its SHA-256 digest
+    with a reference count, so re-uploads and identical documents of
+    different users share one copy. Documents keep only `content_hash` and
+    load the text when a caller actually needs it.
+    """
+
+    def __init__(self, collection_name: str = "contents") -> None:
+        self.collection_name = collection_name
+
+    async def put(self, db, text: str) -> str:
+        """Store text (or add a reference to an existing copy) and return its digest"""
+        collection = db[self.collection_name]
+        digest = content_digest(text)
+        result = await collection.update_one({"_id": digest}, {"$inc": {"refs": 1}})
+        if result.matched_count:
+            return digest
+
+        codec, data = await compute_manager.run(INTERACTIVE, compress_text, text, settings.content_store_codec)
+        await collection.update_one(
+            {"_id": digest},
+            {
+                "$setOnInsert": {
+                    "codec": codec,
+                    "data": Binary(data),
+                    "size": len(text),
+                    "compressed_size": len(data),
+                    "created_at": datetime.utcnow()
+                },
+                "$inc": {"refs": 1}
+            },
+            upsert=True
+        )
+        return digest
+
+    async def get_many(self, db, digests: Iterable[str]) -> Dict[str, str]:
+        digests = list(set(digests))
+        if not digests:
+            return {}
+        cursor = db[self.collection_name].find({"_id": {"$in": digests}}, {"codec": 1, "data": 1})
+        return {doc["_id"]: decompress_text(doc["codec"], doc["data"]) async for doc in cursor}
+
+    async def get(self, db, digest: str) -> str:
+        return (await self.get_many(db, [digest])).get(digest, "")
+
+    async def release(self, db, digest: str) -> None:
+        """Drop one reference and delete the text once nothing refers to it"""
+        collection = db[self.collection_name]
+        doc = await collection.find_one_and_update(
+            {"_id": digest}, {"$inc": {"refs": -1}},
+            projection={"refs": 1}, return_document=ReturnDocument.AFTER
+        )
+        if doc is not None and doc["refs"] <= 0:
+            await collection.delete_one({"_id": digest, "refs": {"$lte": 0}})
+
+    async def load_content(self, db, doc: Dict[str, Any]) -> str:
+        """Text of a document, whether stored inline (legacy) or in the store"""
+        if doc.get("content") is not None:
+            return doc["content"]
+        if doc.get("content_hash"):
+            return await self.get(db, doc["content_hash"])
+        return ""
+
+    async def attach(self, db, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in `content` for every document that only references the store, in one query"""
+        pending = [doc for doc in docs if doc.get("content") is None and doc.get("content_hash")]
+        texts = await self.get_many(db, (doc["content_hash"] for doc in pending))
+        for doc in pending:
+            doc["content"] = texts.get(doc["content_hash"], "")
+        return docs
+
+
+content_store = ContentStore()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import zlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from bson.binary import Binary
+
+from app.services.compute import INTERACTIVE, compute_manager
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORDS = re.compile(r"\w+")
+
+
+class MinHasher:
+    """MinHash signatures over word shingles using universal hashing"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1, block_size: int = 4096) -> None:
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.block_size = block_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        words = _WORDS.findall(text.lower())
+        k = self.shingle_size
+        if len(words) < k:
+            shingles: Iterable[str] = [" ".join(words)] if words else []
+        else:
+            shingles = (" ".join(words[i:i + k]) for i in range(len(words) - k + 1))
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64)
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """Return a fixed-width uint32 MinHash signature of the text"""
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        hashes = self.shingle_hashes(text)
+        # Process shingles in blocks so memory stays bounded for very long documents
+        for start in range(0, len(hashes), self.block_size):
+            block = hashes[start:start + self.block_size, np.newaxis]
+            permuted = ((block * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+
+def estimate_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.mean(a == b))
+
+
+def signature_to_binary(signature: np.ndarray) -> Binary:
+    return Binary(signature.astype("<u4").tobytes())
+
+
+def signature_from_binary(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<u4")
+
+
+class LSHIndex:
+    """Banded locality-sensitive hashing index over MinHash signatures"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 16) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by the number of bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = defaultdict(set)
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, signature: np.ndarray) -> None:
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].add(key)
+
+    def remove(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def query(self, signature: np.ndarray, threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """Return (key, estimated Jaccard similarity) of candidates above threshold, best first"""
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates |= self._buckets.get(band_key, set())
+
+        results = []
+        for key in candidates:
+            similarity = estimate_jaccard(signature, self._signatures[key])
+            if similarity >= threshold:
+                results.append((key, similarity))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results
+
+
+class DuplicateDetector:
+    """Per-user LSH indexes of document MinHash signatures, loaded lazily from MongoDB.
+
+    At most `cache_size` users' indexes are kept, least recently used evicted
+    first; an evicted index is rebuilt from the stored signatures on next use.
+    """
+
+    def __init__(self, cache_size: Optional[int] = None) -> None:
+        self.hasher = MinHasher(num_perm=settings.minhash_num_perm, shingle_size=settings.minhash_shingle_size)
+        self.cache_size = cache_size or settings.duplicate_index_cache_size
+        self._indexes: "OrderedDict[str, LSHIndex]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def signature(self, text: str) -> np.ndarray:
+        return await compute_manager.run(INTERACTIVE, self.hasher.signature, text)
+
+    async def _get_index(self, db, user_id: str) -> LSHIndex:
+        index = self._indexes.get(user_id)
+        if index is not None:
+            self._indexes.move_to_end(user_id)
+            return index
+
+        async with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                index = LSHIndex(num_perm=settings.minhash_num_perm, bands=settings.minhash_bands)
+                cursor = db.documents.find(
+                    {"user_id": user_id, "minhash": {"$exists": True}},
+                    {"minhash": 1}
+                )
+                async for doc in cursor:
+                    index.add(str(doc["_id"]), signature_from_binary(doc["minhash"]))
+                self._indexes[user_id] = index
+                while len(self._indexes) > self.cache_size:
+                    self._indexes.popitem(last=False)
+        return index
+
+    async def find_duplicates(self, db, user_id: str, signature: np.ndarray,
+                              threshold: Optional[float] = None,
+                              exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        index = await self._get_index(db, user_id)
+        matches = index.query(signature, settings.duplicate_threshold if threshold is None else threshold)
+        return [(key, similarity) for key, similarity in matches if key != exclude]
+
+    async def add(self, db, user_id: str, document_id: str, signature: np.ndarray) -> None:
+        index = await self._get_index(db, user_id)
+        index.add(document_id, signature)
+
+    def remove(self, user_id: str, document_id: str) -> None:
+        index = self._indexes.get(user_id)
+        if index is not None:
+            index.remove(document_id)
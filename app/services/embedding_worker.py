@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.services.compute import BULK, compute_manager
+from app.services.content_store import content_digest
+from app.services.embeddings import encode_embedding
+from app.services.nlp import NLPService
+from app.services.vector_index import VectorIndex
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def article_text(article: dict) -> str:
+    return (article.get("title") or "") + "\n" + (article.get("content") or "")
+
+
+class EmbeddingWorker:
+    """Background worker that embeds and keyword-tags articles in batches.
+
+    Articles are inserted unsearchable and queued here; the worker groups
+    whatever is queued (up to `batch_size`, waiting at most `max_wait`
+    seconds for a batch to fill), encodes the batch in one model call and
+    writes keywords and embeddings back with a single bulk write. Each write
+    only applies while the article still has the content hash of the text
+    that was embedded, so an article edited or deleted meanwhile is left to
+    its newer job. When an index is given, the stored vectors are added to it.
+    """
+
+    def __init__(self, collection, nlp: NLPService, index: Optional[VectorIndex] = None,
+                 batch_size: int = 32, max_wait: float = 0.5) -> None:
+        self.collection = collection
+        self.nlp = nlp
+        self.index = index
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def enqueue(self, article_id: ObjectId, text: str) -> None:
+        self.start()
+        self._queue.put_nowait((article_id, text))
+
+    async def requeue_pending(self) -> int:
+        """Queue articles left unsearchable by a previous run"""
+        count = 0
+        async for article in self.collection.find({"searchable": False}, {"title": 1, "content": 1}):
+            self.enqueue(article["_id"], article_text(article))
+            count += 1
+        if count:
+            logger.info(f"Re-queued {count} articles for embedding")
+        return count
+
+    async def _next_batch(self) -> List[Tuple[ObjectId, str]]:
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_event_loop().time() + self.max_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - asyncio.get_event_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.process_batch(batch)
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(batch)} articles failed: {e}")
+
+    async def process_batch(self, batch: List[Tuple[ObjectId, str]]) -> None:
+        texts = [text for _, text in batch]
+        hashes = [content_digest(text) for text in texts]
+        embeddings = await self.nlp.embed_many(texts)
+        keywords = await self.nlp.extract_keywords_batch(texts)
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": article_id, "content_hash": text_hash},
+                {"$set": {
+                    "keywords": [kw["word"] for kw in article_keywords],
+                    "embedding": encode_embedding(embedding, settings.embedding_storage_dtype),
+                    "searchable": True,
+                    "embedded_at": now
+                }}
+            )
+            for (article_id, _), text_hash, embedding, article_keywords in zip(batch, hashes, embeddings, keywords)
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        if self.index is None:
+            return
+
+        stored = list(range(len(batch)))
+        if result.matched_count < len(batch):
+            current = {}
+            async for article in self.collection.find(
+                {"_id": {"$in": [article_id for article_id, _ in batch]}}, {"content_hash": 1}
+            ):
+                current[article["_id"]] = article.get("content_hash")
+            stored = [i for i, ((article_id, _), text_hash) in enumerate(zip(batch, hashes))
+                      if current.get(article_id) == text_hash]
+        if stored:
+            ids = [str(batch[i][0]) for i in stored]
+            await compute_manager.run(BULK, self.index.add, ids, np.asarray(embeddings)[stored])
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from bson.binary import Binary
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str, model_name: str) -> str:
+    """Stable cache key for an embedding of `text` produced by `model_name`"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize row vectors so cosine similarity becomes a dot product"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+# Stored embeddings are an 8-byte header (format code, 3 pad bytes, float32
+# scale) followed by little-endian float16 or int8 components
+_HEADER = np.dtype([("format", "u1"), ("pad", "u1", 3), ("scale", "<f4")])
+_FORMATS = {"float16": (1, np.dtype("<f2")), "int8": (2, np.dtype("i1"))}
+_DTYPES = {code: dtype for code, dtype in _FORMATS.values()}
+
+
+def encode_embedding(vector: np.ndarray, dtype: str = "float16") -> Binary:
+    """Pack an embedding into a compact BSON binary blob.
+
+    int8 stores round(v / scale) with scale = max|v| / 127, which keeps cosine
+    similarity of unit vectors within about 1e-3 at a quarter of float32 size.
+    """
+    code, stored_dtype = _FORMATS[dtype]
+    vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+    scale = 1.0
+    if dtype == "int8":
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        data = np.round(vector / scale).astype(stored_dtype)
+    else:
+        data = vector.astype(stored_dtype)
+
+    header = np.zeros(1, dtype=_HEADER)
+    header["format"] = code
+    header["scale"] = scale
+    return Binary(header.tobytes() + data.tobytes())
+
+
+def decode_embedding(value) -> np.ndarray:
+    """Decode a stored embedding to float32; legacy lists of floats are accepted too"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        header = np.frombuffer(value, dtype=_HEADER, count=1)[0]
+        data = np.frombuffer(value, dtype=_DTYPES[int(header["format"])], offset=_HEADER.itemsize)
+        scale = float(header["scale"])
+        vector = data.astype(np.float32)
+        return vector * scale if scale != 1.0 else vector
+    return np.asarray(value, dtype=np.float32)
+
+
+def decode_embeddings(values: Sequence) -> np.ndarray:
+    """Decode many stored embeddings into one (n, dim) float32 matrix.
+
+    Blobs of one format and length are concatenated and viewed as a single
+    structured array, so the whole batch is converted in one NumPy call.
+    """
+    if not values:
+        return np.zeros((0, 0), dtype=np.float32)
+    first = values[0]
+    if isinstance(first, (bytes, bytearray, memoryview)) and all(
+        isinstance(value, (bytes, bytearray, memoryview)) and len(value) == len(first) and value[0] == first[0]
+        for value in values
+    ):
+        dtype = _DTYPES[first[0]]
+        dim = (len(first) - _HEADER.itemsize) // dtype.itemsize
+        rows = np.frombuffer(b"".join(values), dtype=np.dtype([("header", _HEADER), ("data", dtype, dim)]))
+        return rows["data"].astype(np.float32) * rows["header"]["scale"][:, None]
+    return np.stack([decode_embedding(value) for value in values])
+
+
+class EmbeddingStore:
+    """Append-only, memory-mapped float16 embedding store keyed by content hash.
+
+    Vectors live in `<path>` as a (capacity, dim) float16 matrix and the key of
+    each row is appended, one per line, to `<path>.keys`, so reopening the store
+    only has to read the key file.
+    """
+
+    def __init__(self, path: str | Path, dim: int, initial_capacity: int = 1024) -> None:
+        self.path = Path(path)
+        self.dim = dim
+        self._keys_path = self.path.with_name(self.path.name + ".keys")
+        self._initial_capacity = initial_capacity
+        self._index: Dict[str, int] = {}
+        self._matrix: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._keys_path.exists():
+            with open(self._keys_path, "r", encoding="utf-8") as fh:
+                for row, line in enumerate(fh):
+                    self._index[line.strip()] = row
+        self._ensure_capacity(max(len(self._index), 1))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def _ensure_capacity(self, rows: int) -> None:
+        # Readers may hold the current mapping, so the grown file is mapped first
+        # and swapped in with a single assignment; `_matrix` is never None after init.
+        row_bytes = self.dim * np.dtype(np.float16).itemsize
+        current = self.path.stat().st_size // row_bytes if self.path.exists() else 0
+        if self._matrix is not None and self._matrix.shape[0] >= rows:
+            return
+
+        capacity = max(rows, current, self._initial_capacity)
+        if self._matrix is not None:
+            capacity = max(capacity, 2 * self._matrix.shape[0])
+            self._matrix.flush()
+
+        with open(self.path, "a+b") as fh:
+            if current < capacity:
+                fh.truncate(capacity * row_bytes)
+        self._matrix = np.memmap(self.path, dtype=np.float16, mode="r+", shape=(capacity, self.dim))
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._index.get(key)
+            if row is None:
+                return None
+            return np.asarray(self._matrix[row], dtype=np.float32)
+
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        with self._lock:
+            pending: Dict[str, np.ndarray] = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._index and key not in pending:
+                    pending[key] = vector
+            if not pending:
+                return
+
+            # Rows are written and flushed before their keys reach the key file or
+            # the index, so neither a reader nor a reopened store sees an empty row.
+            start = len(self._index)
+            self._ensure_capacity(start + len(pending))
+            for offset, vector in enumerate(pending.values()):
+                self._matrix[start + offset] = np.asarray(vector).astype(np.float16)
+            self._matrix.flush()
+
+            with open(self._keys_path, "a", encoding="utf-8") as fh:
+                fh.write("".join(f"{key}\n" for key in pending))
+            for offset, key in enumerate(pending):
+                self._index[key] = start + offset
+
+    def flush(self) -> None:
+        with self._lock:
+            self._matrix.flush()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embeddings bounded by total bytes, optionally backed by an EmbeddingStore"""
+
+    def __init__(self, max_bytes: int, store: Optional[EmbeddingStore] = None) -> None:
+        self.max_bytes = max_bytes
+        self.store = store
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, key: str, vector: np.ndarray) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        if vector.nbytes > self.max_bytes:
+            return
+        self._entries[key] = vector
+        self.current_bytes += vector.nbytes
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        results: List[Optional[np.ndarray]] = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                elif self.store is not None:
+                    vector = self.store.get(key)
+                    if vector is not None:
+                        self._insert(key, vector)
+
+                if vector is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self.store is not None:
+                self.store.put_many(keys, vectors)
+            for key, vector in zip(keys, vectors):
+                self._insert(key, vector.copy())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "persisted": len(self.store) if self.store is not None else 0,
+        }
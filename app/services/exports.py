@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import re
+import zipfile
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterator, List
+from urllib.parse import quote
+
+from app.services.compute import BULK, compute_manager
+from app.services.content_store import content_store
+
+# Characters of text encoded and sent per response chunk
+EXPORT_CHUNK_CHARS = 64 * 1024
+
+# Documents fetched from the cursor, and whose text is loaded, per round trip
+EXPORT_BATCH_SIZE = 100
+
+_UNSAFE_FILENAME = re.compile(r'[^\w\- .]+')
+
+
+def export_filename(title: str, suffix: str) -> str:
+    name = _UNSAFE_FILENAME.sub("_", title or "").strip(" ._") or "document"
+    return f"{name[:100]}{suffix}"
+
+
+def content_disposition(filename: str) -> str:
+    """Attachment header with an ASCII fallback and the UTF-8 name (RFC 6266)"""
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace("?", "_").replace('"', "_")
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+def export_header(doc: Dict[str, Any]) -> str:
+    """Plain-text export of a document up to its original content"""
+    header = f"Document: {doc['title']}\n"
+    header += f"Created: {doc['created_at'].strftime('%Y-%m-%d %H:%M:%S')}\n"
+    header += f"File Type: {doc.get('file_type', 'Unknown')}\n"
+    header += f"Language: {doc.get('language', 'Unknown')}\n"
+    header += f"Algorithm: {doc.get('algorithm_used', 'Unknown')}\n\n"
+    header += f"SUMMARY:\n{doc.get('summary', 'No summary available')}\n\n"
+
+    if doc.get('tags'):
+        header += f"TAGS: {', '.join(doc['tags'])}\n\n"
+
+    if doc.get('entities'):
+        header += f"ENTITIES: {', '.join(doc['entities'])}\n\n"
+
+    return header + "ORIGINAL CONTENT:\n"
+
+
+def iter_text_export(doc: Dict[str, Any], content: str) -> Iterator[bytes]:
+    """Encoded text export in bounded chunks, so the full export is never built as one string"""
+    yield export_header(doc).encode("utf-8")
+    for start in range(0, len(content), EXPORT_CHUNK_CHARS):
+        yield content[start:start + EXPORT_CHUNK_CHARS].encode("utf-8")
+
+
+async def iter_with_content(db, cursor, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+    """Documents of a cursor with their text attached, loading the store one batch at a time"""
+    batch: List[Dict[str, Any]] = []
+    async for doc in cursor.batch_size(batch_size):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            for loaded in await content_store.attach(db, batch):
+                yield loaded
+            batch = []
+    if batch:
+        for loaded in await content_store.attach(db, batch):
+            yield loaded
+
+
+async def iter_ndjson(records: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """One JSON object per line; pydantic models are dumped with their own serializer"""
+    async for record in records:
+        if hasattr(record, "model_dump_json"):
+            line = record.model_dump_json()
+        else:
+            line = json.dumps(record, default=str, ensure_ascii=False)
+        yield (line + "\n").encode("utf-8")
+
+
+class _ZipSink:
+    """Write-only file object that holds what ZipFile writes until it is drained.
+
+    It has no tell() or seek(), so ZipFile writes each member with a data
+    descriptor after its data and never goes back to patch a header. That
+    lets the archive be sent while it is being built.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _write_member(archive: zipfile.ZipFile, name: str, doc: Dict[str, Any]) -> None:
+    modified = doc.get("created_at") or datetime.utcnow()
+    info = zipfile.ZipInfo(name, date_time=modified.timetuple()[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with archive.open(info, "w") as member:
+        for part in iter_text_export(doc, doc.get("content") or ""):
+            member.write(part)
+
+
+async def iter_zip(docs: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Zip of one text export per document, streamed member by member.
+
+    Compression runs on the bulk pool; only the member being compressed
+    and its compressed bytes are held in memory.
+    """
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED)
+    async for doc in docs:
+        name = export_filename(doc["title"], f"_{doc['_id']}.txt")
+        await compute_manager.run(BULK, _write_member, archive, name, doc)
+        data = sink.drain()
+        if data:
+            yield data
+    archive.close()
+    yield sink.drain()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+from collections import deque
+from typing import AsyncIterator, Iterator, List, Optional
+
+import aiofiles
+
+from app.models.schemas import FileType
+from app.services.compute import BULK, PROCESS, compute_manager
+from app.services.ooxml import docx_blocks, pptx_slide_count, pptx_slides
+
+logger = logging.getLogger(__name__)
+
+# PDFs are split into ranges of this many pages, each extracted in its own process
+PAGES_PER_TASK = 16
+
+# Streamed PDFs longer than this are extracted in parallel page ranges instead of page by page
+PARALLEL_PDF_PAGES = 2 * PAGES_PER_TASK
+
+# Plain text is cut into blocks at blank lines, or at this size when there are none
+TEXT_BLOCK_CHARS = 64 * 1024
+
+_DONE = object()
+
+
+def pdf_page_count(path: str) -> int:
+    import PyPDF2
+    with open(path, "rb") as fh:
+        return len(PyPDF2.PdfReader(fh).pages)
+
+
+def extract_pdf_pages(path: str, start: int, stop: int) -> List[str]:
+    """Text of pages [start, stop); each worker opens the file itself so nothing large is pickled"""
+    import PyPDF2
+    with open(path, "rb") as fh:
+        reader = PyPDF2.PdfReader(fh)
+        return [reader.pages[i].extract_text() or "" for i in range(start, min(stop, len(reader.pages)))]
+
+
+def extract_docx(path: str) -> str:
+    return "\n".join(docx_blocks(path))
+
+
+def extract_pptx(path: str) -> str:
+    return "\n".join(pptx_slides(path))
+
+
+def extract_text_sync(path: str, file_type: str) -> str:
+    """Extract the whole file in the calling thread"""
+    if file_type == FileType.PDF.value:
+        return "\n".join(extract_pdf_pages(path, 0, pdf_page_count(path)))
+    if file_type == FileType.DOCX.value:
+        return extract_docx(path)
+    if file_type == FileType.PPTX.value:
+        return extract_pptx(path)
+    with open(path, "r", encoding="utf-8") as fh:
+        return fh.read()
+
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    import PyPDF2
+    with open(path, "rb") as fh:
+        for page in PyPDF2.PdfReader(fh).pages:
+            yield page.extract_text() or ""
+
+
+def iter_text_blocks(path: str, block_chars: int = TEXT_BLOCK_CHARS) -> Iterator[str]:
+    """Paragraphs of a text file, read line by line"""
+    lines: List[str] = []
+    size = 0
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip() or size >= block_chars:
+                if lines:
+                    yield "".join(lines)
+                lines, size = [], 0
+            lines.append(line)
+            size += len(line)
+    if lines:
+        yield "".join(lines)
+
+
+def iter_blocks(path: str, file_type: str) -> Iterator[str]:
+    """Lazily yield a file's text one page, slide or paragraph at a time"""
+    if file_type == FileType.PDF.value:
+        return iter_pdf_pages(path)
+    if file_type == FileType.DOCX.value:
+        return docx_blocks(path)
+    if file_type == FileType.PPTX.value:
+        return pptx_slides(path)
+    return iter_text_blocks(path)
+
+
+def count_blocks(path: str, file_type: str) -> Optional[int]:
+    """Number of blocks iter_blocks will yield when it is cheap to know up front"""
+    if file_type == FileType.PDF.value:
+        return pdf_page_count(path)
+    if file_type == FileType.PPTX.value:
+        return pptx_slide_count(path)
+    return None
+
+
+async def _stream_iter_blocks(path: str, file_type: FileType) -> AsyncIterator[str]:
+    blocks = iter_blocks(path, file_type.value)
+    try:
+        while True:
+            block = await compute_manager.run(BULK, next, blocks, _DONE)
+            if block is _DONE:
+                return
+            yield block
+    finally:
+        # A cancelled request may leave next() running on the pool; it finishes on its own
+        with contextlib.suppress(ValueError):
+            blocks.close()
+
+
+async def stream_pdf_pages(path: str, page_count: int, pages_per_task: int = PAGES_PER_TASK) -> AsyncIterator[str]:
+    """Pages of a PDF in order, with the next page ranges extracted ahead in worker processes.
+
+    One range per process worker is in flight at a time, so a slow consumer
+    holds at most that many ranges of pages in memory.
+    """
+    starts = iter(range(0, page_count, pages_per_task))
+    pending: deque = deque()
+
+    def submit(count: int) -> None:
+        for start in itertools.islice(starts, count):
+            pending.append(asyncio.ensure_future(
+                compute_manager.run(PROCESS, extract_pdf_pages, path, start, start + pages_per_task)
+            ))
+
+    submit(compute_manager.process_workers)
+    try:
+        while pending:
+            pages = await pending.popleft()
+            submit(1)
+            for page in pages:
+                yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def stream_blocks(path: str, file_type: FileType, page_count: Optional[int] = None) -> AsyncIterator[str]:
+    """Async view of iter_blocks that keeps the event loop free.
+
+    Blocks are parsed one at a time on the bulk pool, except PDFs whose
+    `page_count` (from count_blocks) exceeds PARALLEL_PDF_PAGES, which are
+    read through stream_pdf_pages on the process pool.
+    """
+    if file_type == FileType.PDF and page_count and page_count > PARALLEL_PDF_PAGES:
+        blocks = stream_pdf_pages(path, page_count)
+    else:
+        blocks = _stream_iter_blocks(path, file_type)
+    try:
+        async for block in blocks:
+            if block.strip():
+                yield block
+    finally:
+        await blocks.aclose()
+
+
+async def extract_pdf(path: str, pages_per_task: int = PAGES_PER_TASK) -> str:
+    """Extract a PDF with page ranges spread over the process pool, joined in page order"""
+    page_count = await compute_manager.run(PROCESS, pdf_page_count, path)
+    ranges = [(start, start + pages_per_task) for start in range(0, page_count, pages_per_task)]
+    chunks = await asyncio.gather(*(
+        compute_manager.run(PROCESS, extract_pdf_pages, path, start, stop) for start, stop in ranges
+    ))
+    return "\n".join(page for chunk in chunks for page in chunk)
+
+
+async def extract_text(path: str, file_type: FileType) -> str:
+    """Extract text off the event loop; parsing runs in worker processes"""
+    if file_type == FileType.PDF:
+        return await extract_pdf(path)
+    if file_type == FileType.DOCX:
+        return await compute_manager.run(PROCESS, extract_docx, path)
+    if file_type == FileType.PPTX:
+        return await compute_manager.run(PROCESS, extract_pptx, path)
+    if file_type == FileType.TXT:
+        async with aiofiles.open(path, "r", encoding="utf-8") as fh:
+            return await fh.read()
+    return ""
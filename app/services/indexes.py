@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Declared indexes per collection, shaped after the queries the routes run:
+# every listing filters on user_id and sorts on created_at, title or file_size
+# with _id as the keyset tiebreaker (pagination.sort_spec), so the listing
+# indexes end in _id to return pages in order without an in-memory sort
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "documents": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                   name="user_created_id"),
+        IndexModel([("user_id", ASCENDING), ("title", ASCENDING), ("_id", ASCENDING)], name="user_title_id"),
+        IndexModel([("user_id", ASCENDING), ("file_size", DESCENDING), ("_id", DESCENDING)],
+                   name="user_file_size_id"),
+        IndexModel([("user_id", ASCENDING), ("tags", ASCENDING)], name="user_tags"),
+        IndexModel([("user_id", ASCENDING), ("topics", ASCENDING)], name="user_topics"),
+        # Fallback for the listing search when Elasticsearch is down. It covers the fields stored on
+        # the document; the text itself lives in the content store and is only searched through
+        # Elasticsearch. The user_id prefix keeps each lookup inside one library; language_override
+        # points at an unused field because the documents' own `language` holds codes MongoDB's
+        # text search does not support
+        IndexModel(
+            [("user_id", ASCENDING), ("title", TEXT), ("summary", TEXT), ("tags", TEXT),
+             ("entities", TEXT), ("topics", TEXT)],
+            name="user_text",
+            weights={"title": 10, "summary": 5, "tags": 5, "entities": 2, "topics": 2},
+            default_language="english",
+            language_override="text_language",
+        ),
+    ],
+    "feedback": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created"),
+        IndexModel([("user_id", ASCENDING), ("document_id", ASCENDING), ("created_at", DESCENDING)],
+                   name="user_document_created"),
+    ],
+    "uploads": [
+        IndexModel([("sha256", ASCENDING), ("created_at", DESCENDING)], name="sha256_created"),
+    ],
+    "jobs": [
+        IndexModel([("status", ASCENDING), ("run_after", ASCENDING)], name="status_run_after"),
+    ],
+    "articles": [
+        IndexModel([("title", TEXT), ("content", TEXT)], name="title_content_text"),
+        IndexModel([("searchable", ASCENDING)], name="searchable"),
+    ],
+}
+
+
+def _key(spec: Dict[str, Any]) -> tuple:
+    """Comparable key pattern of a declared IndexModel document or an index_information() entry.
+
+    The server reports a text index as ("_fts", "text"), ("_ftsx", 1) and
+    keeps its fields in `weights`, while a declaration lists the fields, so
+    both forms are reduced to their other fields plus one ("$text", weights).
+    """
+    key = spec["key"]
+    fields = list(key.items()) if isinstance(key, dict) else [tuple(field) for field in key]
+    plain = tuple((field, kind) for field, kind in fields if kind != TEXT and field != "_ftsx")
+    if len(plain) == len(fields):
+        return plain
+    weights = {field: 1 for field, kind in fields if kind == TEXT and field != "_fts"}
+    weights.update(spec.get("weights") or {})
+    return plain + (("$text", tuple(sorted(weights.items()))),)
+
+
+class IndexManager:
+    """Creates the declared MongoDB indexes and reports drift from them.
+
+    Creation is idempotent: indexes that already exist by name or key are
+    skipped, so it is safe to run on every startup.
+    """
+
+    def __init__(self, indexes: Optional[Dict[str, List[IndexModel]]] = None) -> None:
+        self.indexes = indexes if indexes is not None else INDEXES
+        self._tasks: List[asyncio.Task] = []
+
+    def _missing(self, name: str, existing: Dict[str, Any]) -> List[IndexModel]:
+        existing_keys = {_key(info) for info in existing.values()}
+        return [
+            model for model in self.indexes[name]
+            if model.document["name"] not in existing and _key(model.document) not in existing_keys
+        ]
+
+    async def ensure_indexes(self, db, collections: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """Create missing indexes and return the names created per collection"""
+        created: Dict[str, List[str]] = {}
+        for name in collections or list(self.indexes):
+            collection = db[name]
+            for model in self._missing(name, await collection.index_information()):
+                try:
+                    await collection.create_indexes([model])
+                    created.setdefault(name, []).append(model.document["name"])
+                except OperationFailure as e:
+                    logger.error(f"Could not create index {name}.{model.document['name']}: {e}")
+        if created:
+            logger.info(f"Created MongoDB indexes: {created}")
+        return created
+
+    async def _ensure_in_background(self, db, collections: Optional[List[str]]) -> None:
+        try:
+            await self.ensure_indexes(db, collections)
+        except Exception as e:
+            logger.error(f"Index creation failed: {e}")
+
+    def start(self, db, collections: Optional[List[str]] = None) -> asyncio.Task:
+        """Build indexes in the background so startup does not wait on large collections"""
+        task = asyncio.create_task(self._ensure_in_background(db, collections))
+        self._tasks.append(task)
+        return task
+
+    async def report(self, db, collections: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Declared indexes that are missing, undeclared ones and ones never used since the server started"""
+        report: Dict[str, Dict[str, Any]] = {}
+        for name in collections or list(self.indexes):
+            collection = db[name]
+            existing = await collection.index_information()
+            declared = {model.document["name"] for model in self.indexes[name]}
+            declared_keys = {_key(model.document) for model in self.indexes[name]}
+
+            usage: Dict[str, int] = {}
+            try:
+                async for row in collection.aggregate([{"$indexStats": {}}]):
+                    usage[row["name"]] = row["accesses"]["ops"]
+            except OperationFailure:
+                pass  # $indexStats needs clusterMonitor rights
+
+            report[name] = {
+                "missing": sorted(model.document["name"] for model in self._missing(name, existing)),
+                "undeclared": sorted(
+                    index for index, info in existing.items()
+                    if index not in declared and _key(info) not in declared_keys and index != "_id_"
+                ),
+                "unused": sorted(index for index, ops in usage.items() if ops == 0 and index != "_id_"),
+            }
+        return report
+
+
+index_manager = IndexManager()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.models.schemas import ProcessingStatus
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def retry_delay(attempts: int, base: float) -> float:
+    """Exponential backoff after the given number of failed attempts"""
+    return base * 2 ** max(0, attempts - 1)
+
+
+class JobQueue:
+    """Durable job queue on a MongoDB collection.
+
+    A job is claimed with one atomic find_one_and_update that sets a lease;
+    the worker renews the lease while it runs. A job whose lease runs out,
+    because its worker died, becomes claimable again, and failures are
+    retried with exponential backoff until `max_attempts` is reached.
+    """
+
+    def __init__(self, collection_name: str = "jobs") -> None:
+        self.collection_name = collection_name
+
+    async def enqueue(self, db, kind: str, payload: Dict[str, Any], user_id: Optional[str] = None,
+                      max_attempts: Optional[int] = None) -> str:
+        now = datetime.utcnow()
+        result = await db[self.collection_name].insert_one({
+            "kind": kind,
+            "payload": payload,
+            "user_id": user_id,
+            "status": ProcessingStatus.PENDING.value,
+            "attempts": 0,
+            "max_attempts": max_attempts or settings.job_max_attempts,
+            "run_after": now,
+            "lease_until": None,
+            "worker": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        })
+        return str(result.inserted_id)
+
+    async def claim(self, db, worker: str, kinds: List[str]) -> Optional[Dict[str, Any]]:
+        """Atomically take the oldest runnable job, or one whose lease has expired"""
+        now = datetime.utcnow()
+        return await db[self.collection_name].find_one_and_update(
+            {
+                "kind": {"$in": kinds},
+                "$or": [
+                    {"status": ProcessingStatus.PENDING.value, "run_after": {"$lte": now}},
+                    {"status": ProcessingStatus.PROCESSING.value, "lease_until": {"$lt": now}},
+                ],
+                "$expr": {"$lt": ["$attempts", "$max_attempts"]}
+            },
+            {
+                "$set": {
+                    "status": ProcessingStatus.PROCESSING.value,
+                    "worker": worker,
+                    "lease_until": now + timedelta(seconds=settings.job_lease_seconds),
+                    "started_at": now,
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("run_after", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def renew(self, db, job: Dict[str, Any]) -> bool:
+        """Extend the lease; False once another worker has taken the job over"""
+        now = datetime.utcnow()
+        result = await db[self.collection_name].update_one(
+            {"_id": job["_id"], "worker": job["worker"], "status": ProcessingStatus.PROCESSING.value},
+            {"$set": {"lease_until": now + timedelta(seconds=settings.job_lease_seconds), "updated_at": now}}
+        )
+        return result.matched_count == 1
+
+    async def complete(self, db, job: Dict[str, Any], result: Any = None) -> bool:
+        """Store the result; False if the job was taken over by another worker meanwhile"""
+        now = datetime.utcnow()
+        outcome = await db[self.collection_name].update_one(
+            {"_id": job["_id"], "worker": job["worker"], "status": ProcessingStatus.PROCESSING.value},
+            {"$set": {
+                "status": ProcessingStatus.COMPLETED.value,
+                "result": result,
+                "error": None,
+                "lease_until": None,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+        return outcome.matched_count == 1
+
+    async def fail(self, db, job: Dict[str, Any], error: str) -> bool:
+        """Schedule a retry, or mark the job failed once its attempts are used up.
+        
+        True if this was the final attempt and this worker still held the job.
+        """
+        now = datetime.utcnow()
+        final = job["attempts"] >= job["max_attempts"]
+        update = {"error": error, "lease_until": None, "updated_at": now}
+        if final:
+            update.update(status=ProcessingStatus.FAILED.value, finished_at=now)
+        else:
+            delay = retry_delay(job["attempts"], settings.job_retry_backoff_seconds)
+            update.update(status=ProcessingStatus.PENDING.value, run_after=now + timedelta(seconds=delay))
+        outcome = await db[self.collection_name].update_one(
+            {"_id": job["_id"], "worker": job["worker"], "status": ProcessingStatus.PROCESSING.value},
+            {"$set": update}
+        )
+        return final and outcome.matched_count == 1
+
+    async def expire_exhausted(self, db) -> List[Dict[str, Any]]:
+        """Fail jobs whose last attempt's worker died, which claim() no longer picks up"""
+        expired = []
+        while True:
+            now = datetime.utcnow()
+            job = await db[self.collection_name].find_one_and_update(
+                {
+                    "status": ProcessingStatus.PROCESSING.value,
+                    "lease_until": {"$lt": now},
+                    "$expr": {"$gte": ["$attempts", "$max_attempts"]}
+                },
+                {"$set": {
+                    "status": ProcessingStatus.FAILED.value,
+                    "error": "Lease expired on the final attempt",
+                    "lease_until": None,
+                    "finished_at": now,
+                    "updated_at": now
+                }},
+                return_document=ReturnDocument.AFTER
+            )
+            if job is None:
+                return expired
+            expired.append(job)
+
+    async def get(self, db, job_id: str, user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not ObjectId.is_valid(job_id):
+            return None
+        query: Dict[str, Any] = {"_id": ObjectId(job_id)}
+        if user_id is not None:
+            query["user_id"] = user_id
+        return await db[self.collection_name].find_one(query)
+
+
+class JobRunner:
+    """Local pool of asyncio workers draining a JobQueue.
+
+    Each worker claims one job at a time and runs the handler registered
+    for its kind; heavy work inside handlers goes to the compute pools as
+    usual. Idle workers poll every `poll_interval` seconds and are woken
+    early by notify() when a job is enqueued in this process.
+    """
+
+    def __init__(self, queue: JobQueue, workers: Optional[int] = None,
+                 poll_interval: Optional[float] = None) -> None:
+        self.queue = queue
+        self.workers = workers or settings.job_workers
+        self.poll_interval = poll_interval if poll_interval is not None else settings.job_poll_interval
+        self.handlers: Dict[str, Handler] = {}
+        self.failure_handlers: Dict[str, Handler] = {}
+        self._name = f"{socket.gethostname()}:{os.getpid()}"
+        self._db = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: Handler, on_failure: Optional[Handler] = None) -> None:
+        """Run `handler(job)` for jobs of this kind; `on_failure(job)` once retries are exhausted"""
+        self.handlers[kind] = handler
+        if on_failure is not None:
+            self.failure_handlers[kind] = on_failure
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self, db) -> None:
+        if self.running:
+            return
+        self._db = db
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._work(f"{self._name}:{i}")) for i in range(self.workers)]
+        logger.info(f"Started {self.workers} job workers for {sorted(self.handlers)}")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _idle(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _work(self, worker: str) -> None:
+        while True:
+            try:
+                job = await self.queue.claim(self._db, worker, list(self.handlers))
+                if job is None:
+                    for expired in await self.queue.expire_exhausted(self._db):
+                        await self._failed(expired)
+            except Exception as e:
+                logger.error(f"Job worker {worker} could not claim: {e}")
+                job = None
+            if job is None:
+                await self._idle()
+                continue
+            await self.run(job)
+
+    async def _keep_lease(self, job: Dict[str, Any], handler: asyncio.Task) -> None:
+        """Renew the lease while the handler runs, cancelling it once another worker owns the job"""
+        while True:
+            await asyncio.sleep(settings.job_lease_seconds / 3)
+            try:
+                renewed = await self.queue.renew(self._db, job)
+            except Exception as e:
+                logger.error(f"Could not renew lease on job {job['_id']}: {e}")
+                continue
+            if not renewed:
+                logger.warning(f"Lost lease on job {job['_id']}, cancelling it")
+                handler.cancel()
+                return
+
+    async def _failed(self, job: Dict[str, Any]) -> None:
+        handler = self.failure_handlers.get(job["kind"])
+        if handler is None:
+            return
+        try:
+            await handler(job)
+        except Exception as e:
+            logger.error(f"Failure handler of job {job['_id']} failed: {e}")
+
+    async def run(self, job: Dict[str, Any]) -> None:
+        handler = asyncio.create_task(self.handlers[job["kind"]](job))
+        lease = asyncio.create_task(self._keep_lease(job, handler))
+        try:
+            result = await handler
+        except asyncio.CancelledError:
+            if not lease.done():
+                raise  # the worker itself is stopping
+            # The lease was lost; the worker that took the job over runs it
+        except Exception as e:
+            logger.error(f"Job {job['_id']} ({job['kind']}) attempt {job['attempts']} failed: {e}")
+            if await self.queue.fail(self._db, job, str(e)):
+                await self._failed(job)
+        else:
+            if not await self.queue.complete(self._db, job, result):
+                logger.warning(f"Job {job['_id']} finished after another worker took it over; result dropped")
+        finally:
+            lease.cancel()
+
+
+job_queue = JobQueue()
+job_runner = JobRunner(job_queue)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+PROFILE_PATH = Path(__file__).parent / "data" / "langid_profiles.json"
+NGRAM_ORDERS = (1, 2, 3)
+MAX_CHARS = 1000
+
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+_CODEPOINT_BITS = 21  # every unicode codepoint fits in 21 bits
+
+
+def normalize_text(text: str, max_chars: int = MAX_CHARS) -> str:
+    """Lowercase, replace everything that is not a letter by a single space and pad with spaces"""
+    return f" {_NON_LETTERS.sub(' ', text[:max_chars].lower()).strip()} "
+
+
+def ngram_keys(text: str, orders: Iterable[int] = NGRAM_ORDERS) -> np.ndarray:
+    """Pack every character n-gram of a normalized text into an int64 key.
+
+    Codepoints are concatenated 21 bits at a time, so trigrams still fit in a
+    signed 64 bit integer and n-grams of different orders never collide (the
+    leading codepoint is never zero).
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    keys = []
+    for n in orders:
+        if len(codes) < n:
+            continue
+        packed = codes[: len(codes) - n + 1].copy()
+        for offset in range(1, n):
+            packed = (packed << _CODEPOINT_BITS) | codes[offset: len(codes) - n + 1 + offset]
+        keys.append(packed)
+    return np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+
+
+def count_ngrams(text: str, orders: Iterable[int] = NGRAM_ORDERS) -> Dict[int, Counter]:
+    """Count n-gram strings per order, used to build profiles"""
+    text = normalize_text(text, max_chars=len(text))
+    counts = {}
+    for n in orders:
+        grams = (text[i:i + n] for i in range(len(text) - n + 1))
+        counts[n] = Counter(gram for gram in grams if gram.strip())
+    return counts
+
+
+class LanguageIdentifier:
+    """Character n-gram language identifier scored against precomputed profiles.
+
+    Each language profile is a row of log-probabilities over a shared n-gram
+    vocabulary; classifying a text is one sorted lookup of its packed n-gram
+    keys followed by a column sum over the profile matrix.
+    """
+
+    def __init__(self, profile_path: str | Path = PROFILE_PATH) -> None:
+        with open(profile_path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+
+        self.languages: List[str] = data["languages"]
+        vocab = sorted({gram for profile in data["profiles"].values() for gram in profile})
+        grams = np.array([ngram_keys(gram, orders=(len(gram),))[0] for gram in vocab], dtype=np.int64)
+        order = np.argsort(grams)
+        self._keys = grams[order]
+
+        floor = float(data["floor"])
+        column = {gram: i for i, gram in enumerate(np.array(vocab, dtype=object)[order])}
+        self._log_probs = np.full((len(self.languages), len(vocab)), floor, dtype=np.float32)
+        for row, language in enumerate(self.languages):
+            for gram, log_prob in data["profiles"][language].items():
+                self._log_probs[row, column[gram]] = log_prob
+
+    def scores(self, text: str) -> Optional[np.ndarray]:
+        """Return the log-likelihood of the text under each profile, or None if nothing matched"""
+        keys = ngram_keys(normalize_text(text))
+        if not len(keys) or not len(self._keys):
+            return None
+        positions = np.searchsorted(self._keys, keys)
+        positions[positions == len(self._keys)] = 0
+        matched = positions[self._keys[positions] == keys]
+        if not len(matched):
+            return None
+        counts = np.bincount(matched, minlength=len(self._keys)).astype(np.float32)
+        return self._log_probs @ counts
+
+    def classify(self, text: str, default: str = "en") -> Tuple[str, float]:
+        """Return the most likely language code and its posterior probability"""
+        scores = self.scores(text)
+        if scores is None:
+            return default, 0.0
+        probs = np.exp(scores - scores.max())
+        probs /= probs.sum()
+        best = int(np.argmax(probs))
+        return self.languages[best], float(probs[best])
+
+
+_identifier: Optional[LanguageIdentifier] = None
+_identifier_lock = threading.Lock()
+
+
+def get_language_identifier() -> LanguageIdentifier:
+    """Return the process-wide identifier, loading the profile file on first use"""
+    global _identifier
+    if _identifier is None:
+        with _identifier_lock:
+            if _identifier is None:
+                _identifier = LanguageIdentifier()
+    return _identifier
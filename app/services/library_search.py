@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+
+from config.db import get_elasticsearch
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Fields matched by the library search box, with their boosts
+SEARCH_FIELDS = ["title^3", "summary^2", "tags^2", "entities", "topics", "content"]
+
+# Set on listings whose search matched more than library_search_max_hits documents
+TRUNCATED_HEADER = "X-Search-Truncated"
+
+
+def search_terms(q: str) -> List[str]:
+    """Words of a search box query, with the quote and negation operators of $text removed"""
+    terms = (term.strip("-") for term in q.replace('"', " ").split())
+    return [term for term in terms if term]
+
+
+def text_search(q: str) -> Dict[str, Any]:
+    """$text filter that treats the query as plain words"""
+    return {"$text": {"$search": " ".join(search_terms(q))}}
+
+
+def search_body(user_id: str, q: str, file_type: Optional[str], size: int) -> Dict[str, Any]:
+    """Elasticsearch query for document ids of one user.
+
+    multi_match does not parse query syntax; bool_prefix matches the last
+    term as a prefix, so results keep up with the user's typing.
+    """
+    filters: List[Dict[str, Any]] = [{"term": {"user_id": user_id}}]
+    if file_type:
+        filters.append({"term": {"file_type": file_type}})
+    return {
+        "_source": False,
+        "size": size,
+        "query": {
+            "bool": {
+                "must": [{"multi_match": {
+                    "query": q, "fields": SEARCH_FIELDS, "type": "bool_prefix", "operator": "and"
+                }}],
+                "filter": filters
+            }
+        }
+    }
+
+
+async def search_document_ids(es, user_id: str, q: str, file_type: Optional[str] = None,
+                              size: Optional[int] = None) -> Tuple[List[ObjectId], bool]:
+    """Best matching ids, and whether more than `size` documents matched"""
+    size = size or settings.library_search_max_hits
+    # One extra hit tells whether the match was cut off
+    response = await es.search(index=settings.elasticsearch_index, body=search_body(user_id, q, file_type, size + 1))
+    hits = response["hits"]["hits"]
+    ids = [ObjectId(hit["_id"]) for hit in hits[:size] if ObjectId.is_valid(hit["_id"])]
+    return ids, len(hits) > size
+
+
+async def library_search_filter(user_id: str, q: str,
+                                file_type: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Mongo filter restricting a listing to documents matching q, and whether it was truncated.
+
+    The search runs on the Elasticsearch index, scoped to the user, and the
+    best library_search_max_hits ids are handed to Mongo so the listing keeps
+    its own sort and cursor; when more documents matched, the flag is set and
+    pages and counts only cover those. Without Elasticsearch the documents
+    collection's text index is used instead, which covers titles, summaries,
+    tags, entities and topics but not the text itself. A None filter means q
+    holds no searchable words.
+    """
+    if not search_terms(q):
+        return None, False
+    try:
+        es = await get_elasticsearch()
+        ids, truncated = await search_document_ids(es, user_id, q, file_type)
+        return {"_id": {"$in": ids}}, truncated
+    except Exception as e:
+        logger.warning(f"Elasticsearch library search failed, using the text index: {e}")
+        return text_search(q), False
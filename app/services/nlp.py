@@ -1,264 +1,367 @@
-import spacy
-import nltk
-from typing import List, Dict, Tuple, Optional
-from sentence_transformers import SentenceTransformer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import re
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class NLPService:
-    def __init__(self):
-        self.nlp = None
-        self.sentence_model = None
-        self.tfidf_vectorizer = None
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        
-    async def initialize(self):
-        """Initialize NLP models asynchronously"""
-        try:
-            # Load spaCy model
-            self.nlp = spacy.load("en_core_web_sm")
-            
-            # Load sentence transformer model
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-            
-            # Initialize TF-IDF vectorizer
-            self.tfidf_vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english',
-                ngram_range=(1, 2)
-            )
-            
-            # Download required NLTK data
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-            nltk.download('vader_lexicon', quiet=True)
-            
-            logger.info("NLP models initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize NLP models: {e}")
-            raise
-
-    async def extract_entities(self, text: str) -> List[Dict[str, str]]:
-        """Extract named entities from text"""
-        if not self.nlp:
-            await self.initialize()
-            
-        def _extract():
-            doc = self.nlp(text)
-            entities = []
-            for ent in doc.ents:
-                entities.append({
-                    "text": ent.text,
-                    "label": ent.label_,
-                    "start": ent.start_char,
-                    "end": ent.end_char
-                })
-            return entities
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _extract
-        )
-
-    async def extract_keywords(self, text: str, max_keywords: int = 10) -> List[Dict[str, float]]:
-        """Extract keywords using TF-IDF"""
-        if not self.tfidf_vectorizer:
-            await self.initialize()
-            
-        def _extract():
-            # Clean and tokenize text
-            sentences = nltk.sent_tokenize(text)
-            if not sentences:
-                return []
-            
-            # Fit TF-IDF
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(sentences)
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            
-            # Get mean TF-IDF scores
-            mean_scores = tfidf_matrix.mean(axis=0).A1
-            word_scores = list(zip(feature_names, mean_scores))
-            word_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            return [{"word": word, "score": float(score)} 
-                   for word, score in word_scores[:max_keywords]]
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _extract
-        )
-
-    async def analyze_sentiment(self, text: str) -> Dict[str, float]:
-        """Analyze sentiment of text"""
-        if not self.nlp:
-            await self.initialize()
-            
-        def _analyze():
-            from nltk.sentiment import SentimentIntensityAnalyzer
-            sia = SentimentIntensityAnalyzer()
-            scores = sia.polarity_scores(text)
-            return {
-                "positive": scores["pos"],
-                "negative": scores["neg"],
-                "neutral": scores["neu"],
-                "compound": scores["compound"]
-            }
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _analyze
-        )
-
-    async def detect_language(self, text: str) -> str:
-        """Detect language of text"""
-        if not self.nlp:
-            await self.initialize()
-            
-        def _detect():
-            doc = self.nlp(text[:1000])  # Use first 1000 chars for speed
-            return doc.lang_
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _detect
-        )
-
-    async def extract_topics(self, text: str, num_topics: int = 5) -> List[Dict[str, float]]:
-        """Extract topics using LDA (simplified version)"""
-        if not self.tfidf_vectorizer:
-            await self.initialize()
-            
-        def _extract():
-            from sklearn.decomposition import LatentDirichletAllocation
-            
-            # Clean text
-            sentences = nltk.sent_tokenize(text)
-            if len(sentences) < 2:
-                return []
-            
-            # Vectorize
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(sentences)
-            
-            # LDA
-            lda = LatentDirichletAllocation(
-                n_components=min(num_topics, len(sentences)),
-                random_state=42
-            )
-            lda.fit(tfidf_matrix)
-            
-            # Get topic words
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            topics = []
-            for topic_idx, topic in enumerate(lda.components_):
-                top_words_idx = topic.argsort()[-5:][::-1]
-                top_words = [(feature_names[i], topic[i]) for i in top_words_idx]
-                topics.append({
-                    "topic_id": topic_idx,
-                    "words": [{"word": word, "weight": float(weight)} for word, weight in top_words]
-                })
-            
-            return topics
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _extract
-        )
-
-    async def calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate semantic similarity between two texts"""
-        if not self.sentence_model:
-            await self.initialize()
-            
-        def _calculate():
-            embeddings = self.sentence_model.encode([text1, text2])
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-            return float(similarity)
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _calculate
-        )
-
-    async def extract_phrases(self, text: str, min_length: int = 2, max_length: int = 4) -> List[str]:
-        """Extract meaningful phrases from text"""
-        if not self.nlp:
-            await self.initialize()
-            
-        def _extract():
-            doc = self.nlp(text)
-            phrases = []
-            
-            # Extract noun phrases
-            for chunk in doc.noun_chunks:
-                if min_length <= len(chunk.text.split()) <= max_length:
-                    phrases.append(chunk.text.strip())
-            
-            # Extract named entities as phrases
-            for ent in doc.ents:
-                if min_length <= len(ent.text.split()) <= max_length:
-                    phrases.append(ent.text.strip())
-            
-            return list(set(phrases))  # Remove duplicates
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _extract
-        )
-
-    async def clean_text(self, text: str) -> str:
-        """Clean and normalize text"""
-        def _clean():
-            # Remove extra whitespace
-            text = re.sub(r'\s+', ' ', text)
-            # Remove special characters but keep basic punctuation
-            text = re.sub(r'[^\w\s.,!?;:-]', '', text)
-            # Normalize unicode
-            text = text.encode('utf-8').decode('utf-8')
-            return text.strip()
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _clean
-        )
-
-    async def get_text_statistics(self, text: str) -> Dict[str, any]:
-        """Get comprehensive text statistics"""
-        if not self.nlp:
-            await self.initialize()
-            
-        def _analyze():
-            doc = self.nlp(text)
-            
-            # Basic stats
-            word_count = len([token for token in doc if not token.is_space])
-            sentence_count = len(list(doc.sents))
-            char_count = len(text)
-            
-            # Readability metrics
-            avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
-            avg_word_length = sum(len(token.text) for token in doc if not token.is_space) / word_count if word_count > 0 else 0
-            
-            # POS tags
-            pos_counts = {}
-            for token in doc:
-                if not token.is_space:
-                    pos_counts[token.pos_] = pos_counts.get(token.pos_, 0) + 1
-            
-            return {
-                "word_count": word_count,
-                "sentence_count": sentence_count,
-                "character_count": char_count,
-                "avg_sentence_length": avg_sentence_length,
-                "avg_word_length": avg_word_length,
-                "pos_counts": pos_counts,
-                "reading_time_minutes": word_count / 200  # Assuming 200 WPM
-            }
-        
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, _analyze
-        )
-
-    def __del__(self):
-        """Cleanup executor"""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
\ No newline at end of file
+import spacy
+import nltk
+from typing import Any, List, Dict, Tuple, Optional
+from sentence_transformers import SentenceTransformer
+from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+import re
+import asyncio
+from pathlib import Path
+import logging
+
+from config.settings import settings
+from app.services.embeddings import EmbeddingCache, EmbeddingStore, content_hash, l2_normalize
+from app.services.langid import get_language_identifier
+from app.services.topics import TopicModelService
+from app.services.sentiment import SentimentAnalyzer
+from app.services.compute import INTERACTIVE, compute_manager
+from app.services.textstats import basic_statistics
+
+logger = logging.getLogger(__name__)
+
+
+def keyword_vectorizer() -> TfidfVectorizer:
+    """Fresh TF-IDF vectorizer; fitting mutates it, so concurrent extractions must not share one"""
+    return TfidfVectorizer(
+        max_features=1000,
+        stop_words='english',
+        ngram_range=(1, 2)
+    )
+
+
+class NLPModels:
+    """Models and caches of one process, loaded once and shared by every NLPService view"""
+
+    def __init__(self) -> None:
+        self.nlp = None
+        self.sentence_model = None
+        self.embedding_cache = None
+        self.topic_models = TopicModelService()
+        self.sentiment_analyzer = None
+        self.initialized = False
+
+    def load(self) -> None:
+        # Load spaCy model
+        self.nlp = spacy.load("en_core_web_sm")
+        
+        # Load sentence transformer model and its embedding cache
+        self.sentence_model = SentenceTransformer(settings.embedding_model_name)
+        self.embedding_cache = self._create_embedding_cache()
+        
+        # Download required NLTK data
+        nltk.download('punkt', quiet=True)
+        nltk.download('stopwords', quiet=True)
+        nltk.download('averaged_perceptron_tagger', quiet=True)
+        nltk.download('vader_lexicon', quiet=True)
+        
+        # Load the VADER lexicon once
+        self.sentiment_analyzer = SentimentAnalyzer()
+        
+        self.initialized = True
+
+    def _create_embedding_cache(self) -> EmbeddingCache:
+        """Build the embedding LRU, persisted to disk when a cache directory is configured"""
+        store = None
+        if settings.embedding_cache_dir:
+            dim = self.sentence_model.get_sentence_embedding_dimension()
+            model_slug = re.sub(r'[^\w.-]', '_', settings.embedding_model_name)
+            store = EmbeddingStore(Path(settings.embedding_cache_dir) / f"{model_slug}-{dim}.f16", dim)
+        return EmbeddingCache(settings.embedding_cache_max_bytes, store=store)
+
+
+class NLPService:
+    """NLP operations run on one compute pool.
+
+    All services made with with_pool() share the models and the embedding
+    cache of the one they were made from, so choosing a pool never loads
+    the models a second time.
+    """
+
+    def __init__(self, pool: str = INTERACTIVE, models: Optional[NLPModels] = None):
+        self.models = models or NLPModels()
+        self.executor = compute_manager.executor(pool)
+
+    def with_pool(self, pool: str) -> "NLPService":
+        """Service sharing these models whose work runs on another compute pool"""
+        return NLPService(pool, self.models)
+
+    @property
+    def initialized(self) -> bool:
+        return self.models.initialized
+
+    @property
+    def nlp(self):
+        return self.models.nlp
+
+    @property
+    def sentence_model(self):
+        return self.models.sentence_model
+
+    @property
+    def embedding_cache(self) -> Optional[EmbeddingCache]:
+        return self.models.embedding_cache
+
+    @property
+    def topic_models(self) -> TopicModelService:
+        return self.models.topic_models
+
+    @property
+    def sentiment_analyzer(self) -> Optional[SentimentAnalyzer]:
+        return self.models.sentiment_analyzer
+        
+    async def initialize(self):
+        """Initialize NLP models asynchronously"""
+        if self.initialized:
+            return
+            
+        try:
+            self.models.load()
+            logger.info("NLP models initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize NLP models: {e}")
+            raise
+
+    def _embed_many_sync(self, texts: List[str]) -> np.ndarray:
+        """Encode texts in batches, serving repeated content from the cache"""
+        dim = self.sentence_model.get_sentence_embedding_dimension()
+        if not texts:
+            return np.zeros((0, dim), dtype=np.float32)
+        
+        keys = [content_hash(text, settings.embedding_model_name) for text in texts]
+        cached = self.embedding_cache.get_many(keys)
+        
+        # Encode each distinct missing text once, even if repeated in the batch
+        missing = {}
+        for key, text, vector in zip(keys, texts, cached):
+            if vector is None and key not in missing:
+                missing[key] = text
+        
+        computed = {}
+        if missing:
+            vectors = self.sentence_model.encode(
+                list(missing.values()),
+                batch_size=settings.embedding_batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            vectors = l2_normalize(vectors)
+            self.embedding_cache.put_many(list(missing.keys()), vectors)
+            computed = dict(zip(missing.keys(), vectors))
+        
+        result = np.empty((len(texts), dim), dtype=np.float32)
+        for i, (key, vector) in enumerate(zip(keys, cached)):
+            result[i] = vector if vector is not None else computed[key]
+        return result
+
+    async def embed_many(self, texts: List[str]) -> np.ndarray:
+        """Return L2-normalized embeddings for texts as an (n, dim) float32 matrix"""
+        if not self.sentence_model:
+            await self.initialize()
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self._embed_many_sync, list(texts)
+        )
+
+    async def compute_embedding(self, text: str) -> np.ndarray:
+        """Return the L2-normalized embedding of a single text"""
+        embeddings = await self.embed_many([text])
+        return embeddings[0]
+
+    async def extract_entities(self, text: str) -> List[Dict[str, str]]:
+        """Extract named entities from text"""
+        if not self.nlp:
+            await self.initialize()
+            
+        def _extract():
+            doc = self.nlp(text)
+            entities = []
+            for ent in doc.ents:
+                entities.append({
+                    "text": ent.text,
+                    "label": ent.label_,
+                    "start": ent.start_char,
+                    "end": ent.end_char
+                })
+            return entities
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _extract
+        )
+
+    async def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, str]]]:
+        """Extract named entities from many texts with one spaCy pipe() pass"""
+        if not self.nlp:
+            await self.initialize()
+        
+        def _extract():
+            return [
+                [
+                    {"text": ent.text, "label": ent.label_, "start": ent.start_char, "end": ent.end_char}
+                    for ent in doc.ents
+                ]
+                for doc in self.nlp.pipe(texts, batch_size=settings.batch_nlp_size)
+            ]
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _extract
+        )
+
+    def _keywords_sync(self, text: str, max_keywords: int) -> List[Dict[str, float]]:
+        # Clean and tokenize text
+        sentences = nltk.sent_tokenize(text)
+        if not sentences:
+            return []
+        
+        # Fit TF-IDF
+        vectorizer = keyword_vectorizer()
+        tfidf_matrix = vectorizer.fit_transform(sentences)
+        feature_names = vectorizer.get_feature_names_out()
+        
+        # Get mean TF-IDF scores
+        mean_scores = tfidf_matrix.mean(axis=0).A1
+        word_scores = list(zip(feature_names, mean_scores))
+        word_scores.sort(key=lambda x: x[1], reverse=True)
+        
+        return [{"word": word, "score": float(score)} 
+               for word, score in word_scores[:max_keywords]]
+
+    async def extract_keywords(self, text: str, max_keywords: int = 10) -> List[Dict[str, float]]:
+        """Extract keywords using TF-IDF"""
+        if not self.initialized:
+            await self.initialize()
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self._keywords_sync, text, max_keywords
+        )
+
+    async def extract_keywords_batch(self, texts: List[str], max_keywords: int = 10) -> List[List[Dict[str, float]]]:
+        """Extract keywords of many texts in a single executor task"""
+        if not self.initialized:
+            await self.initialize()
+        
+        def _extract():
+            return [self._keywords_sync(text, max_keywords) for text in texts]
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _extract
+        )
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """Analyze sentiment of text sentence by sentence"""
+        results = await self.analyze_sentiment_batch([text])
+        return results[0]
+
+    async def analyze_sentiment_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze sentiment of many texts in one pass, with per-sentence compound scores"""
+        if not self.sentiment_analyzer:
+            await self.initialize()
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self.sentiment_analyzer.analyze_batch, list(texts)
+        )
+
+    async def detect_language(self, text: str) -> str:
+        """Detect language of text"""
+        result = await self.identify_language(text)
+        return result["language"]
+
+    async def identify_language(self, text: str) -> Dict[str, Any]:
+        """Identify the language of text with a confidence score"""
+        # Profile scoring takes microseconds, so it runs inline instead of in the executor
+        language, confidence = get_language_identifier().classify(text)
+        return {"language": language, "confidence": confidence}
+
+    async def extract_topics(self, text: str, user_id: str, learn: bool = True) -> List[Dict[str, Any]]:
+        """Assign topics from the user's online LDA model, optionally training it on text first"""
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self.topic_models.assign, user_id, text, learn
+        )
+
+    async def extract_topics_batch(self, texts: List[str], user_id: str, learn: bool = True) -> List[List[Dict[str, Any]]]:
+        """Assign topics to many texts of one user, learning them under one lock of its model"""
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self.topic_models.assign_batch, user_id, texts, learn
+        )
+
+    async def list_topics(self, user_id: str) -> List[Dict[str, Any]]:
+        """List all topics learned from the user's library"""
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, self.topic_models.list_topics, user_id
+        )
+
+    async def calculate_similarity(self, text1: str, text2: str) -> float:
+        """Calculate semantic similarity between two texts"""
+        # Embeddings are L2-normalized, so cosine similarity is a dot product
+        embeddings = await self.embed_many([text1, text2])
+        return float(np.dot(embeddings[0], embeddings[1]))
+
+    async def extract_phrases(self, text: str, min_length: int = 2, max_length: int = 4) -> List[str]:
+        """Extract meaningful phrases from text"""
+        if not self.nlp:
+            await self.initialize()
+            
+        def _extract():
+            doc = self.nlp(text)
+            phrases = []
+            
+            # Extract noun phrases
+            for chunk in doc.noun_chunks:
+                if min_length <= len(chunk.text.split()) <= max_length:
+                    phrases.append(chunk.text.strip())
+            
+            # Extract named entities as phrases
+            for ent in doc.ents:
+                if min_length <= len(ent.text.split()) <= max_length:
+                    phrases.append(ent.text.strip())
+            
+            return list(set(phrases))  # Remove duplicates
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _extract
+        )
+
+    async def clean_text(self, text: str) -> str:
+        """Clean and normalize text"""
+        def _clean():
+            # Remove extra whitespace
+            text = re.sub(r'\s+', ' ', text)
+            # Remove special characters but keep basic punctuation
+            text = re.sub(r'[^\w\s.,!?;:-]', '', text)
+            # Normalize unicode
+            text = text.encode('utf-8').decode('utf-8')
+            return text.strip()
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _clean
+        )
+
+    async def get_text_statistics(self, text: str, include_pos: bool = False) -> Dict[str, Any]:
+        """Get text statistics and readability scores.
+        
+        The basic tier needs no model and runs in milliseconds even on large
+        documents; part-of-speech counts require a spaCy tagging pass and are
+        only computed when `include_pos` is set.
+        """
+        if include_pos and not self.nlp:
+            await self.initialize()
+            
+        def _analyze():
+            stats = basic_statistics(text)
+            
+            if include_pos:
+                # Only the tagger is needed for POS counts
+                doc = self.nlp(text, disable=["parser", "ner", "lemmatizer"])
+                pos_counts = {}
+                for token in doc:
+                    if not token.is_space:
+                        pos_counts[token.pos_] = pos_counts.get(token.pos_, 0) + 1
+                stats["pos_counts"] = pos_counts
+            
+            return stats
+        
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, _analyze
+        )
+
+
+nlp_service = NLPService()
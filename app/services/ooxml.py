@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Dict, Iterator, List, Tuple
+
+# WordprocessingML (DOCX body) and DrawingML (PPTX text) share the local names
+# p / r / t / br / tr / tc, so one walker handles both
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+NOTES_SLIDE_REL = "/notesSlide"
+
+# How text of a finished container is joined before it moves to its parent
+_JOINERS = {"p": "", "tc": "\n", "tr": "\t"}
+
+
+def iter_text_blocks(stream: IO[bytes], ns: str) -> Iterator[str]:
+    """Yield paragraphs and table rows of one OOXML part in document order.
+
+    Runs are read with iterparse and processed as soon as they close.
+    Finished top-level blocks are cleared from their parent, so the
+    in-memory tree never grows past the block being read. Table cells are
+    tab-separated within a row; paragraphs nested in text boxes or cells
+    are folded into their container. mc:Fallback copies of text boxes are
+    skipped so their text is not emitted twice.
+    """
+    tags = {ns + name: name for name in ("p", "r", "t", "tab", "br", "cr", "tr", "tc")}
+    run, paragraph = ns + "r", ns + "p"
+    elements: List[ET.Element] = []
+    containers: List[Tuple[str, List[str]]] = []
+    skipping = 0
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            elements.append(elem)
+            if elem.tag == MC_FALLBACK:
+                skipping += 1
+            elif not skipping and tags.get(elem.tag) in _JOINERS:
+                containers.append((tags[elem.tag], []))
+            continue
+
+        elements.pop()
+        if elem.tag == MC_FALLBACK:
+            skipping -= 1
+            continue
+        name = tags.get(elem.tag)
+        if skipping or name is None or not containers:
+            continue
+
+        parent = elements[-1].tag if elements else None
+        if name == "t":
+            if parent == run:
+                containers[-1][1].append(elem.text or "")
+        elif name == "tab":
+            if parent == run:
+                containers[-1][1].append("\t")
+        elif name in ("br", "cr"):
+            if parent in (run, paragraph):
+                containers[-1][1].append("\n")
+        elif name in _JOINERS:
+            kind, parts = containers.pop()
+            text = _JOINERS[kind].join(parts)
+            if containers:
+                outer_kind, outer = containers[-1]
+                # A text box paragraph inside a paragraph starts a new line
+                outer.append("\n" + text if outer_kind == "p" and text else text)
+            else:
+                if text.strip():
+                    yield text
+                if elements:
+                    elements[-1].clear()
+
+
+def _relationships(archive: zipfile.ZipFile, part: str) -> Dict[str, Tuple[str, str]]:
+    """Relationship id -> (type, resolved part name) for one part"""
+    directory, name = posixpath.split(part)
+    rels_part = posixpath.join(directory, "_rels", name + ".rels")
+    if rels_part not in archive.namelist():
+        return {}
+    rels = {}
+    for rel in ET.fromstring(archive.read(rels_part)).iter(PKG_REL + "Relationship"):
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") == "External":
+            continue
+        resolved = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(directory, target))
+        rels[rel.get("Id")] = (rel.get("Type", ""), resolved)
+    return rels
+
+
+def docx_blocks(path: str) -> Iterator[str]:
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as stream:
+        yield from iter_text_blocks(stream, W)
+
+
+def pptx_slide_parts(archive: zipfile.ZipFile) -> List[str]:
+    """Slide part names in presentation order"""
+    rels = _relationships(archive, "ppt/presentation.xml")
+    slide_ids = ET.fromstring(archive.read("ppt/presentation.xml")).find(P + "sldIdLst")
+    if slide_ids is None:
+        return []
+    return [rels[sld.get(R + "id")][1] for sld in slide_ids if sld.get(R + "id") in rels]
+
+
+def pptx_slide_count(path: str) -> int:
+    with zipfile.ZipFile(path) as archive:
+        return len(pptx_slide_parts(archive))
+
+
+def pptx_slides(path: str) -> Iterator[str]:
+    """One block per slide: its text in shape order, then its speaker notes"""
+    with zipfile.ZipFile(path) as archive:
+        for part in pptx_slide_parts(archive):
+            with archive.open(part) as stream:
+                text = list(iter_text_blocks(stream, A))
+            for rel_type, notes_part in _relationships(archive, part).values():
+                if rel_type.endswith(NOTES_SLIDE_REL):
+                    with archive.open(notes_part) as stream:
+                        notes = list(iter_text_blocks(stream, A))
+                    if notes:
+                        text.append("\n" + "\n".join(notes))
+            yield "\n".join(text)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import nltk
+import numpy as np
+from bson.binary import Binary
+
+_SCORE_KEYS = ("pos", "neg", "neu", "compound")
+
+
+def encode_sentiment_timeline(scores: Sequence[float]) -> Binary:
+    """Quantize per-sentence compound scores in [-1, 1] to one signed byte each"""
+    quantized = np.round(np.clip(np.asarray(scores, dtype=np.float32), -1.0, 1.0) * 127)
+    return Binary(quantized.astype(np.int8).tobytes())
+
+
+def decode_sentiment_timeline(data: bytes) -> List[float]:
+    return (np.frombuffer(data, dtype=np.int8).astype(np.float64) / 127).round(3).tolist()
+
+
+class SentimentAnalyzer:
+    """Sentence-level VADER scoring with the lexicon loaded once"""
+
+    def __init__(self) -> None:
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        self._analyzer = SentimentIntensityAnalyzer()
+
+    def analyze_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Score every sentence of every text and aggregate per text.
+
+        Aggregates are the sentence scores weighted by sentence length, which
+        is what VADER's per-sentence design expects rather than scoring a whole
+        document as a single string.
+        """
+        sentences: List[str] = []
+        offsets = []
+        for text in texts:
+            offsets.append(len(sentences))
+            sentences.extend(s for s in nltk.sent_tokenize(text) if s.strip())
+
+        scores = np.array(
+            [[polarity[key] for key in _SCORE_KEYS]
+             for polarity in map(self._analyzer.polarity_scores, sentences)],
+            dtype=np.float64
+        ).reshape(-1, len(_SCORE_KEYS))
+        weights = np.fromiter((len(s) for s in sentences), dtype=np.float64, count=len(sentences))
+
+        results = []
+        bounds = offsets + [len(sentences)]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start == end:
+                results.append({
+                    "positive": 0.0, "negative": 0.0, "neutral": 1.0, "compound": 0.0,
+                    "sentence_scores": []
+                })
+                continue
+            mean = np.average(scores[start:end], axis=0, weights=weights[start:end])
+            results.append({
+                "positive": float(mean[0]),
+                "negative": float(mean[1]),
+                "neutral": float(mean[2]),
+                "compound": float(mean[3]),
+                "sentence_scores": scores[start:end, 3].tolist()
+            })
+        return results
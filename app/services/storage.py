@@ -1,75 +1,143 @@
-from __future__ import annotations
-
-from typing import Any, Optional
-
-from motor.motor_asyncio import AsyncIOMotorClient
-from config.settings import settings
-from app.services.nlp import NLPService
-
-
-class StorageService:
-    def __init__(self, mongo_uri: str | None = None) -> None:
-        self.mongo = AsyncIOMotorClient(mongo_uri or settings.mongo_uri)
-        self.db = self.mongo["instabrief"]
-        self._nlp = NLPService()
-
-    async def save_article(self, article: dict[str, Any]) -> str:
-        # Add keywords and embedding to the article
-        text_content = (article.get("title") or "") + "\n" + (article.get("content") or "")
-        article["keywords"] = self._nlp.extract_keywords(text_content)
-        article["embedding"] = self._nlp.compute_embedding(text_content)
-        
-        result = await self.db.articles.insert_one(article)
-        return str(result.inserted_id)
-
-    async def search_articles(self, query: str, size: int = 10):
-        """Simple text search using MongoDB text search"""
-        # Create a text index if it doesn't exist
-        await self.db.articles.create_index([("title", "text"), ("content", "text")])
-        
-        # Perform text search
-        cursor = self.db.articles.find(
-            {"$text": {"$search": query}},
-            {"score": {"$meta": "textScore"}}
-        ).sort([("score", {"$meta": "textScore"})]).limit(size)
-        
-        articles = await cursor.to_list(length=size)
-        return [{"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}} for article in articles]
-
-    async def search_articles_semantic(self, query: str, size: int = 10):
-        """Simple semantic search using keyword matching"""
-        query_keywords = self._nlp.extract_keywords(query)
-        
-        # Search for articles with matching keywords
-        pipeline = [
-            {"$addFields": {
-                "keyword_matches": {
-                    "$size": {
-                        "$setIntersection": ["$keywords", query_keywords]
-                    }
-                }
-            }},
-            {"$match": {"keyword_matches": {"$gt": 0}}},
-            {"$sort": {"keyword_matches": -1}},
-            {"$limit": size}
-        ]
-        
-        cursor = self.db.articles.aggregate(pipeline)
-        articles = await cursor.to_list(length=size)
-        return [{"id": str(article["_id"]), **{k: v for k, v in article.items() if k not in ["_id", "keyword_matches"]}} for article in articles]
-
-    async def get_article_by_id(self, article_id: str):
-        """Get article by ID"""
-        from bson import ObjectId
-        article = await self.db.articles.find_one({"_id": ObjectId(article_id)})
-        if article:
-            return {"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}}
-        return None
-
-    async def get_all_articles(self, skip: int = 0, limit: int = 10):
-        """Get all articles with pagination"""
-        cursor = self.db.articles.find().skip(skip).limit(limit).sort("_id", -1)
-        articles = await cursor.to_list(length=limit)
-        return [{"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}} for article in articles]
-
-
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from datetime import datetime
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from config.settings import settings
+from app.services.nlp import nlp_service
+from app.services.compute import BULK, INTERACTIVE, compute_manager
+from app.services.content_store import content_digest
+from app.services.embedding_worker import EmbeddingWorker, article_text
+from app.services.vector_index import article_index, load_index
+from app.utils.pagination import apply_cursor, next_cursor, sort_spec
+
+
+class StorageService:
+    def __init__(self, mongo_uri: str | None = None) -> None:
+        self.mongo = AsyncIOMotorClient(mongo_uri or settings.mongo_uri)
+        self.db = self.mongo["instabrief"]
+        self._nlp = nlp_service
+        self.embedding_worker = EmbeddingWorker(self.db.articles, nlp_service.with_pool(BULK), index=article_index)
+
+    async def start(self) -> None:
+        """Load the article vector index, start the embedding worker and resume articles that were never embedded"""
+        await load_index(article_index, self.db.articles)
+        self.embedding_worker.start()
+        await self.embedding_worker.requeue_pending()
+
+    async def stop(self) -> None:
+        await self.embedding_worker.stop()
+
+    async def save_article(self, article: dict[str, Any]) -> str:
+        # Keywords and embedding are added by the background worker
+        article["searchable"] = False
+        article["content_hash"] = content_digest(article_text(article))
+        result = await self.db.articles.insert_one(article)
+        self.embedding_worker.enqueue(result.inserted_id, article_text(article))
+        return str(result.inserted_id)
+
+    async def search_articles(self, query: str, size: int = 10):
+        """Simple text search using MongoDB text search"""
+        # The text index is created at startup by the index manager
+        cursor = self.db.articles.find(
+            {"$text": {"$search": query}},
+            {"score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(size)
+        
+        articles = await cursor.to_list(length=size)
+        return [{"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}} for article in articles]
+
+    async def search_articles_semantic(self, query: str, size: int = 10):
+        """Nearest-neighbour search over article embeddings"""
+        await self._nlp.initialize()
+        query_embedding = await self._nlp.compute_embedding(query)
+        hits = await compute_manager.run(INTERACTIVE, article_index.search, query_embedding, size)
+        if not hits:
+            return []
+
+        scores = dict(hits)
+        cursor = self.db.articles.find(
+            {"_id": {"$in": [ObjectId(article_id) for article_id, _ in hits]}, "searchable": True},
+            {"embedding": 0}
+        )
+        articles = await cursor.to_list(length=size)
+        articles.sort(key=lambda article: scores[str(article["_id"])], reverse=True)
+        return [{"id": str(article["_id"]), "score": scores[str(article["_id"])], **{k: v for k, v in article.items() if k != "_id"}} for article in articles]
+
+    async def update_article(self, article_id: str, changes: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Apply changes in one atomic update and return the updated article, or None if it does not exist.
+
+        Keywords and the embedding are only recomputed when the title or
+        content actually changed, detected by comparing content hashes inside
+        the update itself; the vector index entry is then refreshed in place
+        by the embedding worker. When only one of title/content is given, the
+        stored other half is read first and the update only applies while the
+        stored hash is unchanged, retrying if a concurrent edit got in between.
+        """
+        text_fields = {"title", "content"} & set(changes)
+        while True:
+            now = datetime.utcnow()
+            new_values = {**{field: {"$literal": value} for field, value in changes.items()}, "updated_at": {"$literal": now}}
+            query: dict[str, Any] = {"_id": ObjectId(article_id)}
+            new_hash = None
+            if text_fields:
+                text = changes
+                if text_fields != {"title", "content"}:
+                    current = await self.db.articles.find_one(query, {"title": 1, "content": 1, "content_hash": 1})
+                    if current is None:
+                        return None
+                    text = {**current, **changes}
+                    query["content_hash"] = current.get("content_hash")
+                new_hash = content_digest(article_text(text))
+                new_values["content_hash"] = {"$literal": new_hash}
+                new_values["searchable"] = {"$cond": [{"$eq": ["$content_hash", new_hash]}, "$searchable", False]}
+
+            before = await self.db.articles.find_one_and_update(
+                query,
+                [{"$set": new_values}],
+                projection={"embedding": 0},
+                return_document=ReturnDocument.BEFORE
+            )
+            if before is not None or "content_hash" not in query:
+                break
+        if before is None:
+            return None
+
+        article = {**before, **changes, "updated_at": now}
+        if new_hash is not None and before.get("content_hash") != new_hash:
+            article["content_hash"] = new_hash
+            article["searchable"] = False
+            self.embedding_worker.enqueue(before["_id"], article_text(article))
+
+        return {"id": str(article.pop("_id")), **article}
+
+    async def get_article_by_id(self, article_id: str):
+        """Get article by ID"""
+        article = await self.db.articles.find_one({"_id": ObjectId(article_id)})
+        if article:
+            return {"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}}
+        return None
+
+    async def get_all_articles(self, skip: int = 0, limit: int = 10, cursor: Optional[str] = None):
+        """Get all articles, newest first, with keyset pagination.
+
+        Returns the page and the cursor for the next one (None on the last
+        page). `skip` is only honoured when no cursor is given.
+        """
+        query = apply_cursor({}, "_id", -1, cursor)
+        results = self.db.articles.find(query, {"embedding": 0}).sort(sort_spec("_id", -1))
+        if not cursor and skip:
+            results = results.skip(skip)
+        articles = await results.limit(limit).to_list(length=limit)
+        articles_page = [{"id": str(article["_id"]), **{k: v for k, v in article.items() if k != "_id"}} for article in articles]
+        return articles_page, next_cursor(articles, "_id", limit)
+
+    async def delete_article(self, article_id: str) -> bool:
+        """Delete an article and drop it from the vector index"""
+        result = await self.db.articles.delete_one({"_id": ObjectId(article_id)})
+        article_index.remove(article_id)
+        return result.deleted_count > 0
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional
+
+import nltk
+
+from app.models.schemas import ProcessingStatus
+from app.services.compute import INTERACTIVE, compute_manager
+
+logger = logging.getLogger(__name__)
+
+# Sentences summarized together in one map step
+CHUNK_SENTENCES = 200
+
+# An unterminated run longer than this is emitted as a sentence instead of carried over
+MAX_CARRY_CHARS = 16 * 1024
+
+# Progress entries kept for polling after an upload finishes
+MAX_TRACKED = 1024
+
+_TERMINATORS = (".", "!", "?", "\"", "'", ")", "”")
+
+
+class SentenceSegmenter:
+    """Splits a stream of text blocks into sentences.
+
+    A page or slide often ends mid-sentence, so the last sentence of a
+    block is held back and prefixed to the next one unless it ends with
+    terminal punctuation.
+    """
+
+    def __init__(self, tokenize: Callable[[str], List[str]] = nltk.sent_tokenize) -> None:
+        self._tokenize = tokenize
+        self._carry = ""
+
+    def feed(self, block: str) -> List[str]:
+        text = f"{self._carry} {block}" if self._carry else block
+        sentences = [s for s in self._tokenize(text) if s.strip()]
+        self._carry = ""
+        if sentences and not sentences[-1].rstrip().endswith(_TERMINATORS) and len(sentences[-1]) < MAX_CARRY_CHARS:
+            self._carry = sentences.pop()
+        return sentences
+
+    def flush(self) -> List[str]:
+        carry, self._carry = self._carry.strip(), ""
+        return [carry] if carry else []
+
+
+class ChunkedSummarizer:
+    """Map-reduce summary over a sentence stream.
+
+    Sentences are buffered until a chunk is full, the chunk is summarized
+    and dropped, and the chunk summaries are summarized once more at the
+    end. Only one chunk of text is held at a time.
+    """
+
+    def __init__(
+        self,
+        summarize: Callable[[str, int], Awaitable[str]],
+        max_length: int,
+        chunk_sentences: int = CHUNK_SENTENCES
+    ) -> None:
+        self._summarize = summarize
+        self.max_length = max_length
+        self.chunk_sentences = chunk_sentences
+        self._pending: List[str] = []
+        self.summaries: List[str] = []
+
+    async def add(self, sentences: List[str]) -> None:
+        self._pending.extend(sentences)
+        while len(self._pending) >= self.chunk_sentences:
+            chunk = self._pending[:self.chunk_sentences]
+            del self._pending[:self.chunk_sentences]
+            await self._summarize_chunk(chunk)
+
+    async def _summarize_chunk(self, sentences: List[str]) -> None:
+        summary = await self._summarize(" ".join(sentences), self.max_length)
+        if summary:
+            self.summaries.append(summary)
+
+    async def finish(self) -> str:
+        if self._pending:
+            await self._summarize_chunk(self._pending)
+            self._pending = []
+        if len(self.summaries) <= 1:
+            return self.summaries[0] if self.summaries else ""
+        return await self._summarize(" ".join(self.summaries), self.max_length)
+
+
+@dataclass
+class ExtractionProgress:
+    file_id: str
+    user_id: str
+    total_blocks: Optional[int] = None
+    blocks: int = 0
+    sentences: int = 0
+    chunks: int = 0
+    characters: int = 0
+    status: ProcessingStatus = ProcessingStatus.PROCESSING
+    error: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def finish(self, error: Optional[str] = None) -> None:
+        self.status = ProcessingStatus.FAILED if error else ProcessingStatus.COMPLETED
+        self.error = error
+        self.finished_at = datetime.utcnow()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "file_id": self.file_id,
+            "status": self.status,
+            "blocks": self.blocks,
+            "total_blocks": self.total_blocks,
+            "percent": round(100.0 * self.blocks / self.total_blocks, 1) if self.total_blocks else None,
+            "sentences": self.sentences,
+            "chunks": self.chunks,
+            "characters": self.characters,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ProgressRegistry:
+    """In-process progress counters of recent extractions, oldest evicted first"""
+
+    def __init__(self, max_entries: int = MAX_TRACKED) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ExtractionProgress]" = OrderedDict()
+
+    def start(self, file_id: str, user_id: str, total_blocks: Optional[int] = None) -> ExtractionProgress:
+        progress = ExtractionProgress(file_id=file_id, user_id=user_id, total_blocks=total_blocks)
+        self._entries[file_id] = progress
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return progress
+
+    def get(self, file_id: str) -> Optional[ExtractionProgress]:
+        return self._entries.get(file_id)
+
+
+async def summarize_blocks(
+    blocks: AsyncIterable[str],
+    summarize: Callable[[str, int], Awaitable[str]],
+    max_length: int,
+    progress: ExtractionProgress,
+    segmenter: Optional[SentenceSegmenter] = None,
+    chunk_sentences: int = CHUNK_SENTENCES,
+    pool: str = INTERACTIVE
+) -> str:
+    """Segment and summarize blocks as they arrive, updating progress after each one.
+
+    Sentence tokenization runs on the compute `pool`, off the event loop.
+    """
+    segmenter = segmenter or SentenceSegmenter()
+    chunks = ChunkedSummarizer(summarize, max_length, chunk_sentences)
+    try:
+        async for block in blocks:
+            sentences = await compute_manager.run(pool, segmenter.feed, block)
+            await chunks.add(sentences)
+            progress.blocks += 1
+            progress.sentences += len(sentences)
+            progress.characters += len(block)
+            progress.chunks = len(chunks.summaries)
+        tail = segmenter.flush()
+        await chunks.add(tail)
+        progress.sentences += len(tail)
+        summary = await chunks.finish()
+        progress.chunks = len(chunks.summaries)
+    except Exception as e:
+        progress.finish(error=str(e))
+        raise
+    progress.finish()
+    return summary
+
+
+extraction_progress = ProgressRegistry()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict
+
+import numpy as np
+
+# One pass over the text yields both words and sentence terminators
+_TOKENS = re.compile(r"[^\W_]+(?:['’][^\W_]+)*|[.!?]+")
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+
+WORDS_PER_MINUTE = 200
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Estimate English syllables from vowel groups, ignoring a silent trailing 'e'"""
+    word = word.lower()
+    count = len(_VOWEL_GROUPS.findall(word))
+    if count > 1 and word.endswith("e") and not word.endswith(("le", "ee", "ye")):
+        count -= 1
+    return max(1, count)
+
+
+def basic_statistics(text: str) -> Dict[str, Any]:
+    """Counts, averages and readability scores from a single regex pass and NumPy reductions"""
+    tokens = _TOKENS.findall(text)
+    words = [token for token in tokens if token[0] not in ".!?"]
+    word_count = len(words)
+
+    # Every run of terminators closes a sentence; trailing words without one form a last sentence
+    sentence_count = len(tokens) - word_count
+    if tokens and tokens[-1][0] not in ".!?":
+        sentence_count += 1
+
+    if word_count:
+        counts = Counter(words)
+        unique = list(counts)
+        frequency = np.fromiter(counts.values(), dtype=np.int64, count=len(unique))
+        lengths = np.fromiter(map(len, unique), dtype=np.int64, count=len(unique))
+        syllables = np.fromiter(map(count_syllables, unique), dtype=np.int64, count=len(unique))
+
+        letter_count = int(lengths @ frequency)
+        syllable_count = int(syllables @ frequency)
+        complex_word_count = int(frequency[syllables >= 3].sum())
+    else:
+        letter_count = syllable_count = complex_word_count = 0
+
+    words_per_sentence = word_count / sentence_count if sentence_count else 0.0
+    syllables_per_word = syllable_count / word_count if word_count else 0.0
+    letters_per_word = letter_count / word_count if word_count else 0.0
+
+    if word_count and sentence_count:
+        flesch_reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        flesch_kincaid_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+        gunning_fog = 0.4 * (words_per_sentence + 100 * complex_word_count / word_count)
+        coleman_liau = 5.88 * letters_per_word - 29.6 * sentence_count / word_count - 15.8
+        automated_readability = 4.71 * letters_per_word + 0.5 * words_per_sentence - 21.43
+    else:
+        flesch_reading_ease = flesch_kincaid_grade = gunning_fog = 0.0
+        coleman_liau = automated_readability = 0.0
+
+    return {
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "character_count": len(text),
+        "letter_count": letter_count,
+        "syllable_count": syllable_count,
+        "complex_word_count": complex_word_count,
+        "avg_sentence_length": words_per_sentence,
+        "avg_word_length": letters_per_word,
+        "avg_syllables_per_word": syllables_per_word,
+        "flesch_reading_ease": flesch_reading_ease,
+        "flesch_kincaid_grade": flesch_kincaid_grade,
+        "gunning_fog": gunning_fog,
+        "coleman_liau_index": coleman_liau,
+        "automated_readability_index": automated_readability,
+        "reading_time_minutes": word_count / WORDS_PER_MINUTE,
+    }
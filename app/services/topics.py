@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.decomposition import LatentDirichletAllocation
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_PARAGRAPHS = re.compile(r"\n\s*\n")
+
+
+class UserTopicModel:
+    """Online LDA model over a single user's document library.
+
+    Documents are vectorized with a stateless HashingVectorizer so the feature
+    space never changes between `partial_fit` calls. Because hashed features
+    cannot be inverted, the most frequent word seen in each bucket is tracked
+    to label topics.
+    """
+
+    def __init__(self, n_topics: int, n_features: int, total_samples: int) -> None:
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+            stop_words="english",
+            token_pattern=r"(?u)\b[^\W\d_]{3,}\b",
+        )
+        self.lda = LatentDirichletAllocation(
+            n_components=n_topics,
+            learning_method="online",
+            learning_offset=10.0,
+            total_samples=total_samples,
+            random_state=42,
+        )
+        self.bucket_words: Dict[int, Tuple[str, int]] = {}
+        self.documents_seen = 0
+
+    def _chunks(self, text: str, words_per_chunk: int = 200) -> List[str]:
+        """Split a document into paragraph-sized mini-documents for the online update"""
+        chunks, current, size = [], [], 0
+        for paragraph in _PARAGRAPHS.split(text):
+            current.append(paragraph)
+            size += len(paragraph.split())
+            if size >= words_per_chunk:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def _track_words(self, text: str) -> None:
+        counts = Counter(self.vectorizer.build_analyzer()(text))
+        if not counts:
+            return
+        words = list(counts)
+        buckets = self.vectorizer.transform(words).indices
+        for word, bucket in zip(words, buckets):
+            current, seen = self.bucket_words.get(bucket, (word, 0))
+            if current == word:
+                self.bucket_words[bucket] = (word, seen + counts[word])
+            elif counts[word] > seen:
+                self.bucket_words[bucket] = (word, counts[word])
+
+    def partial_fit(self, text: str) -> None:
+        chunks = self._chunks(text)
+        matrix = self.vectorizer.transform(chunks)
+        if not matrix.nnz:
+            return
+        self.lda.partial_fit(matrix)
+        self._track_words(text)
+        self.documents_seen += 1
+
+    @property
+    def is_trained(self) -> bool:
+        return hasattr(self.lda, "components_")
+
+    def topic_words(self, topic_id: int, top_n: int = 5) -> List[Dict[str, Any]]:
+        weights = self.lda.components_[topic_id]
+        words = []
+        for bucket in np.argsort(weights)[::-1]:
+            if bucket in self.bucket_words:
+                words.append({"word": self.bucket_words[bucket][0], "weight": float(weights[bucket])})
+                if len(words) == top_n:
+                    break
+        return words
+
+    def topic_label(self, topic_id: int, top_n: int = 3) -> str:
+        return " ".join(word["word"] for word in self.topic_words(topic_id, top_n))
+
+    def transform(self, text: str) -> np.ndarray:
+        return self.lda.transform(self.vectorizer.transform([text]))[0]
+
+
+class TopicModelService:
+    """Keeps one online LDA model per user, persisted under `settings.topic_model_directory`.
+
+    A model is written to disk once `settings.topic_save_every` documents were
+    learned since its last save, when it is evicted from the cache, and on
+    `flush()` at shutdown, rather than after every update.
+    """
+
+    def __init__(self, model_directory: Optional[str] = None, cache_size: int = 64) -> None:
+        self.model_directory = Path(model_directory or settings.topic_model_directory)
+        self.cache_size = cache_size
+        self._models: "OrderedDict[str, UserTopicModel]" = OrderedDict()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._unsaved: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _model_path(self, user_id: str) -> Path:
+        return self.model_directory / f"{re.sub(r'[^0-9A-Za-z_-]', '_', user_id)}.joblib"
+
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(user_id, threading.Lock())
+
+    def _get_model(self, user_id: str) -> UserTopicModel:
+        with self._lock:
+            model = self._models.get(user_id)
+            if model is not None:
+                self._models.move_to_end(user_id)
+                return model
+
+        path = self._model_path(user_id)
+        model = None
+        if path.exists():
+            try:
+                model = joblib.load(path)
+            except Exception as e:
+                logger.warning(f"Failed to load topic model for user {user_id}: {e}")
+        if model is None:
+            model = UserTopicModel(
+                n_topics=settings.topic_count,
+                n_features=settings.topic_hash_features,
+                total_samples=settings.topic_total_samples,
+            )
+
+        with self._lock:
+            model = self._models.setdefault(user_id, model)
+            # Models in use by another thread stay cached; the rest are saved below if they learned anything
+            evicted = []
+            for other in list(self._models):
+                if len(self._models) <= self.cache_size:
+                    break
+                lock = self._locks.get(other)
+                if other == user_id or (lock is not None and not lock.acquire(blocking=False)):
+                    continue
+                evicted.append((other, self._models.pop(other), lock))
+
+        for other, evicted_model, lock in evicted:
+            try:
+                if self._unsaved.get(other):
+                    self._save_model(other, evicted_model)
+            finally:
+                if lock is not None:
+                    lock.release()
+        return model
+
+    def _save_model(self, user_id: str, model: UserTopicModel) -> None:
+        self.model_directory.mkdir(parents=True, exist_ok=True)
+        path = self._model_path(user_id)
+        # A temp file of its own per writer, so processes saving the same user never share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.model_directory, prefix=path.stem, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                joblib.dump(model, fh)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            self._unsaved.pop(user_id, None)
+
+    def _learned(self, user_id: str, documents: int) -> int:
+        with self._lock:
+            self._unsaved[user_id] = self._unsaved.get(user_id, 0) + documents
+            return self._unsaved[user_id]
+
+    def flush(self) -> None:
+        """Save every cached model that learned documents since its last save"""
+        with self._lock:
+            users = [user_id for user_id in self._models if self._unsaved.get(user_id)]
+        for user_id in users:
+            with self._user_lock(user_id):
+                with self._lock:
+                    model = self._models.get(user_id)
+                if model is not None and self._unsaved.get(user_id):
+                    self._save_model(user_id, model)
+
+    def assign(self, user_id: str, text: str, learn: bool = True,
+               threshold: float = 0.2, max_topics: int = 3) -> List[Dict[str, Any]]:
+        """Optionally update the user's model with text, then return its dominant topics"""
+        return self.assign_batch(user_id, [text], learn, threshold, max_topics)[0]
+
+    def assign_batch(self, user_id: str, texts: List[str], learn: bool = True,
+                     threshold: float = 0.2, max_topics: int = 3) -> List[List[Dict[str, Any]]]:
+        """assign() for many texts under one lock; the model is saved once enough documents were learned"""
+        with self._user_lock(user_id):
+            model = self._get_model(user_id)
+            if learn and texts:
+                for text in texts:
+                    model.partial_fit(text)
+                if self._learned(user_id, len(texts)) >= settings.topic_save_every:
+                    self._save_model(user_id, model)
+
+            if not model.is_trained or model.documents_seen < settings.topic_min_documents:
+                return [[] for _ in texts]
+            return [self._dominant_topics(model, model.transform(text), threshold, max_topics) for text in texts]
+
+    @staticmethod
+    def _dominant_topics(model: UserTopicModel, distribution: np.ndarray,
+                         threshold: float, max_topics: int) -> List[Dict[str, Any]]:
+        topics = []
+        for topic_id in np.argsort(distribution)[::-1][:max_topics]:
+            if distribution[topic_id] < threshold:
+                break
+            topics.append({
+                "topic_id": int(topic_id),
+                "label": model.topic_label(int(topic_id)),
+                "weight": float(distribution[topic_id]),
+                "words": model.topic_words(int(topic_id)),
+            })
+        return topics
+
+    def list_topics(self, user_id: str, top_n: int = 5) -> List[Dict[str, Any]]:
+        """Return every topic of the user's model with its top words"""
+        with self._user_lock(user_id):
+            model = self._get_model(user_id)
+            if not model.is_trained:
+                return []
+            return [
+                {
+                    "topic_id": topic_id,
+                    "label": model.topic_label(topic_id),
+                    "words": model.topic_words(topic_id, top_n),
+                }
+                for topic_id in range(model.lda.n_components)
+            ]
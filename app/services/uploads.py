@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional
+
+import aiofiles
+from bson import ObjectId
+from fastapi import UploadFile
+
+from app.models.schemas import FileType
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024  # 1MB
+SNIFF_BYTES = 2048
+
+# MIME types libmagic reports for each accepted file type; OOXML files are
+# sometimes only recognised as generic zip archives
+ALLOWED_MIME_TYPES = {
+    FileType.PDF: {"application/pdf"},
+    FileType.DOCX: {
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/zip",
+    },
+    FileType.PPTX: {
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/zip",
+    },
+}
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+@dataclass
+class StoredUpload:
+    path: Path
+    size: int
+    sha256: str
+    mime_type: str
+
+
+def mime_matches(file_type: FileType, mime_type: str) -> bool:
+    """Whether sniffed content is plausible for the type claimed by the extension"""
+    if file_type == FileType.TXT:
+        return mime_type.startswith("text/") or mime_type in (
+            "application/json", "application/xml", "application/x-empty", "inode/x-empty"
+        )
+    return mime_type in ALLOWED_MIME_TYPES.get(file_type, set())
+
+
+def sniff_mime_type(head: bytes) -> str:
+    """MIME type libmagic reports for the first bytes of a file"""
+    if not head:
+        return "application/x-empty"
+    # Imported here so the rest of the module works without libmagic installed
+    import magic
+    return magic.from_buffer(head, mime=True)
+
+
+async def stream_upload(upload: UploadFile, destination: Path, max_bytes: int) -> StoredUpload:
+    """Copy an upload to disk in fixed-size chunks.
+
+    The size limit is enforced as bytes arrive, the SHA-256 is computed on
+    the fly and the first bytes are kept for MIME sniffing, so memory per
+    upload stays at one chunk regardless of file size. The file is written
+    under a temporary name and only moved into place once complete.
+    """
+    partial = destination.with_name(destination.name + ".part")
+    digest = hashlib.sha256()
+    head = b""
+    size = 0
+
+    try:
+        async with aiofiles.open(partial, "wb") as out:
+            while chunk := await upload.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"File exceeds {max_bytes} bytes")
+                if len(head) < SNIFF_BYTES:
+                    head += chunk[:SNIFF_BYTES - len(head)]
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        if partial.exists():
+            os.remove(partial)
+        raise
+
+    os.replace(partial, destination)
+    return StoredUpload(
+        path=destination,
+        size=size,
+        sha256=digest.hexdigest(),
+        mime_type=sniff_mime_type(head)
+    )
+
+
+class SidecarWriter:
+    """Writes extracted blocks to a sidecar file while they flow on to the caller"""
+
+    def __init__(self, out) -> None:
+        self._out = out
+        self._first = True
+
+    async def tee(self, blocks: AsyncIterable[str]) -> AsyncIterator[str]:
+        async for block in blocks:
+            await self._out.write(block if self._first else "\n" + block)
+            self._first = False
+            yield block
+
+
+class UploadStore:
+    """Uploaded files stored once per content hash, with their extracted text.
+
+    The original bytes live at `<sha256><ext>` and the extracted text in a
+    `<sha256>.extracted.txt` sidecar next to it. Each upload gets a record
+    keyed by its file_id in the `uploads` collection pointing at both, so a
+    later /process call can work from the file_id alone, and a second
+    upload of the same bytes reuses the sidecar instead of extracting again.
+    """
+
+    def __init__(self, directory: Path, collection_name: str = "uploads") -> None:
+        self.directory = directory
+        self.collection_name = collection_name
+
+    def file_path(self, sha256: str, suffix: str) -> Path:
+        return self.directory / f"{sha256}{suffix.lower()}"
+
+    def sidecar_path(self, sha256: str) -> Path:
+        return self.directory / f"{sha256}.extracted.txt"
+
+    def adopt(self, stored: StoredUpload, suffix: str) -> Path:
+        """Move a streamed upload to its content-addressed name, dropping it if a copy already exists"""
+        target = self.file_path(stored.sha256, suffix)
+        if target == stored.path:
+            return target
+        if target.exists():
+            os.remove(stored.path)
+        else:
+            os.replace(stored.path, target)
+        stored.path = target
+        return target
+
+    async def find_extracted(self, db, sha256: str) -> Optional[Dict[str, Any]]:
+        """Most recent record of the same bytes whose sidecar is still on disk"""
+        record = await db[self.collection_name].find_one(
+            {"sha256": sha256}, sort=[("created_at", -1)]
+        )
+        if record is None or not self.sidecar_path(sha256).exists():
+            return None
+        return record
+
+    @asynccontextmanager
+    async def write_sidecar(self, sha256: str) -> AsyncIterator[SidecarWriter]:
+        """Sidecar file that only appears under its final name if extraction completes"""
+        target = self.sidecar_path(sha256)
+        partial = target.with_name(f"{target.name}.{ObjectId()}.part")
+        try:
+            async with aiofiles.open(partial, "w", encoding="utf-8") as out:
+                yield SidecarWriter(out)
+        except BaseException:
+            if partial.exists():
+                os.remove(partial)
+            raise
+        os.replace(partial, target)
+
+    async def read_text(self, record: Dict[str, Any]) -> str:
+        async with aiofiles.open(self.sidecar_path(record["sha256"]), "r", encoding="utf-8") as fh:
+            return await fh.read()
+
+    async def record(self, db, file_id: str, user_id: str, filename: str, file_type: FileType,
+                     stored: StoredUpload, **extracted: Any) -> Dict[str, Any]:
+        doc = {
+            "_id": ObjectId(file_id),
+            "user_id": user_id,
+            "filename": filename,
+            "file_type": file_type.value,
+            "file_size": stored.size,
+            "sha256": stored.sha256,
+            "mime_type": stored.mime_type,
+            "created_at": datetime.utcnow(),
+            **extracted
+        }
+        await db[self.collection_name].insert_one(doc)
+        return doc
+
+    async def get(self, db, file_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        if not ObjectId.is_valid(file_id):
+            return None
+        return await db[self.collection_name].find_one({"_id": ObjectId(file_id), "user_id": user_id})
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.embeddings import decode_embeddings, l2_normalize
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def spherical_kmeans(vectors: np.ndarray, n_clusters: int, iterations: int = 10, seed: int = 42) -> np.ndarray:
+    """Cluster unit vectors by cosine similarity and return unit-norm centroids"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        order = np.argsort(assignment, kind="stable")
+        present, starts = np.unique(assignment[order], return_index=True)
+        sums = np.zeros_like(centroids)
+        sums[present] = np.add.reduceat(vectors[order], starts, axis=0)
+        empty = ~sums.any(axis=1)
+        if empty.any():
+            # Re-seed empty clusters with random points
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        centroids = l2_normalize(sums)
+    return centroids
+
+
+class VectorIndex:
+    """In-process nearest-neighbour index over L2-normalized embeddings.
+
+    Vectors are kept in one contiguous float32 matrix, memory-mapped from an
+    unlinked file in `directory` when given; every process owns its own file,
+    so workers never write each other's matrix. Once the index holds
+    `min_ivf_size` vectors it trains an inverted-file (IVF) coarse quantizer
+    and answers queries by scanning only the `n_probe` closest lists; smaller
+    indexes, per-owner queries over small libraries and `exact=True` use
+    brute-force NumPy search instead. Training clusters a snapshot outside the
+    lock and swaps the result in, so searches and inserts keep running.
+    """
+
+    def __init__(self, directory: Optional[str | Path] = None, dim: Optional[int] = None,
+                 n_probe: int = 8, min_ivf_size: int = 4096,
+                 exact_owner_limit: int = 20000, initial_capacity: int = 1024) -> None:
+        self.directory = Path(directory) if directory else None
+        self.dim = dim
+        self.n_probe = n_probe
+        self.min_ivf_size = min_ivf_size
+        self.exact_owner_limit = exact_owner_limit
+        self._initial_capacity = initial_capacity
+
+        self._matrix: Optional[np.ndarray] = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._owner_codes = np.zeros(0, dtype=np.int32)
+        self._assignment = np.zeros(0, dtype=np.int32)
+        self._size = 0
+        self._ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._owner_code_of: Dict[Optional[str], int] = {}
+        self._owner_counts: Dict[int, int] = {}
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self._trained_size = 0
+        self._lock = threading.RLock()
+        self._train_lock = threading.Lock()
+        # Rows overwritten while a training run works on its snapshot
+        self._changed_rows: Optional[set] = None
+        self._file = None
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._row_of
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.directory is None:
+            return np.zeros((capacity, self.dim), dtype=np.float32)
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Deleted on close and on crash; the index is rebuilt from the database at startup
+            self._file = tempfile.TemporaryFile(dir=self.directory, prefix="vectors-", suffix=".f32")
+        self._file.truncate(capacity * self.dim * np.dtype(np.float32).itemsize)
+        return np.memmap(self._file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, 2 * capacity, self._initial_capacity)
+
+        if self.directory is None:
+            matrix = self._allocate(new_capacity)
+            if self._matrix is not None:
+                matrix[:self._size] = self._matrix[:self._size]
+        else:
+            if self._matrix is not None:
+                self._matrix.flush()
+                self._matrix = None
+            matrix = self._allocate(new_capacity)
+        self._matrix = matrix
+
+        grow = new_capacity - capacity
+        self._alive = np.concatenate([self._alive, np.zeros(grow, dtype=bool)])
+        self._owner_codes = np.concatenate([self._owner_codes, np.full(grow, -1, dtype=np.int32)])
+        self._assignment = np.concatenate([self._assignment, np.full(grow, -1, dtype=np.int32)])
+
+    def _owner_code(self, owner: Optional[str]) -> int:
+        code = self._owner_code_of.get(owner)
+        if code is None:
+            code = len(self._owner_code_of)
+            self._owner_code_of[owner] = code
+        return code
+
+    def _remove_row(self, row: int) -> None:
+        self._alive[row] = False
+        code = int(self._owner_codes[row])
+        self._owner_counts[code] = self._owner_counts.get(code, 1) - 1
+        self._ids[row] = None
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray, owners: Optional[Sequence[Optional[str]]] = None) -> None:
+        """Insert vectors; ids that are already indexed have their row overwritten in place"""
+        vectors = l2_normalize(np.atleast_2d(vectors))
+        if not len(ids):
+            return
+        owners = list(owners) if owners is not None else [None] * len(ids)
+        self._insert(ids, vectors, owners)
+        if self._needs_training() and self._train_lock.acquire(blocking=False):
+            # Skipped while another thread trains; that run picks these rows up when it swaps
+            try:
+                self._train()
+            finally:
+                self._train_lock.release()
+
+    def _insert(self, ids: Sequence[str], vectors: np.ndarray, owners: List[Optional[str]]) -> None:
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+
+            # The last occurrence wins when a batch repeats an id
+            latest = {key: i for i, key in enumerate(ids)}
+            updates = [(self._row_of[key], i) for key, i in latest.items() if key in self._row_of]
+            inserts = [(key, i) for key, i in latest.items() if key not in self._row_of]
+
+            if updates:
+                rows = np.array([row for row, _ in updates], dtype=np.int64)
+                positions = [i for _, i in updates]
+                self._update_rows(rows, vectors[positions], [owners[i] for i in positions])
+
+            if inserts:
+                start = self._size
+                end = start + len(inserts)
+                self._ensure_capacity(end)
+                self._matrix[start:end] = vectors[[i for _, i in inserts]]
+                self._alive[start:end] = True
+                for row, (key, i) in enumerate(inserts, start=start):
+                    code = self._owner_code(owners[i])
+                    self._row_of[key] = row
+                    self._ids.append(key)
+                    self._owner_codes[row] = code
+                    self._owner_counts[code] = self._owner_counts.get(code, 0) + 1
+                self._size = end
+
+                if self.is_trained:
+                    self._assign_rows(np.arange(start, end))
+
+    def _update_rows(self, rows: np.ndarray, vectors: np.ndarray, owners: List[Optional[str]]) -> None:
+        self._matrix[rows] = vectors
+        if self._changed_rows is not None:
+            self._changed_rows.update(rows.tolist())
+        for row, owner in zip(rows.tolist(), owners):
+            old_code = int(self._owner_codes[row])
+            code = self._owner_code(owner)
+            if code != old_code:
+                self._owner_counts[old_code] -= 1
+                self._owner_counts[code] = self._owner_counts.get(code, 0) + 1
+                self._owner_codes[row] = code
+            if self.is_trained:
+                self._lists[self._assignment[row]].remove(row)
+        if self.is_trained:
+            self._assign_rows(rows)
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            row = self._row_of.pop(key, None)
+            if row is None:
+                return False
+            self._remove_row(row)
+            return True
+
+    def _assign_rows(self, rows: np.ndarray) -> None:
+        assignment = np.argmax(self._matrix[rows] @ self._centroids.T, axis=1).astype(np.int32)
+        self._assignment[rows] = assignment
+        for row, cluster in zip(rows.tolist(), assignment.tolist()):
+            self._lists[cluster].append(row)
+
+    def _compact(self) -> None:
+        """Drop tombstoned rows so the matrix stays contiguous"""
+        keep = np.flatnonzero(self._alive[:self._size])
+        count = len(keep)
+        self._matrix[:count] = self._matrix[keep]
+        self._owner_codes[:count] = self._owner_codes[keep]
+        self._alive[:count] = True
+        self._alive[count:self._size] = False
+        self._owner_codes[count:self._size] = -1
+        self._ids = [self._ids[row] for row in keep.tolist()]
+        self._row_of = {key: row for row, key in enumerate(self._ids)}
+        self._size = count
+
+    def _needs_training(self) -> bool:
+        with self._lock:
+            alive = len(self._row_of)
+            if alive < self.min_ivf_size:
+                return False
+            return not (self.is_trained and alive < 2 * self._trained_size and self._size < 2 * alive)
+
+    def train(self, n_lists: Optional[int] = None) -> None:
+        """(Re)build the IVF coarse quantizer over the live vectors"""
+        with self._train_lock:
+            self._train(n_lists)
+
+    def _train(self, n_lists: Optional[int] = None) -> None:
+        with self._lock:
+            if self._size > len(self._row_of):
+                # Compaction renumbers rows, so the old lists are dropped and
+                # searches scan exactly until the new quantizer is swapped in
+                self._centroids = None
+                self._lists = []
+                self._compact()
+            count = self._size
+            if count == 0:
+                return
+            matrix = self._matrix
+            self._changed_rows = set()
+
+        try:
+            # Rows below count are only ever overwritten in place (tracked in
+            # _changed_rows) and the matrix is only compacted by training, so
+            # the snapshot can be read without the lock
+            n_lists = n_lists or max(1, int(4 * np.sqrt(count)))
+            n_lists = min(n_lists, count)
+            rng = np.random.default_rng(42)
+            sample_size = min(count, 32 * n_lists)
+            sample = np.asarray(matrix[np.sort(rng.choice(count, sample_size, replace=False))])
+            centroids = spherical_kmeans(sample, n_lists)
+            assignment = np.concatenate([
+                np.argmax(matrix[start:min(count, start + 65536)] @ centroids.T, axis=1).astype(np.int32)
+                for start in range(0, count, 65536)
+            ])
+            order = np.argsort(assignment, kind="stable")
+            bounds = np.searchsorted(assignment[order], np.arange(n_lists + 1))
+            lists = [order[bounds[i]:bounds[i + 1]].tolist() for i in range(n_lists)]
+        except BaseException:
+            with self._lock:
+                self._changed_rows = None
+            raise
+
+        with self._lock:
+            changed = sorted(row for row in self._changed_rows if row < count)
+            self._changed_rows = None
+            for row in changed:
+                lists[assignment[row]].remove(row)
+            self._centroids = centroids
+            self._lists = lists
+            self._assignment[:count] = assignment
+            # Rows overwritten or inserted while training are assigned with the new centroids
+            late = np.concatenate([np.array(changed, dtype=np.int64), np.arange(count, self._size)])
+            if len(late):
+                self._assign_rows(late)
+            self._trained_size = count
+        logger.info(f"Trained IVF index with {n_lists} lists over {count} vectors")
+
+    def _top_k(self, rows: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if len(scores) > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best])]
+        return [(self._ids[int(rows[i])], float(scores[i])) for i in best]
+
+    def search(self, query: np.ndarray, k: int = 10, owner: Optional[str] = None,
+               exact: bool = False) -> List[Tuple[str, float]]:
+        """Return up to k (id, cosine similarity) pairs, best first, optionally for one owner only"""
+        with self._lock:
+            if not self._row_of or k <= 0:
+                return []
+            query = l2_normalize(np.asarray(query, dtype=np.float32).reshape(-1))
+            size = self._size
+
+            code = None
+            if owner is not None:
+                code = self._owner_code_of.get(owner)
+                if code is None:
+                    return []
+                # Small per-owner libraries are cheaper and exact to scan directly
+                exact = exact or self._owner_counts.get(code, 0) <= self.exact_owner_limit
+
+            if (exact or not self.is_trained) and code is None:
+                # Scoring the contiguous matrix beats gathering the live rows first
+                rows = np.flatnonzero(self._alive[:size])
+                scores = (self._matrix[:size] @ query)[rows]
+                return self._top_k(rows, scores, k)
+
+            if exact or not self.is_trained:
+                rows = np.flatnonzero(self._alive[:size] & (self._owner_codes[:size] == code))
+            else:
+                probes = min(self.n_probe, len(self._lists))
+                closest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+                rows = np.fromiter(
+                    (row for cluster in closest.tolist() for row in self._lists[cluster]),
+                    dtype=np.int64
+                )
+                mask = self._alive[rows]
+                if code is not None:
+                    mask &= self._owner_codes[rows] == code
+                rows = rows[mask]
+
+            if not len(rows):
+                return []
+            scores = self._matrix[rows] @ query
+            return self._top_k(rows, scores, k)
+
+    def flush(self) -> None:
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+
+
+document_index = VectorIndex(directory=settings.vector_index_directory, n_probe=settings.vector_index_n_probe)
+article_index = VectorIndex(directory=settings.vector_index_directory, n_probe=settings.vector_index_n_probe)
+
+
+async def load_index(index: VectorIndex, collection, owner_field: Optional[str] = None,
+                     batch_size: int = 1000) -> int:
+    """Bulk-load every stored embedding of a collection into an index"""
+    projection = {"embedding": 1}
+    if owner_field:
+        projection[owner_field] = 1
+
+    loaded = 0
+    ids: List[str] = []
+    stored: list = []
+    owners: List[Optional[str]] = []
+
+    async for doc in collection.find({"embedding": {"$exists": True}}, projection):
+        ids.append(str(doc["_id"]))
+        stored.append(doc["embedding"])
+        owners.append(doc.get(owner_field) if owner_field else None)
+        if len(ids) >= batch_size:
+            index.add(ids, decode_embeddings(stored), owners)
+            loaded += len(ids)
+            ids, stored, owners = [], [], []
+    if ids:
+        index.add(ids, decode_embeddings(stored), owners)
+        loaded += len(ids)
+
+    logger.info(f"Loaded {loaded} vectors from {collection.name}")
+    return loaded
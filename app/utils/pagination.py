@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+import bson
+from bson import ObjectId
+from bson.errors import BSONError
+
+CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Any, object_id: ObjectId) -> str:
+    """Opaque token for the position just after (sort_value, _id)"""
+    raw = bson.encode({"v": sort_value, "id": object_id})
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[Any, ObjectId]:
+    """Inverse of encode_cursor; raises ValueError for tokens this module did not produce"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = bson.decode(raw)
+        if not isinstance(data.get("id"), ObjectId):
+            raise ValueError("cursor has no _id")
+        return data.get("v"), data["id"]
+    except (binascii.Error, BSONError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def sort_spec(sort_field: str, direction: int) -> List[Tuple[str, int]]:
+    """Sort on the field with _id as tiebreaker, so every position is unique"""
+    if sort_field == "_id":
+        return [("_id", direction)]
+    return [(sort_field, direction), ("_id", direction)]
+
+
+def keyset_filter(sort_field: str, direction: int, token: str) -> Dict[str, Any]:
+    """Range condition selecting documents after the cursor in (sort_field, _id) order.
+
+    Missing/null sort values sort before everything ascending and after
+    everything descending, which the extra branches account for.
+    """
+    value, object_id = decode_cursor(token)
+    after = "$gt" if direction > 0 else "$lt"
+    if sort_field == "_id":
+        return {"_id": {after: object_id}}
+
+    if value is None:
+        branches = [{sort_field: None, "_id": {after: object_id}}]
+        if direction > 0:
+            branches.append({sort_field: {"$ne": None}})
+    else:
+        branches = [
+            {sort_field: {after: value}},
+            {sort_field: value, "_id": {after: object_id}},
+        ]
+        if direction < 0:
+            branches.append({sort_field: None})
+    return {"$or": branches}
+
+
+def apply_cursor(query: Dict[str, Any], sort_field: str, direction: int, token: Optional[str]) -> Dict[str, Any]:
+    """Return query restricted to documents after the cursor token, if any"""
+    if not token:
+        return query
+    return {**query, "$and": query.get("$and", []) + [keyset_filter(sort_field, direction, token)]}
+
+
+def next_cursor(docs: List[Dict[str, Any]], sort_field: str, limit: int) -> Optional[str]:
+    """Cursor for the page after docs, or None when this was the last page"""
+    if len(docs) < limit or not docs:
+        return None
+    last = docs[-1]
+    return encode_cursor(last.get(sort_field) if sort_field != "_id" else None, last["_id"])
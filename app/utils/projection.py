@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from app.models.schemas import DocumentListItem, DocumentPublic
+
+VIEWS = ("summary", "full")
+
+# Large internal fields never needed to render a document
+INTERNAL_FIELDS = ("embedding", "minhash", "sentiment_timeline")
+
+FULL_PROJECTION: Dict[str, int] = {field: 0 for field in INTERNAL_FIELDS}
+SUMMARY_PROJECTION: Dict[str, int] = {field: 1 for field in DocumentListItem.model_fields if field != "id"}
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated `fields` parameter, rejecting names DocumentPublic does not have"""
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = set(requested) - set(DocumentPublic.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+
+def document_projection(view: str, fields: Optional[List[str]], extra: Optional[List[str]] = None) -> Dict[str, int]:
+    """Mongo projection for a listing; `extra` adds fields the caller needs internally, e.g. the sort key"""
+    if fields:
+        projection = {field: 1 for field in fields if field != "id"}
+        if "content" in fields:
+            projection["content_hash"] = 1
+    elif view == "summary":
+        projection = dict(SUMMARY_PROJECTION)
+    else:
+        return dict(FULL_PROJECTION)
+    for field in extra or []:
+        if field != "_id":
+            projection[field] = 1
+    return projection
+
+
+def needs_content(view: str, fields: Optional[List[str]]) -> bool:
+    """Whether the listing has to load text from the content store"""
+    return "content" in fields if fields else view == "full"
+
+
+def serialize_document(doc: Dict[str, Any], view: str, fields: Optional[List[str]]):
+    """Shape one projected Mongo document for the requested view"""
+    doc["id"] = str(doc["_id"])
+    if fields:
+        return {"id": doc["id"], **{field: doc.get(field) for field in fields if field != "id"}}
+    if view == "summary":
+        return DocumentListItem(**doc)
+    return DocumentPublic(**doc)
@@ -1,42 +1,92 @@
-from pydantic_settings import BaseSettings
-from typing import List
-
-
-class Settings(BaseSettings):
-    # Security
-    secret_key: str = "your-secret-key-change-this-in-production"
-    algorithm: str = "HS256"
-    access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
-    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:5173", "http://localhost:8080"]
-
-    # MongoDB configuration
-    mongo_uri: str = "mongodb://localhost:27017"
-    database_name: str = "instabrief"
-
-    # Elasticsearch configuration
-    elasticsearch_url: str = "http://localhost:9200"
-    elasticsearch_index: str = "instabrief_documents"
-
-    # File upload settings
-    max_file_size: int = 25 * 1024 * 1024  # 25MB
-    allowed_file_types: List[str] = [".pdf", ".docx", ".txt", ".pptx"]
-    upload_directory: str = "uploads"
-
-    # AI Model settings
-    default_summary_length: int = 150
-    max_summary_length: int = 500
-    enable_tts: bool = True
-    enable_advanced_nlp: bool = True
-
-    # API settings
-    api_v1_prefix: str = "/api/v1"
-    project_name: str = "InstaBrief"
-    version: str = "1.0.0"
-
-    class Config:
-        env_file = ".env"
-
-
-settings = Settings()
-
-
+from pydantic_settings import BaseSettings
+from typing import List, Optional
+
+
+class Settings(BaseSettings):
+    # Security
+    secret_key: str = "your-secret-key-change-this-in-production"
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 60 * 24 * 7  # 7 days
+    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:5173", "http://localhost:8080"]
+
+    # MongoDB configuration
+    mongo_uri: str = "mongodb://localhost:27017"
+    database_name: str = "instabrief"
+
+    # Elasticsearch configuration
+    elasticsearch_url: str = "http://localhost:9200"
+    elasticsearch_index: str = "instabrief_documents"
+    library_search_max_hits: int = 1000  # matching ids fetched per document listing search
+
+    # File upload settings
+    max_file_size: int = 25 * 1024 * 1024  # 25MB
+    allowed_file_types: List[str] = [".pdf", ".docx", ".txt", ".pptx"]
+    upload_directory: str = "uploads"
+
+    # AI Model settings
+    default_summary_length: int = 150
+    max_summary_length: int = 500
+    enable_tts: bool = True
+    enable_advanced_nlp: bool = True
+
+    # Embedding settings
+    embedding_model_name: str = "all-MiniLM-L6-v2"
+    embedding_batch_size: int = 64
+    embedding_cache_max_bytes: int = 64 * 1024 * 1024  # 64MB
+    embedding_cache_dir: Optional[str] = None  # persist embeddings to a float16 memmap when set
+    embedding_storage_dtype: str = "float16"  # "float16" or "int8" for embeddings stored in MongoDB
+
+    # Topic model settings
+    topic_model_directory: str = "models/topics"
+    topic_count: int = 10
+    topic_hash_features: int = 2 ** 16
+    topic_total_samples: int = 10000  # expected library size, scales online LDA updates
+    topic_min_documents: int = 3  # documents seen before topics are assigned
+    topic_save_every: int = 20  # documents learned between saves of a user's model; also saved on shutdown
+
+    # Near-duplicate detection settings
+    duplicate_threshold: float = 0.85  # estimated Jaccard similarity of shingles
+    minhash_num_perm: int = 128
+    minhash_bands: int = 16
+    minhash_shingle_size: int = 5
+    duplicate_index_cache_size: int = 256  # users whose LSH index is kept in memory
+
+    # Content store settings
+    content_store_codec: str = "zstd"  # "zstd" (needs zstandard, else zlib is used) or "zlib"
+    content_compression_level: int = 6
+
+    # Vector index settings
+    vector_index_directory: Optional[str] = "indexes"  # memory-map per-process index matrices here; None keeps them in RAM
+    vector_index_n_probe: int = 8  # IVF lists scanned per query
+
+    # Batch ingest settings
+    batch_max_items: int = 500  # documents per /api/documents/batch request
+    batch_max_archive_size: int = 200 * 1024 * 1024  # 200MB zip upload
+    batch_nlp_size: int = 32  # texts per spaCy pipe() batch
+    batch_chunk_size: int = 64  # documents a batch job holds in memory and analyses together
+
+    # Job queue settings
+    job_workers: int = 2  # concurrent background jobs per API process
+    job_lease_seconds: int = 300  # a job is re-claimable this long after its worker stops renewing
+    job_max_attempts: int = 3
+    job_retry_backoff_seconds: float = 10.0  # doubled after every failed attempt
+    job_poll_interval: float = 2.0
+
+    # Compute budget settings
+    compute_core_budget: Optional[int] = None  # defaults to os.cpu_count()
+    compute_interactive_share: float = 0.5  # share of the budget for request-path work
+    compute_process_workers: Optional[int] = None  # taken from the non-interactive share, half of it by default
+    compute_intra_op_threads: Optional[int] = None  # torch/BLAS threads per task
+
+    # API settings
+    api_v1_prefix: str = "/api/v1"
+    project_name: str = "InstaBrief"
+    version: str = "1.0.0"
+
+    class Config:
+        env_file = ".env"
+
+
+settings = Settings()
+
+
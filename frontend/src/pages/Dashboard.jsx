@@ -1,382 +1,382 @@
-import React, { useState, useEffect } from 'react'
-import { Link } from 'react-router-dom'
-import { motion } from 'framer-motion'
-import { 
-  FileText, 
-  Brain, 
-  Clock, 
-  TrendingUp, 
-  Plus, 
-  Search,
-  Filter,
-  Download,
-  Eye,
-  MoreVertical,
-  Upload,
-  BarChart3,
-  Zap
-} from 'lucide-react'
-import { useQuery } from 'react-query'
-import { api } from '../lib/api'
-import toast from 'react-hot-toast'
-
-const Dashboard = () => {
-  const [searchQuery, setSearchQuery] = useState('')
-  const [filterType, setFilterType] = useState('all')
-  const [sortBy, setSortBy] = useState('newest')
-
-  // Fetch documents
-  const { data: documents = [], isLoading, refetch } = useQuery(
-    ['documents', searchQuery, filterType, sortBy],
-    async () => {
-      const params = new URLSearchParams()
-      if (searchQuery) params.append('q', searchQuery)
-      if (filterType !== 'all') params.append('type', filterType)
-      if (sortBy) params.append('sort', sortBy)
-      
-      const response = await api.get(`/documents?${params.toString()}`)
-      return response.data
-    }
-  )
-
-  // Fetch analytics
-  const { data: analytics } = useQuery(
-    'analytics',
-    async () => {
-      const response = await api.get('/analytics')
-      return response.data
-    }
-  )
-
-  const handleSearch = (e) => {
-    e.preventDefault()
-    refetch()
-  }
-
-  const handleDelete = async (id) => {
-    if (window.confirm('Are you sure you want to delete this document?')) {
-      try {
-        await api.delete(`/documents/${id}`)
-        toast.success('Document deleted successfully')
-        refetch()
-      } catch (error) {
-        toast.error('Failed to delete document')
-      }
-    }
-  }
-
-  const getFileIcon = (type) => {
-    switch (type) {
-      case 'pdf':
-        return '📄'
-      case 'docx':
-        return '📝'
-      case 'pptx':
-        return '📊'
-      case 'txt':
-        return '📃'
-      default:
-        return '📄'
-    }
-  }
-
-  const getStatusColor = (status) => {
-    switch (status) {
-      case 'completed':
-        return 'bg-green-100 text-green-800 dark:bg-green-900 dark:text-green-200'
-      case 'processing':
-        return 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900 dark:text-yellow-200'
-      case 'failed':
-        return 'bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200'
-      default:
-        return 'bg-gray-100 text-gray-800 dark:bg-gray-700 dark:text-gray-200'
-    }
-  }
-
-  return (
-    <div className="space-y-6">
-      {/* Header */}
-      <div className="flex items-center justify-between">
-        <div>
-          <h1 className="text-3xl font-bold text-gray-900 dark:text-white">Dashboard</h1>
-          <p className="mt-1 text-sm text-gray-500 dark:text-gray-400">
-            Welcome back! Here's what's happening with your documents.
-          </p>
-        </div>
-        <Link
-          to="/new"
-          className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-lg text-white bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-700 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-purple-500 transition-all duration-200 transform hover:scale-105"
-        >
-          <Plus className="h-5 w-5 mr-2" />
-          New Document
-        </Link>
-      </div>
-
-      {/* Analytics Cards */}
-      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ duration: 0.5 }}
-          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
-        >
-          <div className="p-5">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <div className="w-8 h-8 bg-blue-100 dark:bg-blue-900 rounded-lg flex items-center justify-center">
-                  <FileText className="h-5 w-5 text-blue-600 dark:text-blue-400" />
-                </div>
-              </div>
-              <div className="ml-5 w-0 flex-1">
-                <dl>
-                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
-                    Documents Processed
-                  </dt>
-                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
-                    {analytics?.total_documents || 0}
-                  </dd>
-                </dl>
-              </div>
-            </div>
-          </div>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ duration: 0.5, delay: 0.1 }}
-          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
-        >
-          <div className="p-5">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <div className="w-8 h-8 bg-purple-100 dark:bg-purple-900 rounded-lg flex items-center justify-center">
-                  <Brain className="h-5 w-5 text-purple-600 dark:text-purple-400" />
-                </div>
-              </div>
-              <div className="ml-5 w-0 flex-1">
-                <dl>
-                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
-                    AI Summaries Generated
-                  </dt>
-                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
-                    {analytics?.total_summaries || 0}
-                  </dd>
-                </dl>
-              </div>
-            </div>
-          </div>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ duration: 0.5, delay: 0.2 }}
-          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
-        >
-          <div className="p-5">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <div className="w-8 h-8 bg-green-100 dark:bg-green-900 rounded-lg flex items-center justify-center">
-                  <Clock className="h-5 w-5 text-green-600 dark:text-green-400" />
-                </div>
-              </div>
-              <div className="ml-5 w-0 flex-1">
-                <dl>
-                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
-                    Time Saved
-                  </dt>
-                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
-                    {analytics?.time_saved_hours || 0}h
-                  </dd>
-                </dl>
-              </div>
-            </div>
-          </div>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ duration: 0.5, delay: 0.3 }}
-          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
-        >
-          <div className="p-5">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <div className="w-8 h-8 bg-orange-100 dark:bg-orange-900 rounded-lg flex items-center justify-center">
-                  <TrendingUp className="h-5 w-5 text-orange-600 dark:text-orange-400" />
-                </div>
-              </div>
-              <div className="ml-5 w-0 flex-1">
-                <dl>
-                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
-                    Efficiency Gain
-                  </dt>
-                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
-                    {analytics?.efficiency_gain_percent || 0}%
-                  </dd>
-                </dl>
-              </div>
-            </div>
-          </div>
-        </motion.div>
-      </div>
-
-      {/* Search and Filters */}
-      <div className="bg-white dark:bg-gray-800 shadow rounded-lg p-6">
-        <div className="flex flex-col sm:flex-row gap-4">
-          <form onSubmit={handleSearch} className="flex-1">
-            <div className="relative">
-              <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
-                <Search className="h-5 w-5 text-gray-400" />
-              </div>
-              <input
-                type="text"
-                placeholder="Search documents, summaries, or tags..."
-                className="block w-full pl-10 pr-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg leading-5 bg-white dark:bg-gray-700 placeholder-gray-500 dark:placeholder-gray-400 focus:outline-none focus:placeholder-gray-400 focus:ring-1 focus:ring-purple-500 focus:border-purple-500 text-gray-900 dark:text-white"
-                value={searchQuery}
-                onChange={(e) => setSearchQuery(e.target.value)}
-              />
-            </div>
-          </form>
-          
-          <div className="flex gap-2">
-            <select
-              value={filterType}
-              onChange={(e) => setFilterType(e.target.value)}
-              className="px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white focus:outline-none focus:ring-1 focus:ring-purple-500 focus:border-purple-500"
-            >
-              <option value="all">All Types</option>
-              <option value="pdf">PDF</option>
-              <option value="docx">Word</option>
-              <option value="pptx">PowerPoint</option>
-              <option value="txt">Text</option>
-            </select>
-            
-            <select
-              value={sortBy}
-              onChange={(e) => setSortBy(e.target.value)}
-              className="px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white focus:outline-none focus:ring-1 focus:ring-purple-500 focus:border-purple-500"
-            >
-              <option value="newest">Newest First</option>
-              <option value="oldest">Oldest First</option>
-              <option value="name">Name A-Z</option>
-              <option value="size">Size</option>
-            </select>
-          </div>
-        </div>
-      </div>
-
-      {/* Documents List */}
-      <div className="bg-white dark:bg-gray-800 shadow rounded-lg">
-        <div className="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-          <h3 className="text-lg font-medium text-gray-900 dark:text-white">Recent Documents</h3>
-        </div>
-        
-        {isLoading ? (
-          <div className="p-6 text-center">
-            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-600 mx-auto"></div>
-            <p className="mt-2 text-sm text-gray-500 dark:text-gray-400">Loading documents...</p>
-          </div>
-        ) : documents.length === 0 ? (
-          <div className="p-6 text-center">
-            <FileText className="h-12 w-12 text-gray-400 mx-auto mb-4" />
-            <h3 className="text-lg font-medium text-gray-900 dark:text-white mb-2">No documents yet</h3>
-            <p className="text-gray-500 dark:text-gray-400 mb-4">
-              Get started by uploading your first document for AI-powered summarization.
-            </p>
-            <Link
-              to="/new"
-              className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-lg text-white bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-700 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-purple-500 transition-all duration-200"
-            >
-              <Upload className="h-5 w-5 mr-2" />
-              Upload Document
-            </Link>
-          </div>
-        ) : (
-          <div className="divide-y divide-gray-200 dark:divide-gray-700">
-            {documents.map((doc, index) => (
-              <motion.div
-                key={doc.id}
-                initial={{ opacity: 0, y: 20 }}
-                animate={{ opacity: 1, y: 0 }}
-                transition={{ duration: 0.3, delay: index * 0.1 }}
-                className="p-6 hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors"
-              >
-                <div className="flex items-center justify-between">
-                  <div className="flex items-center space-x-4">
-                    <div className="flex-shrink-0">
-                      <div className="w-10 h-10 bg-gray-100 dark:bg-gray-600 rounded-lg flex items-center justify-center">
-                        <span className="text-lg">{getFileIcon(doc.file_type)}</span>
-                      </div>
-                    </div>
-                    <div className="flex-1 min-w-0">
-                      <Link
-                        to={`/documents/${doc.id}`}
-                        className="text-lg font-medium text-gray-900 dark:text-white hover:text-purple-600 dark:hover:text-purple-400 transition-colors"
-                      >
-                        {doc.title}
-                      </Link>
-                      <p className="text-sm text-gray-500 dark:text-gray-400 mt-1">
-                        {doc.file_type?.toUpperCase()} • {doc.file_size ? `${(doc.file_size / 1024).toFixed(1)} KB` : 'Unknown size'} • {new Date(doc.created_at).toLocaleDateString()}
-                      </p>
-                      {doc.summary && (
-                        <p className="text-sm text-gray-600 dark:text-gray-300 mt-2 line-clamp-2">
-                          {doc.summary}
-                        </p>
-                      )}
-                      {doc.tags && doc.tags.length > 0 && (
-                        <div className="flex flex-wrap gap-1 mt-2">
-                          {doc.tags.slice(0, 3).map((tag, tagIndex) => (
-                            <span
-                              key={tagIndex}
-                              className="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-purple-100 text-purple-800 dark:bg-purple-900 dark:text-purple-200"
-                            >
-                              {tag}
-                            </span>
-                          ))}
-                          {doc.tags.length > 3 && (
-                            <span className="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-gray-100 text-gray-800 dark:bg-gray-700 dark:text-gray-200">
-                              +{doc.tags.length - 3} more
-                            </span>
-                          )}
-                        </div>
-                      )}
-                    </div>
-                  </div>
-                  
-                  <div className="flex items-center space-x-2">
-                    <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${getStatusColor(doc.processing_status)}`}>
-                      {doc.processing_status}
-                    </span>
-                    
-                    <div className="flex items-center space-x-1">
-                      <Link
-                        to={`/documents/${doc.id}`}
-                        className="p-2 text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 transition-colors"
-                        title="View document"
-                      >
-                        <Eye className="h-4 w-4" />
-                      </Link>
-                      
-                      <button
-                        onClick={() => handleDelete(doc.id)}
-                        className="p-2 text-gray-400 hover:text-red-600 transition-colors"
-                        title="Delete document"
-                      >
-                        <MoreVertical className="h-4 w-4" />
-                      </button>
-                    </div>
-                  </div>
-                </div>
-              </motion.div>
-            ))}
-          </div>
-        )}
-      </div>
-    </div>
-  )
-}
-
+import React, { useState, useEffect } from 'react'
+import { Link } from 'react-router-dom'
+import { motion } from 'framer-motion'
+import { 
+  FileText, 
+  Brain, 
+  Clock, 
+  TrendingUp, 
+  Plus, 
+  Search,
+  Filter,
+  Download,
+  Eye,
+  MoreVertical,
+  Upload,
+  BarChart3,
+  Zap
+} from 'lucide-react'
+import { useQuery } from 'react-query'
+import { api } from '../lib/api'
+import toast from 'react-hot-toast'
+
+const Dashboard = () => {
+  const [searchQuery, setSearchQuery] = useState('')
+  const [filterType, setFilterType] = useState('all')
+  const [sortBy, setSortBy] = useState('newest')
+
+  // Fetch documents
+  const { data: documents = [], isLoading, refetch } = useQuery(
+    ['documents', searchQuery, filterType, sortBy],
+    async () => {
+      const params = new URLSearchParams()
+      if (searchQuery) params.append('q', searchQuery)
+      if (filterType !== 'all') params.append('type', filterType)
+      if (sortBy) params.append('sort', sortBy)
+      
+      const response = await api.get(`/documents?${params.toString()}`)
+      return response.data
+    }
+  )
+
+  // Fetch analytics
+  const { data: analytics } = useQuery(
+    'analytics',
+    async () => {
+      const response = await api.get('/analytics')
+      return response.data
+    }
+  )
+
+  const handleSearch = (e) => {
+    e.preventDefault()
+    refetch()
+  }
+
+  const handleDelete = async (id) => {
+    if (window.confirm('Are you sure you want to delete this document?')) {
+      try {
+        await api.delete(`/documents/${id}`)
+        toast.success('Document deleted successfully')
+        refetch()
+      } catch (error) {
+        toast.error('Failed to delete document')
+      }
+    }
+  }
+
+  const getFileIcon = (type) => {
+    switch (type) {
+      case 'pdf':
+        return '📄'
+      case 'docx':
+        return '📝'
+      case 'pptx':
+        return '📊'
+      case 'txt':
+        return '📃'
+      default:
+        return '📄'
+    }
+  }
+
+  const getStatusColor = (status) => {
+    switch (status) {
+      case 'completed':
+        return 'bg-green-100 text-green-800 dark:bg-green-900 dark:text-green-200'
+      case 'processing':
+        return 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900 dark:text-yellow-200'
+      case 'failed':
+        return 'bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200'
+      default:
+        return 'bg-gray-100 text-gray-800 dark:bg-gray-700 dark:text-gray-200'
+    }
+  }
+
+  return (
+    <div className="space-y-6">
+      {/* Header */}
+      <div className="flex items-center justify-between">
+        <div>
+          <h1 className="text-3xl font-bold text-gray-900 dark:text-white">Dashboard</h1>
+          <p className="mt-1 text-sm text-gray-500 dark:text-gray-400">
+            Welcome back! Here's what's happening with your documents.
+          </p>
+        </div>
+        <Link
+          to="/new"
+          className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-lg text-white bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-700 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-purple-500 transition-all duration-200 transform hover:scale-105"
+        >
+          <Plus className="h-5 w-5 mr-2" />
+          New Document
+        </Link>
+      </div>
+
+      {/* Analytics Cards */}
+      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ duration: 0.5 }}
+          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
+        >
+          <div className="p-5">
+            <div className="flex items-center">
+              <div className="flex-shrink-0">
+                <div className="w-8 h-8 bg-blue-100 dark:bg-blue-900 rounded-lg flex items-center justify-center">
+                  <FileText className="h-5 w-5 text-blue-600 dark:text-blue-400" />
+                </div>
+              </div>
+              <div className="ml-5 w-0 flex-1">
+                <dl>
+                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
+                    Documents Processed
+                  </dt>
+                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
+                    {analytics?.total_documents || 0}
+                  </dd>
+                </dl>
+              </div>
+            </div>
+          </div>
+        </motion.div>
+
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ duration: 0.5, delay: 0.1 }}
+          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
+        >
+          <div className="p-5">
+            <div className="flex items-center">
+              <div className="flex-shrink-0">
+                <div className="w-8 h-8 bg-purple-100 dark:bg-purple-900 rounded-lg flex items-center justify-center">
+                  <Brain className="h-5 w-5 text-purple-600 dark:text-purple-400" />
+                </div>
+              </div>
+              <div className="ml-5 w-0 flex-1">
+                <dl>
+                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
+                    AI Summaries Generated
+                  </dt>
+                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
+                    {analytics?.total_summaries || 0}
+                  </dd>
+                </dl>
+              </div>
+            </div>
+          </div>
+        </motion.div>
+
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ duration: 0.5, delay: 0.2 }}
+          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
+        >
+          <div className="p-5">
+            <div className="flex items-center">
+              <div className="flex-shrink-0">
+                <div className="w-8 h-8 bg-green-100 dark:bg-green-900 rounded-lg flex items-center justify-center">
+                  <Clock className="h-5 w-5 text-green-600 dark:text-green-400" />
+                </div>
+              </div>
+              <div className="ml-5 w-0 flex-1">
+                <dl>
+                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
+                    Time Saved
+                  </dt>
+                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
+                    {analytics?.time_saved_hours || 0}h
+                  </dd>
+                </dl>
+              </div>
+            </div>
+          </div>
+        </motion.div>
+
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ duration: 0.5, delay: 0.3 }}
+          className="bg-white dark:bg-gray-800 overflow-hidden shadow rounded-lg"
+        >
+          <div className="p-5">
+            <div className="flex items-center">
+              <div className="flex-shrink-0">
+                <div className="w-8 h-8 bg-orange-100 dark:bg-orange-900 rounded-lg flex items-center justify-center">
+                  <TrendingUp className="h-5 w-5 text-orange-600 dark:text-orange-400" />
+                </div>
+              </div>
+              <div className="ml-5 w-0 flex-1">
+                <dl>
+                  <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
+                    Efficiency Gain
+                  </dt>
+                  <dd className="text-lg font-medium text-gray-900 dark:text-white">
+                    {analytics?.efficiency_gain_percent || 0}%
+                  </dd>
+                </dl>
+              </div>
+            </div>
+          </div>
+        </motion.div>
+      </div>
+
+      {/* Search and Filters */}
+      <div className="bg-white dark:bg-gray-800 shadow rounded-lg p-6">
+        <div className="flex flex-col sm:flex-row gap-4">
+          <form onSubmit={handleSearch} className="flex-1">
+            <div className="relative">
+              <div className="absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none">
+                <Search className="h-5 w-5 text-gray-400" />
+              </div>
+              <input
+                type="text"
+                placeholder="Search documents, summaries, or tags..."
+                className="block w-full pl-10 pr-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg leading-5 bg-white dark:bg-gray-700 placeholder-gray-500 dark:placeholder-gray-400 focus:outline-none focus:placeholder-gray-400 focus:ring-1 focus:ring-purple-500 focus:border-purple-500 text-gray-900 dark:text-white"
+                value={searchQuery}
+                onChange={(e) => setSearchQuery(e.target.value)}
+              />
+            </div>
+          </form>
+          
+          <div className="flex gap-2">
+            <select
+              value={filterType}
+              onChange={(e) => setFilterType(e.target.value)}
+              className="px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white focus:outline-none focus:ring-1 focus:ring-purple-500 focus:border-purple-500"
+            >
+              <option value="all">All Types</option>
+              <option value="pdf">PDF</option>
+              <option value="docx">Word</option>
+              <option value="pptx">PowerPoint</option>
+              <option value="txt">Text</option>
+            </select>
+            
+            <select
+              value={sortBy}
+              onChange={(e) => setSortBy(e.target.value)}
+              className="px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white focus:outline-none focus:ring-1 focus:ring-purple-500 focus:border-purple-500"
+            >
+              <option value="newest">Newest First</option>
+              <option value="oldest">Oldest First</option>
+              <option value="name">Name A-Z</option>
+              <option value="size">Size</option>
+            </select>
+          </div>
+        </div>
+      </div>
+
+      {/* Documents List */}
+      <div className="bg-white dark:bg-gray-800 shadow rounded-lg">
+        <div className="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
+          <h3 className="text-lg font-medium text-gray-900 dark:text-white">Recent Documents</h3>
+        </div>
+        
+        {isLoading ? (
+          <div className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-600 mx-auto"></div>
+            <p className="mt-2 text-sm text-gray-500 dark:text-gray-400">Loading documents...</p>
+          </div>
+        ) : documents.length === 0 ? (
+          <div className="p-6 text-center">
+            <FileText className="h-12 w-12 text-gray-400 mx-auto mb-4" />
+            <h3 className="text-lg font-medium text-gray-900 dark:text-white mb-2">No documents yet</h3>
+            <p className="text-gray-500 dark:text-gray-400 mb-4">
+              Get started by uploading your first document for AI-powered summarization.
+            </p>
+            <Link
+              to="/new"
+              className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-lg text-white bg-gradient-to-r from-purple-600 to-blue-600 hover:from-purple-700 hover:to-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-purple-500 transition-all duration-200"
+            >
+              <Upload className="h-5 w-5 mr-2" />
+              Upload Document
+            </Link>
+          </div>
+        ) : (
+          <div className="divide-y divide-gray-200 dark:divide-gray-700">
+            {documents.map((doc, index) => (
+              <motion.div
+                key={doc.id}
+                initial={{ opacity: 0, y: 20 }}
+                animate={{ opacity: 1, y: 0 }}
+                transition={{ duration: 0.3, delay: index * 0.1 }}
+                className="p-6 hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors"
+              >
+                <div className="flex items-center justify-between">
+                  <div className="flex items-center space-x-4">
+                    <div className="flex-shrink-0">
+                      <div className="w-10 h-10 bg-gray-100 dark:bg-gray-600 rounded-lg flex items-center justify-center">
+                        <span className="text-lg">{getFileIcon(doc.file_type)}</span>
+                      </div>
+                    </div>
+                    <div className="flex-1 min-w-0">
+                      <Link
+                        to={`/documents/${doc.id}`}
+                        className="text-lg font-medium text-gray-900 dark:text-white hover:text-purple-600 dark:hover:text-purple-400 transition-colors"
+                      >
+                        {doc.title}
+                      </Link>
+                      <p className="text-sm text-gray-500 dark:text-gray-400 mt-1">
+                        {doc.file_type?.toUpperCase()} • {doc.file_size ? `${(doc.file_size / 1024).toFixed(1)} KB` : 'Unknown size'} • {new Date(doc.created_at).toLocaleDateString()}
+                      </p>
+                      {doc.summary && (
+                        <p className="text-sm text-gray-600 dark:text-gray-300 mt-2 line-clamp-2">
+                          {doc.summary}
+                        </p>
+                      )}
+                      {doc.tags && doc.tags.length > 0 && (
+                        <div className="flex flex-wrap gap-1 mt-2">
+                          {doc.tags.slice(0, 3).map((tag, tagIndex) => (
+                            <span
+                              key={tagIndex}
+                              className="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-purple-100 text-purple-800 dark:bg-purple-900 dark:text-purple-200"
+                            >
+                              {tag}
+                            </span>
+                          ))}
+                          {doc.tags.length > 3 && (
+                            <span className="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-gray-100 text-gray-800 dark:bg-gray-700 dark:text-gray-200">
+                              +{doc.tags.length - 3} more
+                            </span>
+                          )}
+                        </div>
+                      )}
+                    </div>
+                  </div>
+                  
+                  <div className="flex items-center space-x-2">
+                    <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${getStatusColor(doc.processing_status)}`}>
+                      {doc.processing_status}
+                    </span>
+                    
+                    <div className="flex items-center space-x-1">
+                      <Link
+                        to={`/documents/${doc.id}`}
+                        className="p-2 text-gray-400 hover:text-gray-600 dark:hover:text-gray-300 transition-colors"
+                        title="View document"
+                      >
+                        <Eye className="h-4 w-4" />
+                      </Link>
+                      
+                      <button
+                        onClick={() => handleDelete(doc.id)}
+                        className="p-2 text-gray-400 hover:text-red-600 transition-colors"
+                        title="Delete document"
+                      >
+                        <MoreVertical className="h-4 w-4" />
+                      </button>
+                    </div>
+                  </div>
+                </div>
+              </motion.div>
+            ))}
+          </div>
+        )}
+      </div>
+    </div>
+  )
+}
+
 export default Dashboard
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Measure text extraction throughput in pages per second.
+
+Usage:
+    python scripts/benchmark_extraction.py path/to/file.pdf [pages_per_task]
+
+Compares extracting every page in one thread with the page-range parallel
+extraction on the process pool that upload_file uses.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.compute import compute_manager  # noqa: E402
+from app.services.extraction import PAGES_PER_TASK, extract_pdf, extract_text_sync, pdf_page_count  # noqa: E402
+
+
+async def run_parallel(path: str, pages_per_task: int) -> str:
+    return await extract_pdf(path, pages_per_task)
+
+
+def main() -> None:
+    path = sys.argv[1]
+    pages_per_task = int(sys.argv[2]) if len(sys.argv) > 2 else PAGES_PER_TASK
+    pages = pdf_page_count(path)
+    print(f"{path}: {pages} pages, {compute_manager.process_workers} worker processes")
+
+    started = time.perf_counter()
+    serial = extract_text_sync(path, "pdf")
+    elapsed = time.perf_counter() - started
+    print(f"serial     {elapsed:7.2f}s  {pages / elapsed:8.1f} pages/sec")
+
+    # Warm the pool so process start-up is not counted
+    asyncio.run(run_parallel(path, pages))
+    started = time.perf_counter()
+    parallel = asyncio.run(run_parallel(path, pages_per_task))
+    elapsed = time.perf_counter() - started
+    print(f"parallel   {elapsed:7.2f}s  {pages / elapsed:8.1f} pages/sec  ({pages_per_task} pages/task)")
+
+    assert parallel == serial, "parallel extraction must match serial output"
+    compute_manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Measure document listing search latency as a library grows.
+
+Usage:
+    python scripts/benchmark_library_search.py [sizes] [queries]
+
+e.g. `python scripts/benchmark_library_search.py 1000,10000,50000 50`.
+Synthetic documents are written to a scratch `<database_name>_search_benchmark`
+database (dropped at the end) for one user, next to as many documents of
+other users. Each query is timed as the old unanchored $regex scan, as the
+user_text index lookup, and through Elasticsearch when it is reachable
+(the scratch index is deleted afterwards).
+"""
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bson import ObjectId  # noqa: E402
+from elasticsearch import AsyncElasticsearch  # noqa: E402
+from elasticsearch.helpers import async_bulk  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from app.services.indexes import INDEXES  # noqa: E402
+from app.services.library_search import search_body, text_search  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+USER = "benchmark-user"
+PAGE = 20
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+
+def make_document(rng: random.Random, user_id: str, created_at: datetime) -> dict:
+    words = rng.choices(VOCABULARY, k=600)
+    return {
+        "user_id": user_id,
+        "title": " ".join(words[:6]),
+        "summary": " ".join(words[6:60]),
+        "tags": words[60:65],
+        "content": " ".join(words),
+        "file_type": "txt",
+        "created_at": created_at,
+    }
+
+
+def regex_filter(q: str) -> dict:
+    return {"user_id": USER, "$or": [
+        {"title": {"$regex": q, "$options": "i"}},
+        {"content": {"$regex": q, "$options": "i"}},
+        {"summary": {"$regex": q, "$options": "i"}},
+        {"tags": {"$in": [{"$regex": q, "$options": "i"}]}},
+    ]}
+
+
+async def timed(queries, run) -> float:
+    latencies = []
+    for q in queries:
+        started = time.perf_counter()
+        await run(q)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+async def connect_elasticsearch():
+    es = AsyncElasticsearch(settings.elasticsearch_url)
+    try:
+        await es.info()
+        return es
+    except Exception:
+        await es.close()
+        return None
+
+
+async def main() -> None:
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) > 1 else [1000, 10000, 50000]
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(0)
+    queries = [rng.choice(VOCABULARY) for _ in range(num_queries)]
+
+    client = AsyncIOMotorClient(settings.mongo_uri)
+    db = client[f"{settings.database_name}_search_benchmark"]
+    es = await connect_elasticsearch()
+    es_index = f"{settings.elasticsearch_index}_search_benchmark"
+    await db.documents.drop()
+    await db.documents.create_indexes(INDEXES["documents"])
+    if es:
+        await es.indices.delete(index=es_index, ignore_unavailable=True)
+        await es.indices.create(index=es_index, body={"mappings": {"properties": {
+            **{field: {"type": "text"} for field in ("title", "summary", "content")},
+            **{field: {"type": "keyword"} for field in ("user_id", "tags", "file_type")},
+        }}})
+
+    print(f"{'documents':>10} {'regex ms':>10} {'text ms':>10} {'es ms':>10}")
+    try:
+        inserted, now = 0, datetime.utcnow()
+        for size in sizes:
+            while inserted < size:
+                batch = []
+                for i in range(min(1000, size - inserted)):
+                    created_at = now - timedelta(seconds=inserted + i)
+                    batch.append(make_document(rng, USER, created_at))
+                    batch.append(make_document(rng, "other-user", created_at))
+                await db.documents.insert_many(batch)
+                if es:
+                    await async_bulk(es, (
+                        {"_index": es_index, "_id": str(doc["_id"]), "_source": {
+                            key: doc[key] for key in ("user_id", "title", "summary", "tags", "content", "file_type")
+                        }} for doc in batch
+                    ))
+                inserted += len(batch) // 2
+            if es:
+                await es.indices.refresh(index=es_index)
+
+            async def regex(q):
+                await db.documents.find(regex_filter(q), {"title": 1}).sort("created_at", -1).limit(PAGE).to_list(PAGE)
+
+            async def text(q):
+                await db.documents.find({"user_id": USER, **text_search(q)}, {"title": 1}) \
+                    .sort("created_at", -1).limit(PAGE).to_list(PAGE)
+
+            async def elastic(q):
+                response = await es.search(index=es_index, body=search_body(USER, q, None, settings.library_search_max_hits))
+                ids = [ObjectId(hit["_id"]) for hit in response["hits"]["hits"]]
+                await db.documents.find({"user_id": USER, "_id": {"$in": ids}}, {"title": 1}) \
+                    .sort("created_at", -1).limit(PAGE).to_list(PAGE)
+
+            es_ms = f"{await timed(queries, elastic):10.2f}" if es else f"{'-':>10}"
+            print(f"{size:>10} {await timed(queries, regex):10.2f} {await timed(queries, text):10.2f} {es_ms}")
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+        if es:
+            await es.indices.delete(index=es_index, ignore_unavailable=True)
+            await es.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""Compare streaming OOXML extraction with python-docx / python-pptx.
+
+Usage:
+    python scripts/benchmark_ooxml.py path/to/file.docx|pptx [repeat]
+
+Reports wall time and peak traced memory for each path, and how much more
+text the streaming extractor finds (tables, grouped shapes, notes).
+tracemalloc only sees Python allocations; the lxml trees the object-model
+libraries build live outside it, so their real footprint is larger.
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.ooxml import docx_blocks, pptx_slides  # noqa: E402
+
+
+def object_model_docx(path: str) -> str:
+    from docx import Document
+    return "\n".join(paragraph.text for paragraph in Document(path).paragraphs)
+
+
+def object_model_pptx(path: str) -> str:
+    from pptx import Presentation
+    return "\n".join(
+        shape.text for slide in Presentation(path).slides for shape in slide.shapes if hasattr(shape, "text")
+    )
+
+
+def measure(label: str, fn, path: str, repeat: int) -> str:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = fn(path)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<14} {elapsed * 1000:9.1f} ms  peak {peak / 2**20:8.2f} MB  {len(text):>10} chars")
+    return text
+
+
+def main() -> None:
+    path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    if path.lower().endswith(".pptx"):
+        baseline, streaming = object_model_pptx, lambda p: "\n".join(pptx_slides(p))
+    else:
+        baseline, streaming = object_model_docx, lambda p: "\n".join(docx_blocks(p))
+
+    measure("object model", baseline, path, repeat)
+    measure("streaming", streaming, path, repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure recall and latency of app.services.vector_index against exact search.
+
+Usage:
+    python scripts/benchmark_vector_index.py [num_vectors] [num_queries]
+
+Vectors are drawn around random cluster centres so the data has the kind of
+structure real sentence embeddings have. Recall@10 is measured against the
+brute-force answer for several `n_probe` settings.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.embeddings import l2_normalize  # noqa: E402
+from app.services.vector_index import VectorIndex  # noqa: E402
+
+DIM = 384
+K = 10
+
+
+def make_vectors(count: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centres = rng.normal(size=(clusters, DIM))
+    labels = rng.integers(0, clusters, size=count)
+    return l2_normalize(centres[labels] + 0.6 * rng.normal(size=(count, DIM))).astype(np.float32)
+
+
+def timed_search(index: VectorIndex, queries: np.ndarray, exact: bool):
+    results = []
+    started = time.perf_counter()
+    for query in queries:
+        results.append({key for key, _ in index.search(query, K, exact=exact)})
+    elapsed = time.perf_counter() - started
+    return results, elapsed / len(queries) * 1000
+
+
+def main() -> None:
+    num_vectors = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = np.random.default_rng(0)
+
+    vectors = make_vectors(num_vectors + num_queries, clusters=200, rng=rng)
+    data, queries = vectors[:num_vectors], vectors[num_vectors:]
+
+    index = VectorIndex(dim=DIM, min_ivf_size=num_vectors + 1)
+    started = time.perf_counter()
+    index.add([str(i) for i in range(num_vectors)], data)
+    print(f"add {num_vectors} vectors: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    index.train()
+    print(f"train IVF: {time.perf_counter() - started:.2f}s")
+
+    truth, exact_ms = timed_search(index, queries, exact=True)
+    print(f"exact         {exact_ms:7.2f} ms/query  recall@{K} 1.000")
+
+    for n_probe in (1, 4, 8, 16, 32):
+        index.n_probe = n_probe
+        found, ivf_ms = timed_search(index, queries, exact=False)
+        recall = np.mean([len(f & t) / K for f, t in zip(found, truth)])
+        print(f"ivf n_probe={n_probe:<3} {ivf_ms:7.2f} ms/query  recall@{K} {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Build the character n-gram profiles used by app.services.langid.
+
+Usage:
+    python scripts/build_langid_profiles.py [corpus_dir] [output_path]
+
+The corpus directory holds one UTF-8 text file per language named
+`<code>.txt`. For each n-gram order the most frequent n-grams are kept with
+their log-probability within that order.
+"""
+import json
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.langid import NGRAM_ORDERS, PROFILE_PATH, count_ngrams  # noqa: E402
+
+DEFAULT_CORPUS_DIR = Path(__file__).parent / "data" / "langid"
+TOP_K = {1: 60, 2: 200, 3: 300}
+FLOOR = math.log(1e-5)
+
+
+def build_profile(text: str) -> dict:
+    profile = {}
+    for n, counts in count_ngrams(text, NGRAM_ORDERS).items():
+        total = sum(counts.values())
+        for gram, count in counts.most_common(TOP_K[n]):
+            profile[gram] = round(math.log(count / total), 4)
+    return profile
+
+
+def main() -> None:
+    corpus_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CORPUS_DIR
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else PROFILE_PATH
+
+    profiles = {}
+    for path in sorted(corpus_dir.glob("*.txt")):
+        profiles[path.stem] = build_profile(path.read_text(encoding="utf-8"))
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as fh:
+        json.dump(
+            {"orders": list(NGRAM_ORDERS), "floor": FLOOR, "languages": list(profiles), "profiles": profiles},
+            fh,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    print(f"Wrote {len(profiles)} language profiles to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Move inline document text into the compressed content store.
+
+Usage:
+    python scripts/migrate_content_store.py
+
+Every document that still has an inline `content` string gets its text
+stored once under its SHA-256 digest in the `contents` collection, gains
+`content_hash`/`content_size` and loses `content`.
+
+Each document is moved in steps that can be repeated: the text is stored
+with no reference, then one write filtered on the inline `content` swaps
+it for the hash and sets `content_migrating`, then the reference is
+counted and the marker cleared. A re-run skips moved documents and only
+counts the reference of those still marked, so an interrupted run never
+leaves a stored text with fewer references than documents using it.
+
+Elasticsearch indexes created before the content store keep `content` in
+`_source`; run scripts/reindex_elasticsearch.py to rebuild them.
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from bson.binary import Binary
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.content_store import compress_text, content_digest  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+def store_text(db, digest: str, text: str) -> Optional[int]:
+    """Make sure the text is stored; its compressed size if this call stored it"""
+    codec, data = compress_text(text, settings.content_store_codec)
+    result = db.contents.update_one(
+        {"_id": digest},
+        {"$setOnInsert": {
+            "codec": codec,
+            "data": Binary(data),
+            "size": len(text),
+            "compressed_size": len(data),
+            "refs": 0,
+            "created_at": datetime.utcnow()
+        }},
+        upsert=True
+    )
+    return len(data) if result.upserted_id is not None else None
+
+
+def count_reference(db, document_id, digest: str) -> None:
+    db.contents.update_one({"_id": digest}, {"$inc": {"refs": 1}})
+    db.documents.update_one({"_id": document_id}, {"$unset": {"content_migrating": ""}})
+
+
+def main() -> None:
+    client = MongoClient(settings.mongo_uri)
+    db = client[settings.database_name]
+
+    # Documents an interrupted run moved but did not count yet
+    resumed = 0
+    for doc in db.documents.find({"content_migrating": True}, {"content_hash": 1}):
+        count_reference(db, doc["_id"], doc["content_hash"])
+        resumed += 1
+
+    migrated = stored = saved = 0
+    for doc in db.documents.find({"content": {"$type": "string"}}, {"content": 1}):
+        text = doc["content"]
+        digest = content_digest(text)
+        compressed_size = store_text(db, digest, text)
+        if compressed_size is not None:
+            stored += 1
+            saved += len(text.encode("utf-8")) - compressed_size
+        moved = db.documents.update_one(
+            {"_id": doc["_id"], "content": {"$type": "string"}},
+            {
+                "$set": {"content_hash": digest, "content_size": len(text), "content_migrating": True},
+                "$unset": {"content": ""}
+            }
+        )
+        if moved.modified_count:
+            count_reference(db, doc["_id"], digest)
+            migrated += 1
+
+    print(f"Migrated {migrated} documents into {stored} stored texts, {saved / 1e6:.1f} MB saved by compression"
+          + (f", finished {resumed} left by an earlier run" if resumed else ""))
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Rewrite embeddings stored as arrays of doubles into compact binary blobs.
+
+Usage:
+    python scripts/migrate_embeddings.py [dtype]
+
+`dtype` is "float16" or "int8" and defaults to settings.embedding_storage_dtype.
+Only documents whose `embedding` is still a BSON array are touched, so the
+migration can be re-run safely.
+"""
+import sys
+from pathlib import Path
+
+from pymongo import MongoClient, UpdateOne
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.embeddings import encode_embedding  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+COLLECTIONS = ("documents", "articles")
+BATCH_SIZE = 500
+
+
+def migrate_collection(collection, dtype: str) -> int:
+    migrated = 0
+    operations = []
+    for doc in collection.find({"embedding": {"$type": "array"}}, {"embedding": 1}):
+        operations.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"embedding": encode_embedding(doc["embedding"], dtype)}}
+        ))
+        if len(operations) >= BATCH_SIZE:
+            migrated += collection.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        migrated += collection.bulk_write(operations, ordered=False).modified_count
+    return migrated
+
+
+def main() -> None:
+    dtype = sys.argv[1] if len(sys.argv) > 1 else settings.embedding_storage_dtype
+    client = MongoClient(settings.mongo_uri)
+    db = client[settings.database_name]
+    for name in COLLECTIONS:
+        print(f"{name}: migrated {migrate_collection(db[name], dtype)} embeddings to {dtype}")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Rebuild the Elasticsearch document index so it stops keeping `content` in `_source`.
+
+Usage:
+    python scripts/reindex_elasticsearch.py
+
+Mappings only apply when an index is created, so an index made before the
+content store still stores the text of every document in `_source`. The
+documents are copied to a temporary index that keeps their full source, the
+index is recreated with config.db.ELASTICSEARCH_MAPPING and the documents are
+copied back, which indexes `content` without storing it. Searches miss
+documents while the index is rebuilt, so run it in a maintenance window.
+An index that already excludes `content` is left alone.
+"""
+import sys
+from pathlib import Path
+
+from elasticsearch import Elasticsearch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.db import ELASTICSEARCH_MAPPING  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+def excludes_content(es: Elasticsearch, index: str) -> bool:
+    mapping = es.indices.get_mapping(index=index)[index]["mappings"]
+    return "content" in mapping.get("_source", {}).get("excludes", [])
+
+
+def copy(es: Elasticsearch, source: str, dest: str) -> int:
+    result = es.reindex(
+        body={"source": {"index": source}, "dest": {"index": dest}},
+        wait_for_completion=True,
+        refresh=True
+    )
+    return result["total"]
+
+
+def main() -> None:
+    es = Elasticsearch([settings.elasticsearch_url])
+    index = settings.elasticsearch_index
+    if not es.indices.exists(index=index):
+        print(f"{index} does not exist; it is created with the current mapping at startup")
+        return
+    if excludes_content(es, index):
+        print(f"{index} already keeps content out of _source")
+        return
+
+    temporary = f"{index}_reindex"
+    es.indices.create(index=temporary, body={"mappings": {"properties": ELASTICSEARCH_MAPPING["mappings"]["properties"]}})
+    copied = copy(es, index, temporary)
+    es.indices.delete(index=index)
+    es.indices.create(index=index, body=ELASTICSEARCH_MAPPING)
+    restored = copy(es, temporary, index)
+    if restored != copied:
+        print(f"Copied {copied} documents out but {restored} back; {temporary} is kept for inspection")
+        return
+    es.indices.delete(index=temporary)
+    print(f"Rebuilt {index} with {restored} documents")
+
+
+if __name__ == "__main__":
+    main()
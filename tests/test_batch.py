@@ -0,0 +1,243 @@
+import asyncio
+import zipfile
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+pytest.importorskip("elasticsearch")
+pytest.importorskip("spacy")
+
+from app.models.schemas import ProcessingStatus  # noqa: E402
+from app.services.batch import BatchProcessor, list_archive  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return path
+
+
+class FakeInserts:
+    """documents collection of an archive job: finds the given existing ids and records inserts"""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.inserted = []
+
+    def find(self, query, projection=None):
+        async def cursor():
+            for document_id in query["_id"]["$in"]:
+                if document_id in self.existing:
+                    yield {"_id": document_id}
+        return cursor()
+
+    async def insert_many(self, documents, ordered=True):
+        self.inserted.extend(documents)
+
+
+@pytest.fixture
+def stored_texts(monkeypatch):
+    from app.services import batch as batch_module
+
+    texts = {}
+
+    async def put(db, text):
+        texts[f"h{len(texts)}"] = text
+        return f"h{len(texts) - 1}"
+
+    async def release(db, content_hash):
+        pass
+
+    monkeypatch.setattr(batch_module, "content_store", SimpleNamespace(put=put, release=release))
+    return texts
+
+
+def insert_archive(archive, items, workdir, max_member_size, existing=()):
+    for item in items:
+        item.document_id = str(ObjectId())
+    db = SimpleNamespace(documents=FakeInserts(ObjectId(items[i].document_id) for i in existing))
+    processor = BatchProcessor(None, None, None, index=None)
+    inserted = asyncio.run(processor.insert_archive(
+        db, "u1", archive, [item for item in items if item.status != ProcessingStatus.FAILED],
+        workdir, max_member_size
+    ))
+    return inserted, db.documents.inserted
+
+
+def test_archive_members_are_listed_then_extracted_one_by_one(tmp_path, stored_texts):
+    archive = write_zip(tmp_path / "batch.zip", {
+        "notes/first.txt": "First document.",
+        "second.TXT": "Second document.",
+        "image.png": b"\x89PNG",
+        "__MACOSX/._first.txt": b"junk",
+        ".hidden.txt": "skipped",
+    })
+    items = list_archive(archive, max_items=10, max_member_size=1024)
+
+    assert [(item.title, item.source) for item in items] == [
+        ("first", "notes/first.txt"), ("second", "second.TXT"), ("image", "image.png")
+    ]
+    assert items[2].status == ProcessingStatus.FAILED and items[2].error == "Unsupported file type"
+
+    inserted, documents = insert_archive(archive, items, tmp_path, 1024)
+    assert [item.index for item in inserted] == [0, 1]
+    assert [stored_texts[doc["content_hash"]] for doc in documents] == ["First document.", "Second document."]
+    # Only the archive itself is left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["batch.zip"]
+
+
+def test_members_inserted_by_an_earlier_attempt_are_not_extracted_again(tmp_path, stored_texts):
+    archive = write_zip(tmp_path / "batch.zip", {"a.txt": "first", "b.txt": "second"})
+    items = list_archive(archive, max_items=10, max_member_size=1024)
+
+    inserted, documents = insert_archive(archive, items, tmp_path, 1024, existing=[0])
+    assert [item.index for item in inserted] == [0, 1]
+    assert list(stored_texts.values()) == ["second"] and len(documents) == 1
+
+
+def test_archive_limits(tmp_path, stored_texts):
+    archive = write_zip(tmp_path / "batch.zip", {"a.txt": "x" * 100, "b.txt": "small"})
+    items = list_archive(archive, max_items=10, max_member_size=50)
+    assert items[0].error == "File too large"
+
+    inserted, _ = insert_archive(archive, items, tmp_path, 50)
+    assert [item.index for item in inserted] == [1] and list(stored_texts.values()) == ["small"]
+
+    with pytest.raises(ValueError):
+        list_archive(archive, max_items=1, max_member_size=1024)
+
+
+def test_failed_batch_call_falls_back_to_single_items():
+    async def batch_call():
+        raise RuntimeError("batch failed")
+
+    async def single_call(i):
+        if i == 1:
+            raise ValueError("bad item")
+        return i * 10
+
+    results = asyncio.run(BatchProcessor._batched(batch_call, single_call, 3))
+    assert results[0] == 0 and results[2] == 20
+    assert isinstance(results[1], ValueError)
+
+
+class FakeDocuments:
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.writes = []
+
+    def find(self, query, projection=None):
+        async def cursor():
+            for document_id in query["_id"]["$in"]:
+                if document_id in self.docs:
+                    yield dict(self.docs[document_id])
+        return cursor()
+
+    async def find_one(self, query, projection=None):
+        return self.docs.get(query["_id"])
+
+    async def update_many(self, query, update):
+        pass
+
+    async def bulk_write(self, operations, ordered=False):
+        self.writes.extend(operations)
+
+
+class FakeDetector:
+    hasher = SimpleNamespace(signature=lambda text: text)
+
+    def __init__(self, matches):
+        self.matches = matches
+
+    async def find_duplicates(self, db, user_id, signature, exclude):
+        return self.matches.get(exclude, [])
+
+    async def add(self, db, user_id, document_id, signature):
+        pass
+
+    def remove(self, user_id, document_id):
+        pass
+
+
+class FakeSummarizer:
+    """Stands in for the summarizer, and for the NLP service whose analyses the tests replace"""
+
+    def __init__(self):
+        self.texts = []
+
+    async def initialize(self):
+        pass
+
+    async def generate_summary_batch(self, texts, max_length, algorithm):
+        self.texts.extend(texts)
+        return [{"summary": f"{algorithm} summary", "algorithm_used": algorithm, "processing_time": 0.1,
+                 "compression_ratio": 0.5} for _ in texts]
+
+
+def make_document(name, status, **fields):
+    return {"_id": ObjectId(), "title": name, "content": f"{name} text", "content_hash": name, "user_id": "u1",
+            "created_at": datetime(2024, 1, 1), "processing_status": status, **fields}
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    from app.services import batch as batch_module
+
+    async def attach(db, docs):
+        return docs
+
+    async def no_index(*args):
+        pass
+
+    monkeypatch.setattr(batch_module, "content_store", SimpleNamespace(attach=attach))
+    monkeypatch.setattr(batch_module, "signature_to_binary", lambda signature: signature)
+    original = make_document("original", ProcessingStatus.COMPLETED, summary="Original summary.",
+                             algorithm_used="textrank", summary_max_length=150, compression_ratio=0.3,
+                             tags=["alpha"], topics=["greek letters"], sentiment=0.5, language="en")
+    duplicate = make_document("duplicate", ProcessingStatus.PENDING)
+    fresh = make_document("fresh", ProcessingStatus.PENDING)
+    db = SimpleNamespace(documents=FakeDocuments([original, duplicate, fresh]))
+    detector = FakeDetector({str(duplicate["_id"]): [(str(original["_id"]), 0.95)]})
+    processor = BatchProcessor(FakeSummarizer(), FakeSummarizer(), detector, index=None)
+    processor._index = no_index
+    analysed = []
+
+    async def analyse(docs, algorithm, max_length, skip, timings):
+        analysed.extend(doc["title"] for doc in docs)
+        return {"keywords": [[{"word": "fresh"}] for _ in docs]}
+
+    processor._analyse = analyse
+    ids = [str(doc["_id"]) for doc in (original, duplicate, fresh)]
+    return SimpleNamespace(processor=processor, db=db, ids=ids, analysed=analysed)
+
+
+def written(db, title):
+    doc = next(doc for doc in db.documents.docs.values() if doc["title"] == title)
+    return next(op._doc["$set"] for op in db.documents.writes if op._filter["_id"] == doc["_id"])
+
+
+def test_completed_documents_are_skipped_and_duplicates_reuse_the_original(batch):
+    result = asyncio.run(batch.processor.process(batch.db, batch.ids, "textrank", 150))
+
+    assert batch.analysed == ["fresh"]
+    assert [item["status"] for item in result["items"]] == [ProcessingStatus.COMPLETED] * 3
+    assert result["items"][0]["summary"] == "Original summary."
+    reused = written(batch.db, "duplicate")
+    assert reused["summary"] == "Original summary." and reused["tags"] == ["alpha"]
+    assert reused["topics"] == ["greek letters"] and reused["duplicate_of"] == batch.ids[0]
+    assert written(batch.db, "fresh")["tags"] == ["fresh"]
+    assert len(batch.db.documents.writes) == 2
+
+
+def test_duplicate_with_other_summary_settings_is_only_summarized(batch, monkeypatch):
+    monkeypatch.setattr(settings, "batch_chunk_size", 1)
+    asyncio.run(batch.processor.process(batch.db, batch.ids, "lsa", 150))
+
+    assert batch.analysed == ["fresh"]
+    assert batch.processor.summarizer.texts == ["duplicate text"]
+    reused = written(batch.db, "duplicate")
+    assert reused["summary"] == "lsa summary" and reused["tags"] == ["alpha"]
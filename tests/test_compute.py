@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.compute import BULK, INTERACTIVE, ComputeManager
+from config.settings import settings
+
+
+def test_manager_splits_budget_between_pools():
+    manager = ComputeManager()
+    assert manager.interactive_workers >= 1 and manager.bulk_workers >= 1
+    assert manager.executor(INTERACTIVE) is manager.executor(INTERACTIVE)
+    with pytest.raises(ValueError):
+        manager.executor("gpu")
+    manager.shutdown()
+
+
+def test_managed_executor_reports_results_errors_and_stats():
+    manager = ComputeManager()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        assert await manager.run(BULK, sum, [1, 2, 3]) == 6
+        await manager.run(BULK, time.sleep, 0.01)
+        with pytest.raises(RuntimeError):
+            await manager.run(BULK, boom)
+
+    asyncio.run(scenario())
+    stats = manager.stats()["pools"][BULK]
+    assert stats["submitted"] == 3
+    assert stats["completed"] == 2 and stats["failed"] == 1
+    assert stats["pending"] == 0
+    assert stats["busy_seconds"] >= 0.01
+    manager.shutdown()
+
+
+@pytest.mark.parametrize("budget", [3, 4, 8, 16])
+@pytest.mark.parametrize("share", [0.25, 0.5, 1.0])
+def test_pools_together_stay_within_the_core_budget(monkeypatch, budget, share):
+    monkeypatch.setattr(settings, "compute_core_budget", budget)
+    monkeypatch.setattr(settings, "compute_interactive_share", share)
+    manager = ComputeManager()
+    assert manager.total_workers == budget
+    assert min(manager.interactive_workers, manager.bulk_workers, manager.process_workers) >= 1
+
+
+def test_process_workers_come_out_of_the_bulk_share(monkeypatch):
+    monkeypatch.setattr(settings, "compute_core_budget", 8)
+    monkeypatch.setattr(settings, "compute_interactive_share", 0.5)
+    monkeypatch.setattr(settings, "compute_process_workers", 3)
+    manager = ComputeManager()
+    assert (manager.interactive_workers, manager.bulk_workers, manager.process_workers) == (4, 1, 3)
+
+    monkeypatch.setattr(settings, "compute_process_workers", 10)
+    assert ComputeManager().total_workers == 8
@@ -0,0 +1,19 @@
+from app.services.content_store import ZLIB, compress_text, content_digest, decompress_text
+
+
+def test_compress_round_trips_unicode():
+    text = "Résumé of the quarterly report. " * 200
+    codec, data = compress_text(text)
+    assert len(data) < len(text.encode("utf-8")) / 10
+    assert decompress_text(codec, data) == text
+
+
+def test_zlib_codec_is_always_available():
+    codec, data = compress_text("hello", ZLIB)
+    assert codec == ZLIB
+    assert decompress_text(codec, data) == "hello"
+
+
+def test_digest_identifies_identical_text():
+    assert content_digest("same text") == content_digest("same text")
+    assert content_digest("same text") != content_digest("same text.")
@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.dedup import (
+    DuplicateDetector, LSHIndex, MinHasher, estimate_jaccard, signature_from_binary, signature_to_binary
+)
+
+
+TEXT = (
+    "The quarterly report shows that revenue grew faster than expected while operating "
+    "costs remained stable across most regions where the company does business and "
+    "management expects the new product line to keep attracting customers next year."
+)
+
+
+def test_signature_is_fixed_width_and_round_trips_through_binary():
+    signature = MinHasher(num_perm=64).signature(TEXT)
+    assert signature.dtype == np.uint32 and signature.shape == (64,)
+    assert np.array_equal(signature_from_binary(signature_to_binary(signature)), signature)
+
+
+def test_near_duplicates_score_higher_than_unrelated_text():
+    hasher = MinHasher()
+    original = hasher.signature(TEXT)
+    edited = hasher.signature(TEXT.replace("next year", "over the next year"))
+    unrelated = hasher.signature("A completely different note about football, weather and holidays by the sea.")
+    assert estimate_jaccard(original, edited) > 0.7
+    assert estimate_jaccard(original, unrelated) < 0.1
+
+
+def test_lsh_index_query_add_and_remove():
+    hasher = MinHasher()
+    index = LSHIndex(num_perm=128, bands=16)
+    index.add("a", hasher.signature(TEXT))
+    index.add("b", hasher.signature("Something else entirely, with no words in common at all."))
+
+    matches = index.query(hasher.signature(TEXT + " Thanks."), threshold=0.5)
+    assert [key for key, _ in matches] == ["a"]
+
+    index.remove("a")
+    assert index.query(hasher.signature(TEXT), threshold=0.5) == []
+    assert len(index) == 1
+
+
+class FakeDocuments:
+    def __init__(self, docs):
+        self.docs = docs
+        self.loads = []
+
+    def find(self, query, projection=None):
+        self.loads.append(query["user_id"])
+
+        async def cursor():
+            for doc in self.docs:
+                if doc["user_id"] == query["user_id"]:
+                    yield doc
+        return cursor()
+
+
+def test_least_recently_used_user_indexes_are_evicted_and_rebuilt():
+    detector = DuplicateDetector(cache_size=2)
+    signature = detector.hasher.signature(TEXT)
+    documents = FakeDocuments([
+        {"_id": f"{user}-doc", "user_id": user, "minhash": signature_to_binary(signature)} for user in ("u1", "u2", "u3")
+    ])
+    db = SimpleNamespace(documents=documents)
+
+    async def matches(user_id):
+        return await detector.find_duplicates(db, user_id, signature, threshold=0.9)
+
+    async def run():
+        return [await matches(user_id) for user_id in ("u1", "u2", "u1", "u3", "u1", "u2")]
+
+    results = asyncio.run(run())
+    assert [keys[0][0] for keys in results] == ["u1-doc", "u2-doc", "u1-doc", "u3-doc", "u1-doc", "u2-doc"]
+    # u2 was the least recently used when u3 was loaded
+    assert documents.loads == ["u1", "u2", "u3", "u2"]
+    assert list(detector._indexes) == ["u1", "u2"]
@@ -0,0 +1,117 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("spacy")
+
+from app.services.content_store import content_digest  # noqa: E402
+from app.services.embedding_worker import EmbeddingWorker, article_text  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeArticles:
+    """Articles keyed by _id; applies UpdateOne filters on _id and content_hash"""
+
+    def __init__(self, articles):
+        self.articles = {article["_id"]: article for article in articles}
+        self.bulk_writes = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append(operations)
+        matched = 0
+        for operation in operations:
+            article = self.articles.get(operation._filter["_id"])
+            if article is not None and article["content_hash"] == operation._filter["content_hash"]:
+                article.update(operation._doc["$set"])
+                matched += 1
+        return SimpleNamespace(matched_count=matched)
+
+    def find(self, query, projection=None):
+        if "_id" in query:
+            ids = query["_id"]["$in"]
+            return FakeCursor([self.articles[i] for i in ids if i in self.articles])
+        return FakeCursor([a for a in self.articles.values() if a.get("searchable") == query["searchable"]])
+
+
+class FakeNLP:
+    def __init__(self):
+        self.calls = []
+
+    async def embed_many(self, texts):
+        self.calls.append(list(texts))
+        return np.eye(len(texts), 4, dtype=np.float32)
+
+    async def extract_keywords_batch(self, texts):
+        return [[{"word": "kw"}] for _ in texts]
+
+
+class FakeIndex:
+    def __init__(self):
+        self.added = []
+
+    def add(self, ids, vectors):
+        self.added.append((list(ids), np.asarray(vectors)))
+
+
+def article(article_id, title, content="body"):
+    doc = {"_id": article_id, "title": title, "content": content, "searchable": False}
+    doc["content_hash"] = content_digest(article_text(doc))
+    return doc
+
+
+def test_queued_articles_are_grouped_into_batches():
+    async def run():
+        worker = EmbeddingWorker(FakeArticles([]), FakeNLP(), batch_size=3, max_wait=0.01)
+        worker._queue = asyncio.Queue()
+        for i in range(5):
+            worker._queue.put_nowait((i, f"text {i}"))
+        return [len(await worker._next_batch()), len(await worker._next_batch())]
+
+    assert asyncio.run(run()) == [3, 2]
+
+
+def test_batch_is_stored_with_one_bulk_write_and_only_matching_vectors_are_indexed():
+    articles = FakeArticles([article(1, "kept"), article(2, "edited")])
+    index = FakeIndex()
+    nlp = FakeNLP()
+    worker = EmbeddingWorker(articles, nlp, index=index)
+    batch = [(1, article_text(articles.articles[1])), (2, article_text(articles.articles[2])), (3, "deleted\nbody")]
+    # Article 2 was edited after it was queued, article 3 deleted
+    articles.articles[2]["content_hash"] = content_digest("edited again\nbody")
+
+    asyncio.run(worker.process_batch(batch))
+
+    assert len(nlp.calls) == 1 and len(articles.bulk_writes) == 1
+    assert len(articles.bulk_writes[0]) == 3
+    assert articles.articles[1]["searchable"] is True and articles.articles[2]["searchable"] is False
+    [(ids, vectors)] = index.added
+    assert ids == ["1"] and np.allclose(vectors, [[1, 0, 0, 0]])
+
+
+def test_requeue_pending_queues_unsearchable_articles():
+    pending = article(1, "pending")
+    done = {**article(2, "done"), "searchable": True}
+
+    async def run():
+        worker = EmbeddingWorker(FakeArticles([pending, done]), FakeNLP())
+        worker._queue = asyncio.Queue()
+        worker.start = lambda: None
+        count = await worker.requeue_pending()
+        return count, worker._queue.get_nowait(), worker._queue.empty()
+
+    assert asyncio.run(run()) == (1, (1, article_text(pending)), True)
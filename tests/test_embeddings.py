@@ -0,0 +1,97 @@
+import threading
+
+import numpy as np
+
+from app.services.embeddings import (
+    EmbeddingCache, EmbeddingStore, content_hash, decode_embedding, decode_embeddings, encode_embedding, l2_normalize
+)
+
+
+def test_l2_normalize_makes_dot_product_cosine():
+    vectors = l2_normalize(np.array([[3.0, 4.0], [0.0, 0.0]]))
+    assert np.allclose(vectors[0], [0.6, 0.8])
+    assert np.allclose(vectors[1], [0.0, 0.0])
+
+
+def test_content_hash_depends_on_model():
+    assert content_hash("hello", "a") == content_hash("hello", "a")
+    assert content_hash("hello", "a") != content_hash("hello", "b")
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    vector = np.ones(4, dtype=np.float32)  # 16 bytes
+    cache = EmbeddingCache(max_bytes=32)
+    cache.put_many(["a", "b"], np.stack([vector, vector]))
+    cache.get_many(["a"])
+    cache.put_many(["c"], np.stack([vector]))
+
+    a, b, c = cache.get_many(["a", "b", "c"])
+    assert a is not None and b is None and c is not None
+    assert cache.current_bytes <= 32
+
+
+def test_store_persists_float16_rows(tmp_path):
+    path = tmp_path / "cache.f16"
+    vectors = l2_normalize(np.random.default_rng(0).normal(size=(5, 8)))
+    store = EmbeddingStore(path, dim=8, initial_capacity=2)
+    store.put_many([f"k{i}" for i in range(5)], vectors)
+    store.flush()
+
+    reopened = EmbeddingStore(path, dim=8)
+    assert len(reopened) == 5
+    assert np.allclose(reopened.get("k3"), vectors[3], atol=1e-3)
+
+    cache = EmbeddingCache(max_bytes=1024, store=reopened)
+    assert cache.get_many(["k4"])[0] is not None
+    assert cache.stats()["hits"] == 1
+
+
+def test_encode_embedding_round_trips():
+    vector = l2_normalize(np.random.default_rng(1).normal(size=384))
+
+    half = encode_embedding(vector, "float16")
+    assert len(half) == 8 + 384 * 2
+    assert np.allclose(decode_embedding(half), vector, atol=1e-3)
+
+    quantized = encode_embedding(vector, "int8")
+    assert len(quantized) == 8 + 384
+    assert abs(float(decode_embedding(quantized) @ vector) - 1.0) < 1e-3
+
+    assert np.allclose(decode_embedding(vector.tolist()), vector)
+
+
+def test_decode_embeddings_batches_blobs_and_legacy_lists():
+    vectors = l2_normalize(np.random.default_rng(2).normal(size=(4, 16)))
+    blobs = [encode_embedding(v, "int8") for v in vectors]
+    assert np.allclose(decode_embeddings(blobs), vectors, atol=1e-2)
+
+    mixed = [encode_embedding(vectors[0]), vectors[1].tolist()]
+    assert decode_embeddings(mixed).shape == (2, 16)
+
+
+def test_store_reads_stay_consistent_while_it_grows(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = l2_normalize(rng.normal(size=(400, 8)))
+    store = EmbeddingStore(tmp_path / "cache.f16", dim=8, initial_capacity=1)
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            for i in range(0, 400, 7):
+                try:
+                    vector = store.get(f"k{i}")
+                    if vector is not None and not np.allclose(vector, vectors[i], atol=1e-3):
+                        errors.append(i)
+                except Exception as exc:
+                    errors.append(exc)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for start in range(0, 400, 3):
+        store.put_many([f"k{i}" for i in range(start, min(start + 3, 400))], vectors[start:start + 3])
+    done.set()
+    reader.join()
+
+    assert errors == []
+    assert len(EmbeddingStore(tmp_path / "cache.f16", dim=8)) == 400
@@ -0,0 +1,62 @@
+import asyncio
+import io
+import json
+import zipfile
+from datetime import datetime
+
+from app.services import exports
+from app.services.exports import content_disposition, export_filename, iter_ndjson, iter_text_export, iter_zip
+
+
+def make_doc(i, content):
+    return {
+        "_id": f"id{i}",
+        "title": f"Report {i}",
+        "created_at": datetime(2024, 1, 2, 3, 4, 5),
+        "summary": "Short.",
+        "tags": ["a", "b"],
+        "content": content,
+    }
+
+
+async def as_stream(items):
+    for item in items:
+        yield item
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def test_text_export_is_chunked(monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_CHUNK_CHARS", 4)
+    chunks = list(iter_text_export(make_doc(1, ""), "abcdefghij"))
+    assert chunks[1:] == [b"abcd", b"efgh", b"ij"]
+    text = b"".join(chunks).decode()
+    assert text.startswith("Document: Report 1\nCreated: 2024-01-02 03:04:05\n")
+    assert "TAGS: a, b\n" in text and text.endswith("ORIGINAL CONTENT:\nabcdefghij")
+
+
+def test_zip_is_streamed_per_member_and_readable():
+    docs = [make_doc(i, f"content {i} " * 1000) for i in range(3)]
+    chunks = asyncio.run(collect(iter_zip(as_stream(docs))))
+    assert len(chunks) == 4  # one per member, then the central directory
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["Report 0_id0.txt", "Report 1_id1.txt", "Report 2_id2.txt"]
+        assert archive.read("Report 2_id2.txt").decode().endswith("content 2 " * 1000)
+        assert archive.getinfo("Report 0_id0.txt").date_time == (2024, 1, 2, 3, 4, 4)
+
+
+def test_ndjson_has_one_record_per_line():
+    lines = asyncio.run(collect(iter_ndjson(as_stream([{"id": "1", "title": "Été"}, {"id": "2", "title": "b"}]))))
+    assert [json.loads(line) for line in lines] == [{"id": "1", "title": "Été"}, {"id": "2", "title": "b"}]
+    assert all(line.endswith(b"\n") for line in lines)
+
+
+def test_filenames_are_safe_for_headers():
+    assert export_filename('a/b:"c"', ".txt") == "a_b_c.txt"
+    assert export_filename("", ".txt") == "document.txt"
+    header = content_disposition("Résumé.txt")
+    assert header == "attachment; filename=\"R_sum_.txt\"; filename*=UTF-8''R%C3%A9sum%C3%A9.txt"
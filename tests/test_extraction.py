@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from app.services.extraction import count_blocks, extract_pdf, extract_text_sync, iter_blocks, pdf_page_count
+
+pytest.importorskip("PyPDF2")
+
+
+def write_pdf(path, pages):
+    """Minimal uncompressed PDF with one line of text per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % (len(objects))
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def test_parallel_pdf_extraction_keeps_page_order(tmp_path):
+    path = tmp_path / "doc.pdf"
+    write_pdf(path, [f"Page number {i}" for i in range(7)])
+    assert pdf_page_count(str(path)) == 7
+
+    serial = extract_text_sync(str(path), "pdf")
+    parallel = asyncio.run(extract_pdf(str(path), pages_per_task=2))
+    assert parallel == serial
+    assert [line.strip() for line in parallel.splitlines()] == [f"Page number {i}" for i in range(7)]
+
+
+def test_blocks_are_yielded_lazily_per_page_and_paragraph(tmp_path):
+    pdf = tmp_path / "doc.pdf"
+    write_pdf(pdf, ["First", "Second", "Third"])
+    pages = iter_blocks(str(pdf), "pdf")
+    assert next(pages).strip() == "First"
+    assert [page.strip() for page in pages] == ["Second", "Third"]
+    assert count_blocks(str(pdf), "pdf") == 3
+
+    txt = tmp_path / "notes.txt"
+    txt.write_text("one\ntwo\n\nthree\n\n\nfour\n", encoding="utf-8")
+    assert [block.strip() for block in iter_blocks(str(txt), "txt") if block.strip()] == ["one\ntwo", "three", "four"]
+    assert count_blocks(str(txt), "txt") is None
+
+
+def test_stream_blocks_skips_empty_blocks(tmp_path):
+    from app.models.schemas import FileType
+    from app.services.extraction import stream_blocks
+
+    txt = tmp_path / "notes.txt"
+    txt.write_text("\n\nalpha\n\n\n\nbeta\n", encoding="utf-8")
+
+    async def collect():
+        return [block.strip() async for block in stream_blocks(str(txt), FileType.TXT)]
+
+    assert asyncio.run(collect()) == ["alpha", "beta"]
+
+
+def test_long_pdfs_stream_page_ranges_in_order(tmp_path, monkeypatch):
+    from app.models.schemas import FileType
+    from app.services import extraction
+    from app.services.extraction import stream_blocks, stream_pdf_pages
+
+    path = tmp_path / "long.pdf"
+    write_pdf(path, [f"Page number {i}" for i in range(9)])
+
+    async def collect(blocks):
+        return [block.strip() async for block in blocks]
+
+    expected = [f"Page number {i}" for i in range(9)]
+    assert asyncio.run(collect(stream_pdf_pages(str(path), 9, pages_per_task=2))) == expected
+
+    calls = []
+
+    async def parallel_pages(path, page_count):
+        calls.append(page_count)
+        for page in (" ", "parallel"):
+            yield page
+
+    monkeypatch.setattr(extraction, "PARALLEL_PDF_PAGES", 4)
+    monkeypatch.setattr(extraction, "stream_pdf_pages", parallel_pages)
+    assert asyncio.run(collect(stream_blocks(str(path), FileType.PDF, page_count=9))) == ["parallel"]
+    assert asyncio.run(collect(stream_blocks(str(path), FileType.PDF, page_count=3))) == expected
+    assert calls == [9]
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from app.services.indexes import INDEXES, IndexManager, _key
+from app.utils.pagination import sort_spec
+from config.settings import settings
+
+# (sort field, direction) of every document listing, see get_documents
+LISTING_SORTS = [("created_at", -1), ("created_at", 1), ("title", 1), ("file_size", -1)]
+
+
+def test_declared_index_names_are_unique_per_collection():
+    for models in INDEXES.values():
+        names = [model.document["name"] for model in models]
+        assert len(names) == len(set(names))
+
+
+def test_existing_indexes_are_matched_by_name_or_key():
+    manager = IndexManager()
+    existing = {
+        "_id_": {"key": [("_id", 1)]},
+        "user_created_id": {"key": [("user_id", 1), ("created_at", -1), ("_id", -1)]},
+        "legacy_title": {"key": [("user_id", 1), ("title", 1), ("_id", 1)]},
+    }
+    missing = {model.document["name"] for model in manager._missing("documents", existing)}
+    assert missing == {"user_file_size_id", "user_tags", "user_topics", "user_text"}
+
+
+def test_text_indexes_are_matched_by_their_weights():
+    manager = IndexManager()
+    # index_information() as the server reports the baseline articles text index
+    baseline = {
+        "_id_": {"key": [("_id", 1)]},
+        "title_text_content_text": {
+            "key": [("_fts", "text"), ("_ftsx", 1)],
+            "weights": {"title": 1, "content": 1},
+            "default_language": "english",
+            "language_override": "language",
+        },
+        "searchable": {"key": [("searchable", 1)]},
+    }
+    assert manager._missing("articles", baseline) == []
+
+    other_fields = dict(baseline["title_text_content_text"], weights={"title": 1})
+    missing = manager._missing("articles", {"title_only": other_fields})
+    assert [model.document["name"] for model in missing] == ["title_content_text", "searchable"]
+
+
+def test_compound_text_index_keeps_its_prefix_and_weights():
+    declared = next(model for model in INDEXES["documents"] if model.document["name"] == "user_text")
+    reported = {
+        "key": [("user_id", 1), ("_fts", "text"), ("_ftsx", 1)],
+        "weights": declared.document["weights"],
+    }
+    assert _key(reported) == _key(declared.document)
+    assert _key(dict(reported, key=[("_fts", "text"), ("_ftsx", 1)])) != _key(declared.document)
+
+
+def test_listing_sorts_have_an_index_ending_in_id():
+    keys = {tuple(model.document["key"].items()) for model in INDEXES["documents"]}
+    for field, direction in LISTING_SORTS:
+        forward = (("user_id", 1),) + tuple(sort_spec(field, direction))
+        backward = (("user_id", 1),) + tuple((name, -order) for name, order in sort_spec(field, direction))
+        assert forward in keys or backward in keys, field
+
+
+def _stages(plan):
+    yield plan["stage"]
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child:
+            yield from _stages(child)
+
+
+def test_listing_pages_are_read_in_index_order():
+    client = MongoClient(settings.mongo_uri, serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip("MongoDB is not reachable")
+    db = client["instabrief_test_indexes"]
+    try:
+        db.documents.create_indexes(INDEXES["documents"])
+        start = datetime(2024, 1, 1)
+        db.documents.insert_many([
+            {"user_id": f"u{i % 3}", "title": f"t{i}", "file_size": i, "created_at": start + timedelta(minutes=i)}
+            for i in range(300)
+        ])
+        for field, direction in LISTING_SORTS:
+            plan = db.documents.find({"user_id": "u1"}).sort(sort_spec(field, direction)).limit(20) \
+                .explain()["queryPlanner"]["winningPlan"]
+            stages = set(_stages(plan.get("queryPlan", plan)))
+            assert "IXSCAN" in stages and "SORT" not in stages, (field, stages)
+    finally:
+        client.drop_database(db.name)
@@ -0,0 +1,91 @@
+import asyncio
+
+from app.services.jobs import JobRunner, retry_delay
+from config.settings import settings
+
+
+class RecordingQueue:
+    def __init__(self, final):
+        self.final = final
+        self.calls = []
+        self.renewed = True
+        self.completed = True
+
+    async def complete(self, db, job, result=None):
+        self.calls.append(("complete", result))
+        return self.completed
+
+    async def fail(self, db, job, error):
+        self.calls.append(("fail", error))
+        return self.final
+
+    async def renew(self, db, job):
+        return self.renewed
+
+
+def test_retry_delay_doubles_per_attempt():
+    assert [retry_delay(attempts, 10.0) for attempts in (1, 2, 3)] == [10.0, 20.0, 40.0]
+
+
+def test_runner_completes_successful_jobs():
+    queue = RecordingQueue(final=False)
+    runner = JobRunner(queue, workers=1)
+
+    async def handler(job):
+        return {"id": job["payload"]["document_id"]}
+
+    runner.register("process", handler)
+    asyncio.run(runner.run({"_id": 1, "kind": "process", "attempts": 1, "payload": {"document_id": "d1"}}))
+    assert queue.calls == [("complete", {"id": "d1"})]
+
+
+def test_failure_handler_runs_only_after_the_last_attempt():
+    failed = []
+
+    async def handler(job):
+        raise RuntimeError("model unavailable")
+
+    async def on_failure(job):
+        failed.append(job["_id"])
+
+    for final in (False, True):
+        queue = RecordingQueue(final=final)
+        runner = JobRunner(queue, workers=1)
+        runner.register("process", handler, on_failure=on_failure)
+        asyncio.run(runner.run({"_id": final, "kind": "process", "attempts": 1, "payload": {}}))
+        assert queue.calls == [("fail", "model unavailable")]
+    assert failed == [True]
+
+
+def test_handler_is_cancelled_when_the_lease_is_lost(monkeypatch):
+    monkeypatch.setattr(settings, "job_lease_seconds", 0.03)
+    queue = RecordingQueue(final=False)
+    queue.renewed = False
+    runner = JobRunner(queue, workers=1)
+    cancelled = []
+
+    async def handler(job):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(job["_id"])
+            raise
+
+    runner.register("process", handler)
+    asyncio.run(asyncio.wait_for(runner.run({"_id": 1, "kind": "process", "attempts": 1, "payload": {}}), 5))
+    assert cancelled == [1]
+    assert queue.calls == []
+
+
+def test_result_of_a_job_taken_over_is_dropped(caplog):
+    queue = RecordingQueue(final=False)
+    queue.completed = False
+    runner = JobRunner(queue, workers=1)
+
+    async def handler(job):
+        return "late"
+
+    runner.register("process", handler)
+    asyncio.run(runner.run({"_id": 2, "kind": "process", "attempts": 1, "payload": {}}))
+    assert queue.calls == [("complete", "late")]
+    assert "took it over" in caplog.text
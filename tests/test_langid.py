@@ -0,0 +1,34 @@
+import pytest
+
+from app.services.langid import get_language_identifier, ngram_keys
+
+
+SAMPLES = {
+    "en": "The meeting has been moved to next week because several people are travelling.",
+    "es": "La reunión se ha trasladado a la próxima semana porque varias personas están de viaje.",
+    "fr": "La réunion a été reportée à la semaine prochaine car plusieurs personnes sont en voyage.",
+    "de": "Das Treffen wurde auf nächste Woche verschoben, weil mehrere Leute unterwegs sind.",
+    "it": "La riunione è stata spostata alla prossima settimana perché diverse persone sono in viaggio.",
+    "pt": "A reunião foi adiada para a próxima semana porque várias pessoas estão viajando.",
+    "ru": "Встреча перенесена на следующую неделю, потому что несколько человек в командировке.",
+    "ja": "何人かが出張中のため、会議は来週に延期されました。",
+    "ko": "여러 사람이 출장 중이어서 회의가 다음 주로 연기되었습니다.",
+    "zh": "由于有几个人在出差，会议被推迟到下周。",
+}
+
+
+@pytest.mark.parametrize("language,text", SAMPLES.items())
+def test_classifies_supported_languages(language, text):
+    detected, confidence = get_language_identifier().classify(text)
+    assert detected == language
+    assert 0.5 < confidence <= 1.0
+
+
+def test_no_letters_returns_default_with_zero_confidence():
+    assert get_language_identifier().classify("12345 !!!") == ("en", 0.0)
+
+
+def test_ngram_keys_distinguish_orders():
+    keys = ngram_keys(" ab ")
+    assert len(keys) == 4 + 3 + 2
+    assert len(set(keys.tolist())) == 3 + 3 + 2  # the leading and trailing space unigrams coincide
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+pytest.importorskip("motor")
+
+from app.services import library_search  # noqa: E402
+from app.services.library_search import library_search_filter, search_body, search_terms, text_search  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+class FakeElasticsearch:
+    def __init__(self, ids):
+        self.ids = ids
+        self.bodies = []
+
+    async def search(self, index, body):
+        self.bodies.append(body)
+        return {"hits": {"hits": [{"_id": i} for i in self.ids[:body["size"]]]}}
+
+
+def use_elasticsearch(monkeypatch, es):
+    async def get_elasticsearch():
+        return es
+    monkeypatch.setattr(library_search, "get_elasticsearch", get_elasticsearch)
+
+
+def test_text_operators_are_neutralised():
+    assert search_terms('"exact phrase" -excluded a.*b (x|y)') == ["exact", "phrase", "excluded", "a.*b", "(x|y)"]
+    assert text_search('-"quoted"') == {"$text": {"$search": "quoted"}}
+    assert search_terms(' " -- " ') == []
+
+
+def test_search_is_scoped_to_the_user():
+    body = search_body("u1", "budget report", "pdf", 50)
+    assert body["size"] == 50 and body["_source"] is False
+    assert body["query"]["bool"]["filter"] == [{"term": {"user_id": "u1"}}, {"term": {"file_type": "pdf"}}]
+    match = body["query"]["bool"]["must"][0]["multi_match"]
+    assert match["query"] == "budget report" and match["type"] == "bool_prefix"
+
+
+def test_elasticsearch_hits_become_an_id_filter(monkeypatch):
+    document_id = ObjectId()
+    es = FakeElasticsearch([str(document_id), "not-an-object-id"])
+    use_elasticsearch(monkeypatch, es)
+
+    query, truncated = asyncio.run(library_search_filter("u1", "report"))
+    assert query == {"_id": {"$in": [document_id]}} and not truncated
+    assert es.bodies[0]["query"]["bool"]["filter"] == [{"term": {"user_id": "u1"}}]
+
+
+def test_hits_beyond_the_limit_are_flagged(monkeypatch):
+    ids = [ObjectId() for _ in range(4)]
+    use_elasticsearch(monkeypatch, FakeElasticsearch([str(i) for i in ids]))
+    monkeypatch.setattr(settings, "library_search_max_hits", 3)
+    assert asyncio.run(library_search_filter("u1", "report")) == ({"_id": {"$in": ids[:3]}}, True)
+
+    monkeypatch.setattr(settings, "library_search_max_hits", 4)
+    assert asyncio.run(library_search_filter("u1", "report")) == ({"_id": {"$in": ids}}, False)
+
+
+def test_text_index_is_used_without_elasticsearch(monkeypatch):
+    use_elasticsearch(monkeypatch, None)
+    assert asyncio.run(library_search_filter("u1", "report.*")) == ({"$text": {"$search": "report.*"}}, False)
+    assert asyncio.run(library_search_filter("u1", '""')) == (None, False)
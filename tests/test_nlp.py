@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("spacy")
+pytest.importorskip("sentence_transformers")
+
+from app.services.compute import BULK, INTERACTIVE, compute_manager  # noqa: E402
+from app.services import nlp as nlp_module  # noqa: E402
+from app.services.nlp import NLPService, nlp_service  # noqa: E402
+
+
+def test_pool_views_share_one_set_of_models():
+    bulk = nlp_service.with_pool(BULK)
+    assert bulk.models is nlp_service.models
+    assert bulk.topic_models is nlp_service.topic_models
+    assert bulk.executor is compute_manager.executor(BULK)
+    assert nlp_service.executor is compute_manager.executor(INTERACTIVE)
+
+    # Loading through one view makes the models visible to the other
+    nlp_service.models.initialized = True
+    try:
+        assert bulk.initialized
+    finally:
+        nlp_service.models.initialized = False
+
+
+def test_separate_services_do_not_share_models():
+    assert NLPService().models is not nlp_service.models
+
+
+def test_concurrent_keyword_extractions_do_not_mix(monkeypatch):
+    monkeypatch.setattr(nlp_module.nltk, "sent_tokenize", lambda text: text.split("|"))
+    service = NLPService()
+    service.models.initialized = True
+    texts = [f"{word} {word} harbour|{word} lighthouse|{word} tide pool" for word in
+             ("anchor", "compass", "trawler", "mooring", "buoy", "rudder", "keel", "sail")] * 8
+
+    expected = [service._keywords_sync(text, 3) for text in texts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(service._keywords_sync, texts, [3] * len(texts)))
+    assert results == expected
+    assert all(text.split()[0] == keywords[0]["word"] for text, keywords in zip(texts, results))
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from app.services.ooxml import W, docx_blocks, iter_text_blocks, pptx_slide_count, pptx_slides
+
+
+def test_docx_includes_tables_in_reading_order(tmp_path):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_paragraph("Introduction")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text, table.cell(0, 1).text = "Region", "Revenue"
+    table.cell(1, 0).text, table.cell(1, 1).text = "North", "42"
+    document.add_paragraph("Conclusion")
+    path = tmp_path / "report.docx"
+    document.save(path)
+
+    assert list(docx_blocks(str(path))) == ["Introduction", "Region\tRevenue", "North\t42", "Conclusion"]
+
+
+def test_runs_breaks_and_fallback_content():
+    xml = (
+        f'<w:document xmlns:w="{W[1:-1]}" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+        '<w:p><w:pPr><w:tabs><w:tab w:val="left"/></w:tabs></w:pPr>'
+        '<w:r><w:t>Hello</w:t><w:tab/><w:t>world</w:t><w:br/><w:t>again</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t>Box:</w:t></w:r><mc:AlternateContent>'
+        '<mc:Choice><w:r><w:txbxContent><w:p><w:r><w:t>inside</w:t></w:r></w:p></w:txbxContent></w:r></mc:Choice>'
+        '<mc:Fallback><w:r><w:txbxContent><w:p><w:r><w:t>inside</w:t></w:r></w:p></w:txbxContent></w:r></mc:Fallback>'
+        '</mc:AlternateContent></w:p>'
+        '<w:p/></w:body></w:document>'
+    )
+    blocks = list(iter_text_blocks(io.BytesIO(xml.encode()), W))
+    assert blocks == ["Hello\tworld\nagain", "Box:\ninside"]
+
+
+def test_pptx_slides_include_groups_tables_and_notes(tmp_path):
+    pptx = pytest.importorskip("pptx")
+    from pptx.util import Inches
+
+    presentation = pptx.Presentation()
+    layout = presentation.slide_layouts[5]
+
+    first = presentation.slides.add_slide(layout)
+    first.shapes.title.text = "Quarterly results"
+    group = first.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(2), Inches(3), Inches(1)).text_frame.text = "Grouped note"
+    first.notes_slide.notes_text_frame.text = "Mention the new office"
+
+    second = presentation.slides.add_slide(layout)
+    second.shapes.title.text = "Breakdown"
+    table = second.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+    table.cell(0, 0).text, table.cell(0, 1).text = "Q1", "Q2"
+    table.cell(1, 0).text, table.cell(1, 1).text = "10", "12"
+
+    path = tmp_path / "deck.pptx"
+    presentation.save(path)
+
+    assert pptx_slide_count(str(path)) == 2
+    slides = list(pptx_slides(str(path)))
+    assert slides[0] == "Quarterly results\nGrouped note\n\nMention the new office"
+    assert slides[1] == "Breakdown\nQ1\tQ2\n10\t12"
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.utils.pagination import apply_cursor, decode_cursor, encode_cursor, keyset_filter, next_cursor, sort_spec
+
+
+def test_cursor_round_trips_bson_types():
+    created = datetime(2024, 5, 1, 12, 30)
+    object_id = ObjectId()
+    assert decode_cursor(encode_cursor(created, object_id)) == (created, object_id)
+
+
+def test_invalid_cursor_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_filter_descending_includes_ties_and_nulls():
+    object_id = ObjectId()
+    token = encode_cursor(10, object_id)
+    assert keyset_filter("file_size", -1, token) == {"$or": [
+        {"file_size": {"$lt": 10}},
+        {"file_size": 10, "_id": {"$lt": object_id}},
+        {"file_size": None},
+    ]}
+    assert keyset_filter("_id", -1, encode_cursor(None, object_id)) == {"_id": {"$lt": object_id}}
+
+
+def test_apply_cursor_keeps_existing_or():
+    query = {"user_id": "u", "$or": [{"title": "a"}]}
+    token = encode_cursor("b", ObjectId())
+    combined = apply_cursor(query, "title", 1, token)
+    assert combined["$or"] == query["$or"]
+    assert combined["$and"] == [keyset_filter("title", 1, token)]
+    assert apply_cursor(query, "title", 1, None) is query
+
+
+def test_next_cursor_only_for_full_pages():
+    docs = [{"_id": ObjectId(), "title": t} for t in "abc"]
+    assert next_cursor(docs, "title", 4) is None
+    assert decode_cursor(next_cursor(docs, "title", 3)) == ("c", docs[-1]["_id"])
+    assert sort_spec("title", 1) == [("title", 1), ("_id", 1)]
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.compute import BULK
+from app.services.pipeline import Pipeline, Stage
+
+
+def delayed(value, seconds=0.1):
+    async def stage(*args):
+        await asyncio.sleep(seconds)
+        return value
+    return stage
+
+
+async def join(*parts):
+    return "+".join(str(part) for part in parts)
+
+
+def test_independent_stages_overlap():
+    pipeline = Pipeline([
+        Stage("a", delayed("a"), ("text",)),
+        Stage("b", delayed("b"), ("text",)),
+        Stage("c", delayed("c"), ("text",)),
+        Stage("joined", join, ("a", "b", "c")),
+    ])
+    started = time.perf_counter()
+    run = asyncio.run(pipeline.run({"text": "x"}))
+    assert time.perf_counter() - started < 0.25
+    assert run.results["joined"] == "a+b+c"
+    assert set(run.timings) == {"a", "b", "c", "joined"}
+    assert run.timings["a"] >= 0.09
+
+
+def test_skipped_stage_passes_its_default():
+    pipeline = Pipeline([
+        Stage("sentiment", delayed("positive"), ("text",), default="none"),
+        Stage("store", join, ("text", "sentiment"), skippable=False),
+    ])
+    run = asyncio.run(pipeline.run({"text": "x"}, skip=["sentiment"]))
+    assert run.results["store"] == "x+none"
+    assert run.skipped == ["sentiment"] and "sentiment" not in run.timings
+
+    with pytest.raises(ValueError):
+        pipeline.validate_skip(["store"])
+    with pytest.raises(ValueError):
+        pipeline.validate_skip(["unknown"])
+
+
+def test_sync_stage_runs_on_pool():
+    pipeline = Pipeline([Stage("upper", str.upper, ("text",), pool=BULK)])
+    assert asyncio.run(pipeline.run({"text": "abc"})).results["upper"] == "ABC"
+
+
+def test_graph_errors_are_reported():
+    with pytest.raises(ValueError, match="cycle"):
+        Pipeline([Stage("a", join, ("b",)), Stage("b", join, ("a",))])
+    with pytest.raises(KeyError):
+        asyncio.run(Pipeline([Stage("a", join, ("text",))]).run({}))
+
+
+def test_failing_stage_fails_the_run():
+    async def broken(text):
+        raise RuntimeError("model unavailable")
+
+    pipeline = Pipeline([Stage("broken", broken, ("text",)), Stage("slow", delayed("s", 5), ("text",))])
+    started = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        asyncio.run(pipeline.run({"text": "x"}))
+    assert time.perf_counter() - started < 1
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("spacy")
+
+from app.routes import documents  # noqa: E402
+
+ORIGINAL = {
+    "_id": "a",
+    "summary": "Earlier summary.",
+    "algorithm_used": "textrank",
+    "summary_max_length": 150,
+    "compression_ratio": 0.2,
+}
+
+
+class FakeSummarizer:
+    def __init__(self):
+        self.calls = []
+
+    async def initialize(self):
+        pass
+
+    async def generate_summary(self, content, max_length, algorithm):
+        self.calls.append((algorithm, max_length))
+        return {"summary": "Fresh summary.", "algorithm_used": algorithm, "processing_time": 0.1,
+                "compression_ratio": 0.5}
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    fake = FakeSummarizer()
+    monkeypatch.setattr(documents, "job_summarizer", fake)
+    return fake
+
+
+def test_duplicate_reuses_summary_made_with_the_same_settings(summarizer):
+    result = asyncio.run(documents.summary_stage("text", "textrank", 150, None, (ORIGINAL, 0.9)))
+    assert result["summary"] == "Earlier summary." and summarizer.calls == []
+
+
+@pytest.mark.parametrize("algorithm,max_length", [("lsa", 150), ("textrank", 300)])
+def test_duplicate_with_other_settings_is_summarized_again(summarizer, algorithm, max_length):
+    result = asyncio.run(documents.summary_stage("text", algorithm, max_length, None, (ORIGINAL, 0.9)))
+    assert result["summary"] == "Fresh summary."
+    assert summarizer.calls == [(algorithm, max_length)]
+
+
+def test_original_without_recorded_length_is_not_reused(summarizer):
+    legacy = {key: value for key, value in ORIGINAL.items() if key != "summary_max_length"}
+    asyncio.run(documents.summary_stage("text", "textrank", 150, None, (legacy, 0.9)))
+    assert summarizer.calls == [("textrank", 150)]
+
+
+def test_summary_made_at_upload_is_not_summarized_again(summarizer):
+    upload_summary = {"summary": "Upload summary.", "algorithm_used": "lsa", "processing_time": 1.5,
+                      "compression_ratio": 0.1}
+    result = asyncio.run(documents.summary_stage("text", "lsa", 150, upload_summary, (None, None)))
+    assert result == upload_summary and summarizer.calls == []
+
+
+class FakeJobQueue:
+    def __init__(self):
+        self.jobs = []
+
+    async def enqueue(self, db, kind, payload, user_id=None):
+        self.jobs.append((kind, payload, user_id))
+        return "job-1"
+
+
+class FakeIndex:
+    def __init__(self):
+        self.removed = []
+
+    def remove(self, *key):
+        self.removed.append(key)
+
+
+def test_changed_content_is_processed_again_with_the_earlier_settings(monkeypatch):
+    queue, detector, vectors = FakeJobQueue(), FakeIndex(), FakeIndex()
+    monkeypatch.setattr(documents, "job_queue", queue)
+    monkeypatch.setattr(documents.job_runner, "notify", lambda: None)
+    monkeypatch.setattr(documents, "duplicate_detector", detector)
+    monkeypatch.setattr(documents, "document_index", vectors)
+    doc = {"_id": "d1", "user_id": "u1", "algorithm_used": "lsa", "summary_max_length": 80,
+           "skipped_stages": ["sentiment"]}
+
+    assert asyncio.run(documents.reprocess_document(None, doc)) == "job-1"
+
+    assert queue.jobs == [(documents.PROCESS_JOB, {
+        "document_id": "d1", "algorithm": "lsa", "max_length": 80, "skip": ["sentiment"], "upload_summary": None
+    }, "u1")]
+    assert detector.removed == [("u1", "d1")] and vectors.removed == [("d1",)]
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.models.schemas import DocumentListItem
+from app.utils.projection import FULL_PROJECTION, document_projection, parse_fields, serialize_document
+
+
+def _doc():
+    now = datetime(2024, 1, 1)
+    return {
+        "_id": ObjectId(), "title": "Report", "content": "x" * 1000, "summary": "Short",
+        "tags": ["a"], "user_id": "u", "created_at": now, "updated_at": now,
+    }
+
+
+def test_summary_view_projects_out_content():
+    projection = document_projection("summary", None, extra=["file_size"])
+    assert "content" not in projection and projection["title"] == 1 and projection["file_size"] == 1
+    assert isinstance(serialize_document(_doc(), "summary", None), DocumentListItem)
+    assert document_projection("full", None) == FULL_PROJECTION
+
+
+def test_fields_select_exact_keys():
+    fields = parse_fields("title, summary,title")
+    assert fields == ["title", "summary"]
+    assert document_projection("summary", fields, extra=["created_at"]) == {"title": 1, "summary": 1, "created_at": 1}
+    assert set(serialize_document(_doc(), "summary", fields)) == {"id", "title", "summary"}
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError):
+        parse_fields("title,embedding")
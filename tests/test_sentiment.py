@@ -0,0 +1,69 @@
+import nltk
+import pytest
+
+from app.services import sentiment
+from app.services.sentiment import SentimentAnalyzer, decode_sentiment_timeline, encode_sentiment_timeline
+
+
+class FakeVader:
+    """Scores sentences by the marker word they contain"""
+
+    def polarity_scores(self, sentence):
+        if "great" in sentence:
+            return {"pos": 1.0, "neg": 0.0, "neu": 0.0, "compound": 0.8}
+        if "awful" in sentence:
+            return {"pos": 0.0, "neg": 1.0, "neu": 0.0, "compound": -0.6}
+        return {"pos": 0.0, "neg": 0.0, "neu": 1.0, "compound": 0.0}
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(sentiment.nltk, "sent_tokenize", lambda text: text.split("|"))
+    analyzer = SentimentAnalyzer.__new__(SentimentAnalyzer)
+    analyzer._analyzer = FakeVader()
+    return analyzer
+
+
+def test_timeline_round_trips_within_quantization_error():
+    scores = [-1.0, -0.5, 0.0, 0.33, 1.0]
+    data = encode_sentiment_timeline(scores)
+    assert len(data) == len(scores)
+    assert decode_sentiment_timeline(data) == pytest.approx(scores, abs=1 / 127)
+
+
+def test_timeline_clips_out_of_range_scores():
+    assert decode_sentiment_timeline(encode_sentiment_timeline([-3.0, 2.0])) == [-1.0, 1.0]
+    assert decode_sentiment_timeline(encode_sentiment_timeline([])) == []
+
+
+def test_batch_keeps_texts_apart(analyzer):
+    results = analyzer.analyze_batch(["great|awful", "plain", "awful"])
+    assert [result["sentence_scores"] for result in results] == [[0.8, -0.6], [0.0], [-0.6]]
+    assert results[1]["neutral"] == 1.0 and results[2]["compound"] == -0.6
+
+
+def test_aggregate_is_weighted_by_sentence_length(analyzer):
+    short, long = "great", "awful " * 9
+    result = analyzer.analyze_batch([f"{short}|{long}"])[0]
+    expected = (len(short) * 0.8 + len(long) * -0.6) / (len(short) + len(long))
+    assert result["compound"] == pytest.approx(expected)
+    assert result["positive"] + result["negative"] == pytest.approx(1.0)
+
+
+def test_text_without_sentences_is_neutral(analyzer):
+    result = analyzer.analyze_batch([" "])[0]
+    assert result == {"positive": 0.0, "negative": 0.0, "neutral": 1.0, "compound": 0.0, "sentence_scores": []}
+
+
+def test_vader_scores_real_text():
+    for resource in ("sentiment/vader_lexicon.zip", "tokenizers/punkt"):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            pytest.skip(f"NLTK {resource} is not installed")
+    positive, negative = SentimentAnalyzer().analyze_batch([
+        "I love this wonderful product. It works great.",
+        "This is terrible. I hate how awful it is.",
+    ])
+    assert positive["compound"] > 0.5 and negative["compound"] < -0.5
+    assert len(positive["sentence_scores"]) == 2
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+pytest.importorskip("motor")
+pytest.importorskip("spacy")
+
+from app.services.content_store import content_digest  # noqa: E402
+from app.services.embedding_worker import article_text  # noqa: E402
+from app.services.storage import StorageService  # noqa: E402
+
+
+class FakeArticles:
+    """One stored article; records every write and ignores the pipeline's $cond"""
+
+    def __init__(self, article):
+        self.article = article
+        self.writes = []
+
+    async def find_one(self, query, projection=None):
+        return dict(self.article) if query["_id"] == self.article["_id"] else None
+
+    async def find_one_and_update(self, query, pipeline, projection=None, return_document=None):
+        self.writes.append(query)
+        if any(self.article.get(field) != value for field, value in query.items()):
+            return None
+        before = dict(self.article)
+        for field, value in pipeline[0]["$set"].items():
+            if "$literal" in value:
+                self.article[field] = value["$literal"]
+        return before
+
+
+class FakeWorker:
+    def __init__(self):
+        self.queued = []
+
+    def enqueue(self, article_id, text):
+        self.queued.append((article_id, text))
+
+
+def storage_with(article):
+    storage = StorageService.__new__(StorageService)
+    storage.db = type("DB", (), {"articles": FakeArticles(article)})()
+    storage.embedding_worker = FakeWorker()
+    return storage
+
+
+def stored_article():
+    article = {"_id": ObjectId(), "title": "Title", "content": "Body", "tags": []}
+    article["content_hash"] = content_digest(article_text(article))
+    return article
+
+
+def test_tags_only_update_is_one_write_and_is_not_embedded_again():
+    article = stored_article()
+    storage = storage_with(article)
+
+    updated = asyncio.run(storage.update_article(str(article["_id"]), {"tags": ["news"]}))
+
+    assert updated["tags"] == ["news"]
+    assert len(storage.db.articles.writes) == 1
+    assert storage.embedding_worker.queued == []
+
+
+def test_title_only_update_hashes_the_stored_content_in_the_same_write():
+    article = stored_article()
+    old_hash = article["content_hash"]
+    storage = storage_with(article)
+
+    updated = asyncio.run(storage.update_article(str(article["_id"]), {"title": "New title"}))
+
+    expected = content_digest(article_text({"title": "New title", "content": "Body"}))
+    assert storage.db.articles.writes == [{"_id": article["_id"], "content_hash": old_hash}]
+    assert updated["content_hash"] == expected == storage.db.articles.article["content_hash"]
+    assert storage.embedding_worker.queued == [(article["_id"], "New title\nBody")]
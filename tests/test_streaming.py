@@ -0,0 +1,111 @@
+import asyncio
+import re
+import threading
+
+from app.models.schemas import ProcessingStatus
+from app.services.streaming import ChunkedSummarizer, ProgressRegistry, SentenceSegmenter, summarize_blocks
+
+
+def split_sentences(text):
+    return re.findall(r"[^.!?]+[.!?]?", text.strip())
+
+
+async def first_sentence(text, max_length):
+    return split_sentences(text)[0].strip()[:max_length]
+
+
+async def as_stream(blocks):
+    for block in blocks:
+        yield block
+
+
+def test_segmenter_carries_sentence_split_across_blocks():
+    segmenter = SentenceSegmenter(tokenize=split_sentences)
+    assert segmenter.feed("First page ends. The second sentence continues") == ["First page ends."]
+    assert segmenter.feed("on the next page. Done.") == [
+        "The second sentence continues on the next page.", " Done."
+    ]
+    assert segmenter.feed("Trailing words") == []
+    assert segmenter.flush() == ["Trailing words"]
+    assert segmenter.flush() == []
+
+
+def test_chunked_summarizer_reduces_chunk_summaries():
+    calls = []
+
+    async def summarize(text, max_length):
+        calls.append(text)
+        return await first_sentence(text, max_length)
+
+    async def run():
+        chunks = ChunkedSummarizer(summarize, max_length=100, chunk_sentences=2)
+        await chunks.add(["A one.", "A two.", "B one."])
+        assert chunks.summaries == ["A one."]
+        await chunks.add(["B two."])
+        return await chunks.finish(), chunks.summaries
+
+    summary, summaries = asyncio.run(run())
+    assert summaries == ["A one.", "B one."]
+    assert summary == "A one."
+    assert calls == ["A one. A two.", "B one. B two.", "A one. B one."]
+
+
+def test_single_chunk_is_not_summarized_twice():
+    async def run():
+        chunks = ChunkedSummarizer(first_sentence, max_length=100, chunk_sentences=10)
+        await chunks.add(["Only one.", "Short doc."])
+        return await chunks.finish()
+
+    assert asyncio.run(run()) == "Only one."
+
+
+def test_summarize_blocks_tracks_progress():
+    registry = ProgressRegistry(max_entries=1)
+    progress = registry.start("file-1", "user-1", total_blocks=3)
+    blocks = ["Page one is here. It spills", "over. Page two.", "Page three."]
+
+    summary = asyncio.run(summarize_blocks(
+        as_stream(blocks), first_sentence, 100, progress,
+        segmenter=SentenceSegmenter(tokenize=split_sentences), chunk_sentences=2
+    ))
+    assert summary == "Page one is here."
+    assert progress.blocks == 3 and progress.sentences == 4 and progress.chunks == 2
+    assert progress.status == ProcessingStatus.COMPLETED
+    assert progress.as_dict()["percent"] == 100.0
+
+    registry.start("file-2", "user-1")
+    assert registry.get("file-1") is None
+
+
+def test_summarize_blocks_marks_failure():
+    async def broken(text, max_length):
+        raise RuntimeError("model unavailable")
+
+    progress = ProgressRegistry().start("file-1", "user-1")
+    try:
+        asyncio.run(summarize_blocks(
+            as_stream(["One. Two."]), broken, 100, progress,
+            segmenter=SentenceSegmenter(tokenize=split_sentences), chunk_sentences=1
+        ))
+    except RuntimeError:
+        pass
+    assert progress.status == ProcessingStatus.FAILED and progress.error == "model unavailable"
+
+
+def test_summarize_blocks_segments_off_the_event_loop():
+    threads = []
+
+    def tokenize(text):
+        threads.append(threading.get_ident())
+        return split_sentences(text)
+
+    async def run():
+        progress = ProgressRegistry().start("file-1", "user-1")
+        await summarize_blocks(
+            as_stream(["One. Two.", "Three."]), first_sentence, 100, progress,
+            segmenter=SentenceSegmenter(tokenize=tokenize)
+        )
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 2 and loop_thread not in threads
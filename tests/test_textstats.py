@@ -0,0 +1,24 @@
+from app.services.textstats import basic_statistics, count_syllables
+
+
+def test_count_syllables_heuristic():
+    assert count_syllables("cat") == 1
+    assert count_syllables("make") == 1
+    assert count_syllables("table") == 2
+    assert count_syllables("beautiful") == 3
+
+
+def test_basic_statistics_counts_words_and_sentences():
+    stats = basic_statistics("The cat sat on the mat. Wasn't it lovely?! It was")
+    assert stats["word_count"] == 11
+    assert stats["sentence_count"] == 3
+    assert stats["character_count"] == 49
+    assert stats["reading_time_minutes"] == 11 / 200
+    assert stats["flesch_reading_ease"] > 80
+    assert "pos_counts" not in stats
+
+
+def test_basic_statistics_of_empty_text():
+    stats = basic_statistics("")
+    assert stats["word_count"] == stats["sentence_count"] == 0
+    assert stats["flesch_reading_ease"] == 0.0
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from app.services.topics import TopicModelService, UserTopicModel
+from config.settings import settings
+
+SPACE = (
+    "The rocket launched the satellite into orbit while astronauts aboard the station "
+    "watched the planet below and engineers tracked telescope signals from distant galaxies."
+)
+COOKING = (
+    "Simmer the tomatoes with garlic and basil, then bake the bread in the oven and "
+    "season the soup with pepper before serving dinner with fresh cheese and olive oil."
+)
+
+
+@pytest.fixture
+def small_models(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "topic_count", 2)
+    monkeypatch.setattr(settings, "topic_hash_features", 2 ** 12)
+    monkeypatch.setattr(settings, "topic_min_documents", 2)
+    return TopicModelService(model_directory=str(tmp_path))
+
+
+def test_partial_fit_updates_the_model_incrementally():
+    model = UserTopicModel(n_topics=2, n_features=2 ** 12, total_samples=100)
+    assert not model.is_trained
+
+    model.partial_fit(SPACE)
+    first = model.lda.components_.copy()
+    model.partial_fit(COOKING)
+    assert model.documents_seen == 2
+    assert model.lda.components_.shape == (2, 2 ** 12)
+    assert not np.allclose(first, model.lda.components_)
+
+    # Text without any usable word leaves the model untouched
+    model.partial_fit("12 34 !!")
+    assert model.documents_seen == 2
+
+
+def test_topics_are_labelled_with_seen_words():
+    model = UserTopicModel(n_topics=2, n_features=2 ** 12, total_samples=100)
+    for _ in range(5):
+        model.partial_fit(SPACE)
+        model.partial_fit(COOKING)
+    labels = " ".join(model.topic_label(topic_id) for topic_id in range(2)).split()
+    vocabulary = set(SPACE.lower().replace(",", "").replace(".", "").split()) | \
+        set(COOKING.lower().replace(",", "").replace(".", "").split())
+    assert labels and set(labels) <= vocabulary
+    assert model.transform(SPACE).sum() == pytest.approx(1.0)
+
+
+def test_topics_are_assigned_after_min_documents(small_models, tmp_path):
+    assert small_models.assign("u1", SPACE) == []
+    topics = small_models.assign("u1", COOKING)
+    assert topics and all({"topic_id", "label", "weight", "words"} <= set(topic) for topic in topics)
+
+
+def test_learn_false_does_not_train(small_models, tmp_path):
+    small_models.assign("u1", SPACE)
+    small_models.assign("u1", COOKING)
+    seen = small_models._get_model("u1").documents_seen
+
+    assert small_models.assign("u1", SPACE, learn=False)
+    assert small_models._get_model("u1").documents_seen == seen
+
+    assert small_models.assign("u2", SPACE, learn=False) == []
+    assert not (tmp_path / "u2.joblib").exists()
+
+
+def test_users_have_separate_models(small_models):
+    small_models.assign_batch("u1", [SPACE, COOKING, SPACE])
+    assert small_models._get_model("u1").documents_seen == 3
+    assert small_models._get_model("u2").documents_seen == 0
+    assert small_models.list_topics("u2") == []
+    assert len(small_models.list_topics("u1")) == 2
+
+
+def test_models_are_saved_every_few_documents_and_on_flush(small_models, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "topic_save_every", 3)
+    small_models.assign_batch("u1", [SPACE, COOKING])
+    assert not (tmp_path / "u1.joblib").exists()
+
+    small_models.assign("u1", SPACE)
+    assert (tmp_path / "u1.joblib").exists()
+
+    small_models.assign("u2", COOKING)
+    small_models.flush()
+    assert (tmp_path / "u2.joblib").exists()
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_unsaved_models_are_saved_when_evicted(small_models, tmp_path):
+    small_models.cache_size = 1
+    small_models.assign("u1", SPACE)
+    small_models.assign("u2", COOKING)
+    assert (tmp_path / "u1.joblib").exists() and not (tmp_path / "u2.joblib").exists()
+
+
+def test_models_are_reloaded_from_disk(small_models, tmp_path):
+    small_models.assign_batch("u1", [SPACE, COOKING])
+    small_models.flush()
+    reloaded = TopicModelService(model_directory=str(tmp_path))
+    assert reloaded._get_model("u1").documents_seen == 2
+    assert [topic["label"] for topic in reloaded.list_topics("u1")] == \
+        [topic["label"] for topic in small_models.list_topics("u1")]
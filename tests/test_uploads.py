@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.services import uploads  # noqa: E402
+from app.services.uploads import StoredUpload, UploadStore, UploadTooLarge, stream_upload  # noqa: E402
+
+
+class FakeUpload:
+    def __init__(self, payload):
+        self._data = io.BytesIO(payload)
+
+    async def read(self, size=-1):
+        return self._data.read(size)
+
+
+async def as_stream(blocks):
+    for block in blocks:
+        yield block
+
+
+def test_adopt_keeps_one_copy_per_content_hash(tmp_path):
+    store = UploadStore(tmp_path)
+    first = tmp_path / "a.upload"
+    second = tmp_path / "b.upload"
+    first.write_bytes(b"same bytes")
+    second.write_bytes(b"same bytes")
+
+    path = store.adopt(StoredUpload(first, 10, "abc", "text/plain"), ".TXT")
+    assert path == tmp_path / "abc.txt" and path.read_bytes() == b"same bytes"
+    assert store.adopt(StoredUpload(second, 10, "abc", "text/plain"), ".txt") == path
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["abc.txt"]
+
+
+def test_sidecar_is_written_while_blocks_pass_through(tmp_path):
+    store = UploadStore(tmp_path)
+
+    async def run():
+        async with store.write_sidecar("abc") as sidecar:
+            seen = [block async for block in sidecar.tee(as_stream(["page one", "page two"]))]
+        return seen, await store.read_text({"sha256": "abc"})
+
+    seen, text = asyncio.run(run())
+    assert seen == ["page one", "page two"]
+    assert text == "page one\npage two"
+
+
+def test_failed_extraction_leaves_no_sidecar(tmp_path):
+    store = UploadStore(tmp_path)
+
+    async def run():
+        async with store.write_sidecar("abc") as sidecar:
+            async for _ in sidecar.tee(as_stream(["page one"])):
+                raise ValueError("corrupt page")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_upload_hashes_the_payload_as_it_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 1000)
+    monkeypatch.setattr(uploads, "sniff_mime_type", lambda head: "text/plain")
+    payload = bytes(range(256)) * 20
+
+    stored = asyncio.run(stream_upload(FakeUpload(payload), tmp_path / "file.upload", len(payload)))
+
+    assert stored.sha256 == hashlib.sha256(payload).hexdigest()
+    assert stored.size == len(payload) and stored.mime_type == "text/plain"
+    assert [p.name for p in tmp_path.iterdir()] == ["file.upload"]
+    assert stored.path.read_bytes() == payload
+
+
+def test_oversize_upload_raises_and_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 1000)
+
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(stream_upload(FakeUpload(b"x" * 5000), tmp_path / "file.upload", 4500))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,109 @@
+import threading
+
+import numpy as np
+
+from app.services import vector_index
+from app.services.embeddings import l2_normalize
+from app.services.vector_index import VectorIndex, spherical_kmeans
+
+
+def _vectors(count, dim=16, seed=0):
+    return l2_normalize(np.random.default_rng(seed).normal(size=(count, dim))).astype(np.float32)
+
+
+def test_exact_search_returns_nearest_first():
+    vectors = _vectors(50)
+    index = VectorIndex(initial_capacity=8)
+    index.add([str(i) for i in range(50)], vectors)
+
+    hits = index.search(vectors[7], k=3)
+    assert hits[0][0] == "7"
+    assert np.isclose(hits[0][1], 1.0, atol=1e-5)
+    assert hits[0][1] >= hits[1][1] >= hits[2][1]
+
+
+def test_remove_and_replace():
+    vectors = _vectors(10)
+    index = VectorIndex()
+    index.add([str(i) for i in range(10)], vectors)
+
+    assert index.remove("3")
+    assert "3" not in [key for key, _ in index.search(vectors[3], k=10)]
+
+    index.add(["4"], vectors[0])
+    assert len(index) == 9
+    assert [key for key, _ in index.search(vectors[0], k=2)] in (["0", "4"], ["4", "0"])
+
+
+def test_owner_filter():
+    vectors = _vectors(20)
+    index = VectorIndex()
+    index.add([str(i) for i in range(20)], vectors, owners=["a" if i % 2 else "b" for i in range(20)])
+
+    hits = index.search(vectors[4], k=5, owner="a")
+    assert all(int(key) % 2 for key, _ in hits)
+    assert index.search(vectors[4], k=5, owner="nobody") == []
+
+
+def test_ivf_search_finds_exact_neighbours(tmp_path):
+    rng = np.random.default_rng(1)
+    centres = rng.normal(size=(20, 16))
+    vectors = l2_normalize(centres[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(size=(2000, 16)))
+    index = VectorIndex(directory=tmp_path, min_ivf_size=1000, n_probe=8, initial_capacity=64)
+    index.add([str(i) for i in range(2000)], vectors)
+    assert index.is_trained
+
+    recall = []
+    for query in vectors[:50]:
+        exact = {key for key, _ in index.search(query, k=10, exact=True)}
+        approx = {key for key, _ in index.search(query, k=10)}
+        recall.append(len(exact & approx) / 10)
+    assert np.mean(recall) > 0.9
+
+
+def test_update_overwrites_row_in_place_after_training():
+    vectors = _vectors(300, seed=3)
+    index = VectorIndex(min_ivf_size=200, n_probe=4)
+    index.add([str(i) for i in range(300)], vectors)
+    assert index.is_trained
+    size = index._size
+
+    index.add(["5"], vectors[200])
+    assert index._size == size and len(index) == 300
+    hits = index.search(vectors[200], k=2)
+    assert {key for key, _ in hits} == {"5", "200"}
+
+
+def test_index_files_are_private_to_each_index(tmp_path):
+    first, second = VectorIndex(directory=tmp_path), VectorIndex(directory=tmp_path)
+    first.add(["a"], _vectors(1, seed=1))
+    second.add(["a"], _vectors(1, seed=2))
+    assert first.search(_vectors(1, seed=1)[0], k=1)[0][1] > 0.999
+    assert second.search(_vectors(1, seed=2)[0], k=1)[0][1] > 0.999
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_training_runs_outside_the_lock(monkeypatch):
+    vectors = _vectors(400, seed=4)
+    index = VectorIndex(min_ivf_size=300, n_probe=64)
+    index.add([str(i) for i in range(300)], vectors[:300])
+    assert index.is_trained
+    during = {}
+
+    def kmeans_with_traffic(sample, n_clusters):
+        # Another thread searches, overwrites a row and inserts while the quantizer is trained
+        def traffic():
+            during["hits"] = index.search(vectors[0], k=1)
+            index.add(["0", "new"], vectors[[350, 399]])
+        worker = threading.Thread(target=traffic)
+        worker.start()
+        worker.join(timeout=5)
+        during["blocked"] = worker.is_alive()
+        return spherical_kmeans(sample, n_clusters)
+
+    monkeypatch.setattr(vector_index, "spherical_kmeans", kmeans_with_traffic)
+    index.train()
+
+    assert not during["blocked"] and during["hits"][0][0] == "0"
+    assert index.search(vectors[350], k=1)[0][0] == "0"
+    assert index.search(vectors[399], k=1)[0][0] == "new"